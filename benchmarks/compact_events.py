@@ -0,0 +1,59 @@
+"""
+Compares holding the latest quote for a large number of symbols (as a
+conflating :class:`tastytrade.DXLinkStreamer` does) as pydantic
+:class:`tastytrade.dxfeed.Quote` objects and as compact, slotted ones: the
+memory used by the live quotes and the time taken to decode them.
+
+Usage::
+
+    python benchmarks/compact_events.py [symbols]
+"""
+
+import gc
+import random
+import sys
+import tracemalloc
+from time import perf_counter
+
+from tastytrade.dxfeed import Quote, compact_class
+
+
+def quotes(symbols: int) -> list:
+    data = []
+    for i in range(symbols):
+        bid = round(random.uniform(1, 500), 2)
+        data += [f".SPY250117C{i}", 0, 0, 0, 0, "Q", 0, "Q"]
+        data += [bid, round(bid + 0.05, 2), float(random.randint(1, 100)), 10.0]
+    return data
+
+
+def measure(from_stream, data: list) -> tuple[int, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = perf_counter()
+    live = {q.event_symbol: q for q in from_stream(data)}
+    elapsed = perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(live) == len(data) // 12
+    return size, elapsed
+
+
+def main(symbols: int) -> None:
+    data = quotes(symbols)
+    print(f"{symbols:,} live quotes")
+    print(f"{'events':<12}{'MB':>10}{'bytes each':>12}{'decode ms':>12}")
+    for name, from_stream in (
+        ("pydantic", Quote.from_stream),
+        ("compact", compact_class(Quote).from_stream),
+    ):
+        from_stream(data[:12])  # compile the decoder outside the measurement
+        size, elapsed = measure(from_stream, data)
+        print(
+            f"{name:<12}{size / 1e6:>10.1f}{size / symbols:>12.0f}"
+            f"{elapsed * 1000:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]] or [100_000])
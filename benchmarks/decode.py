@@ -0,0 +1,87 @@
+"""
+Measures how fast COMPACT FEED_DATA payloads are turned into events, comparing
+per-event pydantic validation with the compiled decoder used by
+:meth:`tastytrade.dxfeed.Event.from_stream` and with columnar decoding into an
+:class:`tastytrade.dxfeed.EventBatch`.
+
+Usage::
+
+    python benchmarks/decode.py [events per type] [events per frame]
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from pydantic import ValidationError
+
+from tastytrade.dxfeed import EventBatch, Greeks, Quote, TimeAndSale
+
+
+def quote() -> list:
+    bid = round(random.uniform(0.05, 50), 2)
+    row = [f".SPY250117C{random.randint(400, 700)}", 0, 0, 0, 1736899200000]
+    return row + ["X", 1736899200000, "X", bid, bid + 0.05, 25.0, "NaN"]
+
+
+def greeks() -> list:
+    row = [f".SPY250117C{random.randint(400, 700)}", 0, 0, 7459930046341890048]
+    return row + [1736899200000, 0] + [random.random() for _ in range(7)]
+
+
+def time_and_sale() -> list:
+    price = round(random.uniform(590, 600), 2)
+    row = ["SPY", 0, 0, 7459930046341890049, 1736899200000, 0, 0, "Q", price]
+    row += [100.0, price - 0.01, price + 0.01, "@", "", "BUY", False, False]
+    return row + [True, "NEW", None, None]
+
+
+ROWS = {Quote: quote, Greeks: greeks, TimeAndSale: time_and_sale}
+
+
+def validate_each(cls, data: list) -> list:
+    """
+    The previous implementation: one dict and one model_validate per event.
+    """
+    objs = []
+    size = len(cls.model_fields)
+    keys = cls.model_fields.keys()
+    for offset in range(0, len(data), size):
+        values = data[offset : offset + size]
+        try:
+            objs.append(cls.model_validate(dict(zip(keys, values))))
+        except ValidationError:
+            pass
+    return objs
+
+
+def rate(decode, cls, frames: list[list], events: int) -> float:
+    decode(cls, frames[0])  # warm up (and compile the decoder)
+    start = perf_counter()
+    for frame in frames:
+        decode(cls, frame)
+    return events / (perf_counter() - start)
+
+
+def main(events: int, per_frame: int) -> None:
+    print(
+        f"{'event':<12}{'validated/s':>14}{'compiled/s':>14}{'speedup':>10}"
+        f"{'columnar/s':>14}{'speedup':>10}"
+    )
+    for cls, make_row in ROWS.items():
+        frames = [
+            [v for _ in range(per_frame) for v in make_row()]
+            for _ in range(events // per_frame)
+        ]
+        before = rate(validate_each, cls, frames, events)
+        after = rate(lambda c, d: c.from_stream(d), cls, frames, events)
+        batched = rate(EventBatch.from_stream, cls, frames, events)
+        print(
+            f"{cls.__name__:<12}{before:>14,.0f}{after:>14,.0f}"
+            f"{after / before:>9.1f}x{batched:>14,.0f}{batched / before:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*args, *[100_000, 50][len(args) :])
@@ -0,0 +1,103 @@
+"""
+Compares the JSON libraries :data:`tastytrade.utils.json_loads` can use on
+payloads shaped like the ones the SDK parses most: FEED_DATA frames from the
+DXLink streamer and a full ``/option-chains/{symbol}`` response.
+
+Usage::
+
+    python benchmarks/json_codec.py [repetitions]
+"""
+
+import json
+import random
+import sys
+from datetime import date, timedelta
+from time import perf_counter
+
+from tastytrade.utils import json_loads
+
+
+def feed_data(events: int) -> bytes:
+    data = []
+    for _ in range(events):
+        data += [f".SPY250117C{random.randint(400, 700)}", 0, 0, 0, 0, 0]
+        data += [random.random() for _ in range(7)]
+    message = {"type": "FEED_DATA", "channel": 3, "data": ["Greeks", data]}
+    return json.dumps(message).encode()
+
+
+def option_chain(expirations: int, strikes: int) -> bytes:
+    items = []
+    for i in range(expirations):
+        expiration = date(2025, 1, 17) + timedelta(weeks=i)
+        for strike in range(400, 400 + strikes):
+            for kind in "CP":
+                symbol = f"SPY   {expiration:%y%m%d}{kind}{strike * 1000:08d}"
+                items.append(
+                    {
+                        "symbol": symbol,
+                        "instrument-type": "Equity Option",
+                        "active": True,
+                        "strike-price": f"{strike}.0",
+                        "root-symbol": "SPY",
+                        "underlying-symbol": "SPY",
+                        "expiration-date": expiration.isoformat(),
+                        "exercise-style": "American",
+                        "shares-per-contract": 100,
+                        "option-type": kind,
+                        "option-chain-type": "Standard",
+                        "expiration-type": "Weekly",
+                        "settlement-type": "PM",
+                        "stops-trading-at": f"{expiration}T21:15:00.000+00:00",
+                        "market-time-instrument-collection": "Equity Option",
+                        "days-to-expiration": 7 * i,
+                        "expires-at": f"{expiration}T21:15:00.000+00:00",
+                        "is-closing-only": False,
+                        "streamer-symbol": f".SPY{expiration:%y%m%d}{kind}{strike}",
+                    }
+                )
+    return json.dumps(
+        {"data": {"items": items}, "context": "/option-chains/SPY"}
+    ).encode()
+
+
+def libraries() -> dict:
+    loaders = {"json": json.loads}
+    try:
+        import orjson  # type: ignore
+
+        loaders["orjson"] = orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec  # type: ignore
+
+        loaders["msgspec"] = msgspec.json.decode
+    except ImportError:
+        pass
+    return loaders
+
+
+def rate(loads, payload: bytes, repetitions: int) -> float:
+    loads(payload)
+    start = perf_counter()
+    for _ in range(repetitions):
+        loads(payload)
+    return repetitions / (perf_counter() - start)
+
+
+def main(repetitions: int) -> None:
+    payloads = {
+        "FEED_DATA x50": (feed_data(50), repetitions * 100),
+        "option chain": (option_chain(40, 200), max(repetitions // 10, 1)),
+    }
+    print(f"tastytrade.utils.json_loads is {json_loads.__module__}.loads")
+    print(f"{'payload':<16}{'size':>10}" + "".join(f"{n:>12}" for n in libraries()))
+    for name, (payload, reps) in payloads.items():
+        rates = [rate(loads, payload, reps) for loads in libraries().values()]
+        row = "".join(f"{r / rates[0]:>11.1f}x" for r in rates)
+        print(f"{name:<16}{len(payload) // 1024:>8}KB{row}")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]] or [100])
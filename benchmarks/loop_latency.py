@@ -0,0 +1,100 @@
+"""
+Measures how responsive the event loop stays while a
+:class:`tastytrade.DXLinkStreamer` handles a synthetic feed of greeks,
+decoding either on the loop itself or in a process pool. A probe coroutine
+sleeps for 1ms at a time and records how late it wakes up, which is the
+latency any other coroutine on the loop (e.g. one placing orders) would see.
+
+Usage::
+
+    python benchmarks/loop_latency.py [events/s] [events per frame] [seconds]
+"""
+
+import asyncio
+import json
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from statistics import quantiles
+from time import perf_counter
+from types import SimpleNamespace
+
+from tastytrade import DXLinkStreamer
+from tastytrade.dxfeed import Greeks
+
+
+def frame(per_frame: int) -> str:
+    data = []
+    for _ in range(per_frame):
+        data += [f".SPY250117C{random.randint(400, 700)}", 0, 0, 0, 0, 0]
+        data += [random.random() for _ in range(7)]
+    return json.dumps({"type": "FEED_DATA", "channel": 3, "data": ["Greeks", data]})
+
+
+async def feed(streamer: DXLinkStreamer, frames: list[str], rate: float) -> None:
+    """
+    Hands frames to the streamer as its websocket reader would, at the given
+    number of frames per second.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for i, raw in enumerate(frames):
+        delay = start + i / rate - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if streamer._decode_executor is not None:
+            await streamer._offload(raw)
+        else:
+            await streamer._map_message(json.loads(raw)["data"])
+
+
+async def consume(streamer: DXLinkStreamer) -> None:
+    async for _ in streamer.listen(Greeks):
+        pass
+
+
+async def probe(lateness: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = perf_counter()
+        await asyncio.sleep(0.001)
+        lateness.append((perf_counter() - start - 0.001) * 1000)
+
+
+async def run(executor, frames: list[str], rate: float) -> list[float]:
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(session, decode_executor=executor)  # type: ignore
+    if executor is not None:
+        # warm up the workers so process startup isn't measured
+        await streamer._offload(frames[0])
+        await streamer._queues["Greeks"].get()
+    lateness: list[float] = []
+    stop = asyncio.Event()
+    consumer = asyncio.create_task(consume(streamer))
+    prober = asyncio.create_task(probe(lateness, stop))
+    await feed(streamer, frames, rate)
+    while not streamer._decoded.empty():
+        await asyncio.sleep(0.01)
+    stop.set()
+    await prober
+    consumer.cancel()
+    if streamer._dispatch_task is not None:
+        streamer._dispatch_task.cancel()
+    return lateness
+
+
+def main(events: float, per_frame: float, seconds: float) -> None:
+    events, per_frame = int(events), int(per_frame)
+    rate = events / per_frame
+    frames = [frame(per_frame) for _ in range(int(rate * seconds))]
+    print(f"{events:,} events/s in frames of {per_frame}, for {seconds}s")
+    print(f"{'decoding':<16}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    with ProcessPoolExecutor() as pool:
+        for name, executor in (("on the loop", None), ("process pool", pool)):
+            lateness = asyncio.run(run(executor, frames, rate))
+            p = quantiles(lateness, n=100)
+            print(f"{name:<16}{p[49]:>10.2f}{p[98]:>10.2f}{max(lateness):>10.2f}")
+
+
+if __name__ == "__main__":
+    args = [float(arg) for arg in sys.argv[1:]]
+    main(*args, *[20_000, 20, 5.0][len(args) :])
@@ -0,0 +1,84 @@
+"""
+Compares getting the streamer symbols of one expiration of a large option
+chain by parsing every :class:`tastytrade.instruments.Option`, as
+:func:`tastytrade.instruments.get_option_chain` does, with loading the chain
+from a :class:`tastytrade.chains.OptionChainStore`.
+
+Usage::
+
+    python benchmarks/option_chain.py [options]
+"""
+
+import sys
+import tempfile
+from collections import defaultdict
+from datetime import date, timedelta
+from time import perf_counter
+
+from tastytrade.chains import OptionChainStore
+from tastytrade.instruments import Option
+
+
+def chain_items(options: int) -> list[dict]:
+    today = date.today()
+    items = []
+    for i in range(options):
+        expiration = today + timedelta(days=i % 100)
+        strike = 1000 + 5 * (i // 200)
+        option_type = "CP"[i // 100 % 2]
+        items.append(
+            {
+                "symbol": f"SPXW  {expiration:%y%m%d}{option_type}{strike:05d}000",
+                "instrument-type": "Equity Option",
+                "active": True,
+                "strike-price": f"{strike}.0",
+                "root-symbol": "SPXW",
+                "underlying-symbol": "SPX",
+                "expiration-date": expiration.isoformat(),
+                "exercise-style": "European",
+                "shares-per-contract": 100,
+                "option-type": option_type,
+                "option-chain-type": "Standard",
+                "expiration-type": "Weekly",
+                "settlement-type": "PM",
+                "stops-trading-at": f"{expiration.isoformat()}T20:15:00.000+00:00",
+                "market-time-instrument-collection": "Cash Settled Equity Option",
+                "days-to-expiration": i % 100,
+                "expires-at": f"{expiration.isoformat()}T20:15:00.000+00:00",
+                "is-closing-only": False,
+                "streamer-symbol": f".SPXW{expiration:%y%m%d}{option_type}{strike}",
+            }
+        )
+    return items
+
+
+def main(options: int) -> None:
+    items = chain_items(options)
+    start = perf_counter()
+    chain = defaultdict(list)
+    for i in items:
+        option = Option(**i)
+        chain[option.expiration_date].append(option)
+    expiration = min(chain)
+    symbols = [o.streamer_symbol for o in chain[expiration]]
+    parsed = perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as path:
+        store = OptionChainStore(path)
+        start = perf_counter()
+        store._save("SPX", items, date.today())
+        saved = perf_counter() - start
+        start = perf_counter()
+        stored = store.load("SPX")
+        assert stored is not None
+        stored_symbols = stored.streamer_symbols(expiration)
+        loaded = perf_counter() - start
+    assert sorted(symbols) == sorted(stored_symbols)
+    print(f"{options:,} options")
+    print(f"parse every Option:     {parsed * 1000:>8.1f} ms")
+    print(f"store (once per day):   {saved * 1000:>8.1f} ms")
+    print(f"load from store:        {loaded * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]] or [20_000])
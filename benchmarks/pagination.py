@@ -0,0 +1,59 @@
+"""
+Compares fetching every page of an account's order history one page at a
+time and concurrently, against a local mock of the API that answers each
+request after a fixed latency.
+
+Usage::
+
+    python benchmarks/pagination.py [pages] [latency_ms]
+"""
+
+import asyncio
+import sys
+from time import perf_counter
+from types import SimpleNamespace
+
+import httpx
+
+from tastytrade.account import _a_get_pages
+
+
+def mock_api(pages: int, latency: float) -> httpx.MockTransport:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["page-offset"])
+        await asyncio.sleep(latency)
+        return httpx.Response(
+            200,
+            json={
+                "data": {"items": [{"id": offset * 50 + i} for i in range(50)]},
+                "pagination": {"page-offset": offset, "total-pages": pages},
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+async def main(pages: int, latency_ms: int) -> None:
+    transport = mock_api(pages, latency_ms / 1000)
+    print(f"{pages} pages, {latency_ms}ms latency")
+    print(f"{'max_concurrency':<18}{'seconds':>10}")
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://api.tastyworks.com"
+    ) as client:
+        session = SimpleNamespace(async_client=client)
+        for max_concurrency in (1, 4, 8, 16):
+            start = perf_counter()
+            items = await _a_get_pages(
+                session,  # type: ignore
+                "/accounts/5WT00000/orders",
+                {"per-page": 50, "page-offset": 0},
+                True,
+                max_concurrency,
+            )
+            elapsed = perf_counter() - start
+            assert [i["id"] for i in items] == list(range(pages * 50))
+            print(f"{max_concurrency:<18}{elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*[int(arg) for arg in sys.argv[1:3]] or [40, 50]))
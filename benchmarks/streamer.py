@@ -0,0 +1,87 @@
+"""
+Drives a :class:`tastytrade.DXLinkStreamer` against a local
+:class:`tastytrade.simulator.DXLinkSimulator` (running in its own process, so
+it doesn't compete with the streamer for the event loop), and reports the
+events received per second, the p50/p99 end-to-end latency (from the
+simulator sending an event to it coming out of ``listen``) and the peak RSS
+of the streamer's process.
+
+Usage::
+
+    python benchmarks/streamer.py [events/s] [symbols] [seconds] [events per frame]
+"""
+
+import asyncio
+import multiprocessing
+import resource
+import sys
+import time
+from datetime import datetime, timedelta
+from multiprocessing.connection import Connection
+from statistics import quantiles
+from types import SimpleNamespace
+
+from tastytrade import DXLinkStreamer
+from tastytrade.dxfeed import Candle, Greeks, Quote, TimeAndSale
+from tastytrade.simulator import DXLinkSimulator
+
+
+def simulate(events_per_second: float, events_per_frame: int, pipe: Connection):
+    async def run():
+        async with DXLinkSimulator(events_per_second, events_per_frame) as simulator:
+            pipe.send((simulator.url, simulator.token))
+            await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+async def measure(url: str, token: str, cls, symbols: list[str], seconds: float):
+    session = SimpleNamespace(dxlink_url=url, streamer_token=token)
+    latencies: list[int] = []
+    async with DXLinkStreamer(session) as streamer:  # type: ignore
+        if cls is Candle:
+            start = datetime.now() - timedelta(days=30)
+            await streamer.subscribe_candle(symbols, "1m", start)
+        else:
+            await streamer.subscribe(cls, symbols)
+        await streamer.get_event(cls)  # wait for the feed to start
+        loop = asyncio.get_running_loop()
+        end = loop.time() + seconds
+        async for event in streamer.listen(cls):
+            latencies.append(int(time.time() * 1000) - event.event_time)
+            if loop.time() >= end:
+                break
+    return latencies
+
+
+def main(
+    events_per_second: float, symbols: float, seconds: float, per_frame: float
+) -> None:
+    tickers = [f".SPY250117C{400 + i}" for i in range(int(symbols))]
+    print(
+        f"{events_per_second:,.0f} events/s over {len(tickers)} symbols, "
+        f"{int(per_frame)} per frame, {seconds}s each"
+    )
+    print(f"{'event':<12}{'received/s':>12}{'p50 ms':>9}{'p99 ms':>9}{'RSS MB':>9}")
+    for cls in (Quote, Greeks, TimeAndSale, Candle):
+        ours, theirs = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=simulate, args=(events_per_second, int(per_frame), theirs)
+        )
+        process.start()
+        try:
+            url, token = ours.recv()
+            latencies = asyncio.run(measure(url, token, cls, tickers, seconds))
+        finally:
+            process.terminate()
+        p = quantiles(latencies, n=100)
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(
+            f"{cls.__name__:<12}{len(latencies) / seconds:>12,.0f}"
+            f"{p[49]:>9.0f}{p[98]:>9.0f}{rss:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    args = [float(arg) for arg in sys.argv[1:]]
+    main(*args, *[20_000, 1000, 5.0, 100][len(args) :])
@@ -11,7 +11,7 @@ from tastytrade import Session
 from tastytrade import DXLinkStreamer
 from tastytrade.dxfeed import Greeks
 from tastytrade.dxfeed import Quote
-from tastytrade.instruments import get_option_chain
+from tastytrade.chains import OptionChainStore
 from tastytrade.utils import get_tasty_monthly, _get_last_day_of_month
 
 # from tortoise import Tortoise, run_async
@@ -36,6 +36,9 @@ password = os.getenv('TASTYTRADE_PASSWORD')
 
 sqlitedb = '../sqlite/db.db'
 
+# Option chains are stored here and only downloaded again when they change
+chain_store = OptionChainStore('../files/chains')
+
 session = Session(username, password)
 
 def get_watchlist_symbols_from_file():
@@ -295,7 +298,7 @@ async def fetch_greeks():
     # clean_file(filename)
     truncate_table('greeks')
 
-    chain = get_option_chain(session, 'TSLA')
+    chain = chain_store.get_chain(session, 'TSLA')
     # exp = get_tasty_monthly()  # 45 DTE expiration!
     # exp = _get_last_day_of_month(date(2025, 2, 18))
     # Collect streamer symbols for all items in chain[exp]
@@ -317,7 +320,7 @@ async def fetch_greeks():
             # filename = f"../files/greeks/{symbol}.json"
             # clean_file(filename)
             
-            chain = get_option_chain(session, symbol)
+            chain = chain_store.get_chain(session, symbol)
             # exp = get_tasty_monthly()  # 45 DTE expiration!
             # exp = _get_last_day_of_month(date(2025, 2, 18))
             # Collect streamer symbols for all items in chain[exp]
@@ -327,12 +330,9 @@ async def fetch_greeks():
             # ]
             # subs_list = ['.TSLA250221C550', '.TSLA250221P355']
             
-            for exp in chain:
+            for exp in chain.expirations():
                 if date_is_within(exp, 20, 70):
-                    subs_list = [
-                        item.streamer_symbol
-                        for item in chain[exp]
-                    ]      
+                    subs_list = chain.streamer_symbols(exp)
                     # print(subs_list)
                     # return
                     async with DXLinkStreamer(session) as streamer:
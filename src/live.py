@@ -41,9 +41,9 @@ class LivePrices:
         calls = [o for o in options if o.option_type == OptionType.CALL]
         self = cls({}, {}, streamer, puts, calls)
 
-        t_listen_greeks = asyncio.create_task(self._update_greeks())
-        t_listen_quotes = asyncio.create_task(self._update_quotes())
-        asyncio.gather(t_listen_greeks, t_listen_quotes)
+        # events for these symbols are handed straight to the callbacks
+        streamer.add_listener(Greeks, streamer_symbols, self._update_greeks)
+        streamer.add_listener(Quote, [symbol] + streamer_symbols, self._update_quotes)
 
         # wait we have quotes and greeks for each option
         while len(self.greeks) != len(options) or len(self.quotes) != len(options):
@@ -51,15 +51,13 @@ class LivePrices:
 
         return self
 
-    async def _update_greeks(self):
-        async for e in self.streamer.listen(Greeks):
-            self.greeks[e.event_symbol] = e
-            # print(e)   
+    def _update_greeks(self, e: Greeks):
+        self.greeks[e.event_symbol] = e
+        # print(e)
 
-    async def _update_quotes(self):
-        async for e in self.streamer.listen(Quote):
-            self.quotes[e.event_symbol] = e
-            # print(e)           
+    def _update_quotes(self, e: Quote):
+        self.quotes[e.event_symbol] = e
+        # print(e)
 
 
 load_dotenv()  # Load environment variables from .env file
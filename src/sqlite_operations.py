@@ -1,6 +1,8 @@
 import sqlite3
 import json
 
+from tastytrade.history import TransactionStore
+
 sqlitedb = '../sqlite/db.db'
 
 def save_greeks_to_sqlite(data):
@@ -77,3 +79,15 @@ def read_greeks_from_db():
 
     # Return the fetched rows
     return rows
+
+def sync_transactions_to_sqlite(session, account):
+    """Fetch the account's new transactions and save them to SQLite."""
+    # Only transactions since the last sync are fetched; they're upserted
+    # into the transactions table and the account's watermark is advanced
+    with TransactionStore(sqlitedb) as store:
+        return store.sync(session, account)
+
+def read_transactions_from_db(account_number):
+    """Read an account's transactions from SQLite database, oldest first."""
+    with TransactionStore(sqlitedb) as store:
+        return list(store.transactions(account_number))
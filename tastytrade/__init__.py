@@ -7,19 +7,25 @@ VAST_URL = "https://vast.tastyworks.com"
 VERSION = "9.6"
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 # ruff: noqa: E402
 
 from .account import Account
 from .session import Session
-from .streamer import AlertStreamer, DXLinkStreamer
+from .streamer import (
+    AlertStreamer,
+    DXLinkStreamer,
+    ReplayStreamer,
+    ShardedDXLinkStreamer,
+)
 from .watchlists import Watchlist
 
 __all__ = [
     "Account",
     "AlertStreamer",
     "DXLinkStreamer",
+    "ReplayStreamer",
     "Session",
+    "ShardedDXLinkStreamer",
     "Watchlist",
 ]
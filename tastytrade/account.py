@@ -1,6 +1,7 @@
+import asyncio
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Literal, Optional, Union
+from typing import Any, AsyncIterator, Iterator, Literal, Optional, Union
 
 import httpx
 from pydantic import BaseModel, model_validator
@@ -24,7 +25,9 @@ from tastytrade.utils import (
     PriceEffect,
     TastytradeError,
     TastytradeJsonDataclass,
+    _gather_or_cancel,
     _set_sign_for,
+    json_loads,
     today_in_new_york,
     validate_response,
 )
@@ -32,6 +35,171 @@ from tastytrade.utils import (
 TT_DATE_FMT = "%Y-%m-%dT%H:%M:%SZ"
 
 
+async def _a_get_page(
+    session: Session, url: str, params: dict[str, Any], offset: int
+) -> dict[str, Any]:
+    response = await session.async_client.get(
+        url, params={**params, "page-offset": offset}
+    )
+    validate_response(response)
+    return json_loads(response.content)
+
+
+async def _a_get_pages(
+    session: Session,
+    url: str,
+    params: dict[str, Any],
+    paginate: bool,
+    max_concurrency: int,
+) -> list[dict[str, Any]]:
+    """
+    Gets the items from a paginated endpoint. The page in `params` is fetched
+    first; when paginating, the number of pages it reports is used to fetch
+    the rest concurrently, and the items are returned in page order. If any
+    page fails, the requests for the others are cancelled.
+    """
+    params = {k: v for k, v in params.items() if v is not None}
+    first = await _a_get_page(session, url, params, params["page-offset"])
+    items = first["data"]["items"]
+    if not paginate:
+        return items
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def get_limited(offset: int) -> dict[str, Any]:
+        async with semaphore:
+            return await _a_get_page(session, url, params, offset)
+
+    offsets = range(params["page-offset"] + 1, first["pagination"]["total-pages"])
+    # gather keeps the pages in order, however they complete
+    for page in await _gather_or_cancel(*(get_limited(o) for o in offsets)):
+        items.extend(page["data"]["items"])
+    return items
+
+
+async def _a_iter_pages(
+    session: Session, url: str, params: dict[str, Any]
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Yields the items on each page of a paginated endpoint, from the page in
+    `params` to the last. The next page is requested while the current one is
+    being consumed, so no more than two pages are held at once.
+    """
+    params = {k: v for k, v in params.items() if v is not None}
+    next_page: Optional[asyncio.Future] = asyncio.ensure_future(
+        _a_get_page(session, url, params, params["page-offset"])
+    )
+    try:
+        while next_page is not None:
+            json = await next_page
+            next_page = None
+            pagination = json["pagination"]
+            if pagination["page-offset"] < pagination["total-pages"] - 1:
+                next_page = asyncio.ensure_future(
+                    _a_get_page(session, url, params, pagination["page-offset"] + 1)
+                )
+            yield json["data"]["items"]
+    finally:
+        # the consumer stopped early
+        if next_page is not None:
+            next_page.cancel()
+
+
+def _iter_pages(
+    session: Session, url: str, params: dict[str, Any]
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Yields the items on each page of a paginated endpoint, from the page in
+    `params` to the last, requesting each page once the previous one has been
+    consumed.
+    """
+    params = {k: v for k, v in params.items() if v is not None}
+    while True:
+        response = session.sync_client.get(url, params=params)
+        validate_response(response)
+        json = json_loads(response.content)
+        yield json["data"]["items"]
+        pagination = json["pagination"]
+        if pagination["page-offset"] >= pagination["total-pages"] - 1:
+            return
+        params["page-offset"] += 1
+
+
+def _history_params(
+    per_page: int,
+    page_offset: int,
+    sort: str,
+    type: Optional[str],
+    types: Optional[list[str]],
+    sub_types: Optional[list[str]],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    instrument_type: Optional[InstrumentType],
+    symbol: Optional[str],
+    underlying_symbol: Optional[str],
+    action: Optional[str],
+    partition_key: Optional[str],
+    futures_symbol: Optional[str],
+    start_at: Optional[datetime],
+    end_at: Optional[datetime],
+) -> dict[str, Any]:
+    """
+    Builds the query parameters for the transaction history endpoint, shared
+    by :meth:`Account.get_history` and its variants.
+    """
+    return {
+        "per-page": per_page,
+        "page-offset": page_offset,
+        "sort": sort,
+        "type": type,
+        "types[]": types,
+        "sub-type[]": sub_types,
+        "start-date": start_date,
+        "end-date": end_date,
+        "instrument-type": instrument_type.value if instrument_type else None,
+        "symbol": symbol,
+        "underlying-symbol": underlying_symbol,
+        "action": action,
+        "partition-key": partition_key,
+        "futures-symbol": futures_symbol,
+        "start-at": start_at,
+        "end-at": end_at,
+    }
+
+
+def _order_history_params(
+    per_page: int,
+    page_offset: int,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    underlying_symbol: Optional[str],
+    statuses: Optional[list[OrderStatus]],
+    futures_symbol: Optional[str],
+    underlying_instrument_type: Optional[InstrumentType],
+    sort: Optional[str],
+    start_at: Optional[datetime],
+    end_at: Optional[datetime],
+) -> dict[str, Any]:
+    """
+    Builds the query parameters for the order history endpoint, shared by
+    :meth:`Account.get_order_history` and its variants.
+    """
+    return {
+        "per-page": per_page,
+        "page-offset": page_offset,
+        "start-date": start_date,
+        "end-date": end_date,
+        "underlying-symbol": underlying_symbol,
+        "status[]": [s.value for s in statuses] if statuses else None,
+        "futures-symbol": futures_symbol,
+        "underlying-instrument-type": underlying_instrument_type.value
+        if underlying_instrument_type
+        else None,
+        "sort": sort,
+        "start-at": start_at,
+        "end-at": end_at,
+    }
+
+
 class EmptyDict(BaseModel):
     class Config:
         extra = "forbid"
@@ -622,7 +790,7 @@ class Account(TastytradeJsonDataclass):
                 },
             )
             validate_response(response)
-            json = response.json()
+            json = json_loads(response.content)
             snapshots.extend(
                 [AccountBalanceSnapshot(**i) for i in json["data"]["items"]]
             )
@@ -685,7 +853,7 @@ class Account(TastytradeJsonDataclass):
                 },
             )
             validate_response(response)
-            json = response.json()
+            json = json_loads(response.content)
             snapshots.extend(
                 [AccountBalanceSnapshot(**i) for i in json["data"]["items"]]
             )
@@ -808,6 +976,7 @@ class Account(TastytradeJsonDataclass):
         futures_symbol: Optional[str] = None,
         start_at: Optional[datetime] = None,
         end_at: Optional[datetime] = None,
+        max_concurrency: int = 8,
     ) -> list[Transaction]:
         """
         Get transaction history of the account.
@@ -834,6 +1003,8 @@ class Account(TastytradeJsonDataclass):
             datetime start range for filtering transactions in full date-time.
         :param end_at:
             datetime end range for filtering transactions in full date-time.
+        :param max_concurrency:
+            the most pages to fetch at once when getting all pages.
         """
         # if a specific page is provided, we just get that page;
         # otherwise, we loop through all pages
@@ -841,48 +1012,33 @@ class Account(TastytradeJsonDataclass):
         if page_offset is None:
             page_offset = 0
             paginate = True
-        params = {
-            "per-page": per_page,
-            "page-offset": page_offset,
-            "sort": sort,
-            "type": type,
-            "types[]": types,
-            "sub-type[]": sub_types,
-            "start-date": start_date,
-            "end-date": end_date,
-            "instrument-type": instrument_type.value if instrument_type else None,
-            "symbol": symbol,
-            "underlying-symbol": underlying_symbol,
-            "action": action,
-            "partition-key": partition_key,
-            "futures-symbol": futures_symbol,
-            "start-at": start_at,
-            "end-at": end_at,
-        }
-        # loop through pages and get all transactions
-        txns = []
-        while True:
-            response = await session.async_client.get(
-                f"/accounts/{self.account_number}/transactions",
-                params={
-                    k: v  # type: ignore
-                    for k, v in params.items()
-                    if v is not None
-                },
-            )
-            validate_response(response)
-            json = response.json()
-            txns.extend([Transaction(**i) for i in json["data"]["items"]])
-            # handle pagination
-            pagination = json["pagination"]
-            if (
-                pagination["page-offset"] >= pagination["total-pages"] - 1
-                or not paginate
-            ):
-                break
-            params["page-offset"] += 1  # type: ignore
-
-        return txns
+        params = _history_params(
+            per_page,
+            page_offset,
+            sort,
+            type,
+            types,
+            sub_types,
+            start_date,
+            end_date,
+            instrument_type,
+            symbol,
+            underlying_symbol,
+            action,
+            partition_key,
+            futures_symbol,
+            start_at,
+            end_at,
+        )
+        # get the first page, then the rest concurrently
+        items = await _a_get_pages(
+            session,
+            f"/accounts/{self.account_number}/transactions",
+            params,
+            paginate,
+            max_concurrency,
+        )
+        return [Transaction(**i) for i in items]
 
     def get_history(
         self,
@@ -936,24 +1092,24 @@ class Account(TastytradeJsonDataclass):
         if page_offset is None:
             page_offset = 0
             paginate = True
-        params = {
-            "per-page": per_page,
-            "page-offset": page_offset,
-            "sort": sort,
-            "type": type,
-            "types[]": types,
-            "sub-type[]": sub_types,
-            "start-date": start_date,
-            "end-date": end_date,
-            "instrument-type": instrument_type.value if instrument_type else None,
-            "symbol": symbol,
-            "underlying-symbol": underlying_symbol,
-            "action": action,
-            "partition-key": partition_key,
-            "futures-symbol": futures_symbol,
-            "start-at": start_at,
-            "end-at": end_at,
-        }
+        params = _history_params(
+            per_page,
+            page_offset,
+            sort,
+            type,
+            types,
+            sub_types,
+            start_date,
+            end_date,
+            instrument_type,
+            symbol,
+            underlying_symbol,
+            action,
+            partition_key,
+            futures_symbol,
+            start_at,
+            end_at,
+        )
         # loop through pages and get all transactions
         txns = []
         while True:
@@ -966,7 +1122,7 @@ class Account(TastytradeJsonDataclass):
                 },
             )
             validate_response(response)
-            json = response.json()
+            json = json_loads(response.content)
             txns.extend([Transaction(**i) for i in json["data"]["items"]])
             # handle pagination
             pagination = json["pagination"]
@@ -979,6 +1135,116 @@ class Account(TastytradeJsonDataclass):
 
         return txns
 
+    async def a_iter_history(
+        self,
+        session: Session,
+        per_page: int = 250,
+        page_offset: int = 0,
+        sort: str = "Desc",
+        type: Optional[str] = None,
+        types: Optional[list[str]] = None,
+        sub_types: Optional[list[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        instrument_type: Optional[InstrumentType] = None,
+        symbol: Optional[str] = None,
+        underlying_symbol: Optional[str] = None,
+        action: Optional[str] = None,
+        partition_key: Optional[str] = None,
+        futures_symbol: Optional[str] = None,
+        start_at: Optional[datetime] = None,
+        end_at: Optional[datetime] = None,
+    ) -> AsyncIterator[Transaction]:
+        """
+        Iterate over the transaction history of the account, fetching one page
+        at a time as the transactions are consumed, so memory use doesn't grow
+        with the length of the history. The next page is fetched while the
+        current one is being processed.
+
+        Example usage::
+
+            async for txn in account.a_iter_history(session, start_date=start):
+                save(txn)
+
+        Takes the same parameters as :meth:`get_history`, except that
+        `page_offset` is the page to start from.
+        """
+        params = _history_params(
+            per_page,
+            page_offset,
+            sort,
+            type,
+            types,
+            sub_types,
+            start_date,
+            end_date,
+            instrument_type,
+            symbol,
+            underlying_symbol,
+            action,
+            partition_key,
+            futures_symbol,
+            start_at,
+            end_at,
+        )
+        async for items in _a_iter_pages(
+            session, f"/accounts/{self.account_number}/transactions", params
+        ):
+            for i in items:
+                yield Transaction(**i)
+
+    def iter_history(
+        self,
+        session: Session,
+        per_page: int = 250,
+        page_offset: int = 0,
+        sort: str = "Desc",
+        type: Optional[str] = None,
+        types: Optional[list[str]] = None,
+        sub_types: Optional[list[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        instrument_type: Optional[InstrumentType] = None,
+        symbol: Optional[str] = None,
+        underlying_symbol: Optional[str] = None,
+        action: Optional[str] = None,
+        partition_key: Optional[str] = None,
+        futures_symbol: Optional[str] = None,
+        start_at: Optional[datetime] = None,
+        end_at: Optional[datetime] = None,
+    ) -> Iterator[Transaction]:
+        """
+        Iterate over the transaction history of the account, fetching one page
+        at a time as the transactions are consumed, so memory use doesn't grow
+        with the length of the history.
+
+        Takes the same parameters as :meth:`get_history`, except that
+        `page_offset` is the page to start from.
+        """
+        params = _history_params(
+            per_page,
+            page_offset,
+            sort,
+            type,
+            types,
+            sub_types,
+            start_date,
+            end_date,
+            instrument_type,
+            symbol,
+            underlying_symbol,
+            action,
+            partition_key,
+            futures_symbol,
+            start_at,
+            end_at,
+        )
+        for items in _iter_pages(
+            session, f"/accounts/{self.account_number}/transactions", params
+        ):
+            for i in items:
+                yield Transaction(**i)
+
     async def a_get_transaction(self, session: Session, id: int) -> Transaction:
         """
         Get a single transaction by ID.
@@ -1317,6 +1583,7 @@ class Account(TastytradeJsonDataclass):
         sort: Optional[str] = None,
         start_at: Optional[datetime] = None,
         end_at: Optional[datetime] = None,
+        max_concurrency: int = 8,
     ) -> list[PlacedOrder]:
         """
         Get order history of the account.
@@ -1337,6 +1604,8 @@ class Account(TastytradeJsonDataclass):
             datetime start range for filtering transactions in full date-time.
         :param end_at:
             datetime end range for filtering transactions in full date-time.
+        :param max_concurrency:
+            the most pages to fetch at once when getting all pages.
         """
         # if a specific page is provided, we just get that page;
         # otherwise, we loop through all pages
@@ -1344,45 +1613,28 @@ class Account(TastytradeJsonDataclass):
         if page_offset is None:
             page_offset = 0
             paginate = True
-        params = {
-            "per-page": per_page,
-            "page-offset": page_offset,
-            "start-date": start_date,
-            "end-date": end_date,
-            "underlying-symbol": underlying_symbol,
-            "status[]": [s.value for s in statuses] if statuses else None,
-            "futures-symbol": futures_symbol,
-            "underlying-instrument-type": underlying_instrument_type.value
-            if underlying_instrument_type
-            else None,
-            "sort": sort,
-            "start-at": start_at,
-            "end-at": end_at,
-        }
-        # loop through pages and get all transactions
-        orders = []
-        while True:
-            response = await session.async_client.get(
-                f"/accounts/{self.account_number}/orders",
-                params={
-                    k: v  # type: ignore
-                    for k, v in params.items()
-                    if v is not None
-                },
-            )
-            validate_response(response)
-            json = response.json()
-            orders.extend([PlacedOrder(**i) for i in json["data"]["items"]])
-            # handle pagination
-            pagination = json["pagination"]
-            if (
-                pagination["page-offset"] >= pagination["total-pages"] - 1
-                or not paginate
-            ):
-                break
-            params["page-offset"] += 1  # type: ignore
-
-        return orders
+        params = _order_history_params(
+            per_page,
+            page_offset,
+            start_date,
+            end_date,
+            underlying_symbol,
+            statuses,
+            futures_symbol,
+            underlying_instrument_type,
+            sort,
+            start_at,
+            end_at,
+        )
+        # get the first page, then the rest concurrently
+        items = await _a_get_pages(
+            session,
+            f"/accounts/{self.account_number}/orders",
+            params,
+            paginate,
+            max_concurrency,
+        )
+        return [PlacedOrder(**i) for i in items]
 
     def get_order_history(
         self,
@@ -1425,21 +1677,19 @@ class Account(TastytradeJsonDataclass):
         if page_offset is None:
             page_offset = 0
             paginate = True
-        params = {
-            "per-page": per_page,
-            "page-offset": page_offset,
-            "start-date": start_date,
-            "end-date": end_date,
-            "underlying-symbol": underlying_symbol,
-            "status[]": [s.value for s in statuses] if statuses else None,
-            "futures-symbol": futures_symbol,
-            "underlying-instrument-type": underlying_instrument_type.value
-            if underlying_instrument_type
-            else None,
-            "sort": sort,
-            "start-at": start_at,
-            "end-at": end_at,
-        }
+        params = _order_history_params(
+            per_page,
+            page_offset,
+            start_date,
+            end_date,
+            underlying_symbol,
+            statuses,
+            futures_symbol,
+            underlying_instrument_type,
+            sort,
+            start_at,
+            end_at,
+        )
         # loop through pages and get all transactions
         orders = []
         while True:
@@ -1452,7 +1702,7 @@ class Account(TastytradeJsonDataclass):
                 },
             )
             validate_response(response)
-            json = response.json()
+            json = json_loads(response.content)
             orders.extend([PlacedOrder(**i) for i in json["data"]["items"]])
             # handle pagination
             pagination = json["pagination"]
@@ -1465,8 +1715,97 @@ class Account(TastytradeJsonDataclass):
 
         return orders
 
+    async def a_iter_order_history(
+        self,
+        session: Session,
+        per_page: int = 50,
+        page_offset: int = 0,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        underlying_symbol: Optional[str] = None,
+        statuses: Optional[list[OrderStatus]] = None,
+        futures_symbol: Optional[str] = None,
+        underlying_instrument_type: Optional[InstrumentType] = None,
+        sort: Optional[str] = None,
+        start_at: Optional[datetime] = None,
+        end_at: Optional[datetime] = None,
+    ) -> AsyncIterator[PlacedOrder]:
+        """
+        Iterate over the order history of the account, fetching one page at a
+        time as the orders are consumed, so memory use doesn't grow with the
+        length of the history. The next page is fetched while the current one
+        is being processed.
+
+        Takes the same parameters as :meth:`get_order_history`, except that
+        `page_offset` is the page to start from.
+        """
+        params = _order_history_params(
+            per_page,
+            page_offset,
+            start_date,
+            end_date,
+            underlying_symbol,
+            statuses,
+            futures_symbol,
+            underlying_instrument_type,
+            sort,
+            start_at,
+            end_at,
+        )
+        async for items in _a_iter_pages(
+            session, f"/accounts/{self.account_number}/orders", params
+        ):
+            for i in items:
+                yield PlacedOrder(**i)
+
+    def iter_order_history(
+        self,
+        session: Session,
+        per_page: int = 50,
+        page_offset: int = 0,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        underlying_symbol: Optional[str] = None,
+        statuses: Optional[list[OrderStatus]] = None,
+        futures_symbol: Optional[str] = None,
+        underlying_instrument_type: Optional[InstrumentType] = None,
+        sort: Optional[str] = None,
+        start_at: Optional[datetime] = None,
+        end_at: Optional[datetime] = None,
+    ) -> Iterator[PlacedOrder]:
+        """
+        Iterate over the order history of the account, fetching one page at a
+        time as the orders are consumed, so memory use doesn't grow with the
+        length of the history.
+
+        Takes the same parameters as :meth:`get_order_history`, except that
+        `page_offset` is the page to start from.
+        """
+        params = _order_history_params(
+            per_page,
+            page_offset,
+            start_date,
+            end_date,
+            underlying_symbol,
+            statuses,
+            futures_symbol,
+            underlying_instrument_type,
+            sort,
+            start_at,
+            end_at,
+        )
+        for items in _iter_pages(
+            session, f"/accounts/{self.account_number}/orders", params
+        ):
+            for i in items:
+                yield PlacedOrder(**i)
+
     async def a_get_complex_order_history(
-        self, session: Session, per_page: int = 50, page_offset: Optional[int] = None
+        self,
+        session: Session,
+        per_page: int = 50,
+        page_offset: Optional[int] = None,
+        max_concurrency: int = 8,
     ) -> list[PlacedComplexOrder]:
         """
         Get order history of the account.
@@ -1475,6 +1814,8 @@ class Account(TastytradeJsonDataclass):
         :param per_page: the number of results to return per page.
         :param page_offset:
             provide a specific page to get; if not provided, get all pages
+        :param max_concurrency:
+            the most pages to fetch at once when getting all pages.
         """
         # if a specific page is provided, we just get that page;
         # otherwise, we loop through all pages
@@ -1483,26 +1824,15 @@ class Account(TastytradeJsonDataclass):
             page_offset = 0
             paginate = True
         params = {"per-page": per_page, "page-offset": page_offset}
-        # loop through pages and get all transactions
-        orders = []
-        while True:
-            response = await session.async_client.get(
-                f"/accounts/{self.account_number}/complex-orders",
-                params={k: v for k, v in params.items() if v is not None},
-            )
-            validate_response(response)
-            json = response.json()
-            orders.extend([PlacedComplexOrder(**i) for i in json["data"]["items"]])
-            # handle pagination
-            pagination = json["pagination"]
-            if (
-                pagination["page-offset"] >= pagination["total-pages"] - 1
-                or not paginate
-            ):
-                break
-            params["page-offset"] += 1  # type: ignore
-
-        return orders
+        # get the first page, then the rest concurrently
+        items = await _a_get_pages(
+            session,
+            f"/accounts/{self.account_number}/complex-orders",
+            params,
+            paginate,
+            max_concurrency,
+        )
+        return [PlacedComplexOrder(**i) for i in items]
 
     def get_complex_order_history(
         self, session: Session, per_page: int = 50, page_offset: Optional[int] = None
@@ -1530,7 +1860,7 @@ class Account(TastytradeJsonDataclass):
                 params={k: v for k, v in params.items() if v is not None},
             )
             validate_response(response)
-            json = response.json()
+            json = json_loads(response.content)
             orders.extend([PlacedComplexOrder(**i) for i in json["data"]["items"]])
             # handle pagination
             pagination = json["pagination"]
@@ -1543,6 +1873,43 @@ class Account(TastytradeJsonDataclass):
 
         return orders
 
+    async def a_iter_complex_order_history(
+        self, session: Session, per_page: int = 50, page_offset: int = 0
+    ) -> AsyncIterator[PlacedComplexOrder]:
+        """
+        Iterate over the complex order history of the account, fetching one
+        page at a time as the orders are consumed. The next page is fetched
+        while the current one is being processed.
+
+        :param session: the session to use for the request.
+        :param per_page: the number of results to fetch per page.
+        :param page_offset: the page to start from.
+        """
+        params = {"per-page": per_page, "page-offset": page_offset}
+        async for items in _a_iter_pages(
+            session, f"/accounts/{self.account_number}/complex-orders", params
+        ):
+            for i in items:
+                yield PlacedComplexOrder(**i)
+
+    def iter_complex_order_history(
+        self, session: Session, per_page: int = 50, page_offset: int = 0
+    ) -> Iterator[PlacedComplexOrder]:
+        """
+        Iterate over the complex order history of the account, fetching one
+        page at a time as the orders are consumed.
+
+        :param session: the session to use for the request.
+        :param per_page: the number of results to fetch per page.
+        :param page_offset: the page to start from.
+        """
+        params = {"per-page": per_page, "page-offset": page_offset}
+        for items in _iter_pages(
+            session, f"/accounts/{self.account_number}/complex-orders", params
+        ):
+            for i in items:
+                yield PlacedComplexOrder(**i)
+
     async def a_place_order(
         self, session: Session, order: NewOrder, dry_run: bool = True
     ) -> PlacedOrderResponse:
@@ -1685,7 +2052,7 @@ class Account(TastytradeJsonDataclass):
                 params=params,
             )
             validate_response(response)
-            chains = response.json()["data"]["items"]
+            chains = json_loads(response.content)["data"]["items"]
             return [OrderChain(**i) for i in chains]
 
     def get_order_chains(
@@ -1723,5 +2090,5 @@ class Account(TastytradeJsonDataclass):
             params=params,
         )
         validate_response(response)
-        chains = response.json()["data"]["items"]
+        chains = json_loads(response.content)["data"]["items"]
         return [OrderChain(**i) for i in chains]
@@ -11,6 +11,7 @@ from tastytrade import BACKTEST_URL
 from tastytrade.session import Session
 from tastytrade.utils import (
     TastytradeError,
+    json_loads,
     validate_response,
 )
 
@@ -185,7 +186,7 @@ class BacktestSession:
         )
         validate_response(response)
         # Token used for backtesting
-        backtest_token = response.json()["token"]
+        backtest_token = json_loads(response.content)["token"]
         headers["Authorization"] = f"Bearer {backtest_token}"
         self.client = httpx.AsyncClient(base_url=BACKTEST_URL, headers=headers)
 
@@ -193,11 +194,11 @@ class BacktestSession:
         json = backtest.model_dump_json(by_alias=True, exclude_none=True)
         response = await self.client.post("/backtests", data=json)  # type: ignore
         validate_response(response)
-        results = BacktestResponse(**response.json())
+        results = BacktestResponse(**json_loads(response.content))
         while results.status != "completed":
             yield results
             await asyncio.sleep(0.5)
             response = await self.client.get(f"/backtests/{results.id}")
             validate_response(response)
-            results = BacktestResponse(**response.json())
+            results = BacktestResponse(**json_loads(response.content))
         yield results
@@ -0,0 +1,258 @@
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import httpx
+
+from tastytrade.utils import (
+    TastytradeError,
+    json_dumps,
+    json_loads,
+    validate_response,
+)
+
+#: how long responses from the reference data endpoints are cached by
+#: default, in seconds, by path prefix
+DEFAULT_TTLS: dict[str, float] = {
+    "/option-chains/": 3600,
+    "/futures-option-chains/": 3600,
+    "/instruments/future-products": 86400,
+    "/instruments/future-option-products": 86400,
+    "/instruments/quantity-decimal-precisions": 86400,
+    "/margin-requirements-public-configuration": 3600,
+}
+
+
+class _Entry:
+    __slots__ = ("content", "expires_at", "etag", "last_modified")
+
+    def __init__(
+        self,
+        content: bytes,
+        expires_at: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        self.content = content
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class ResponseCache:
+    """
+    An opt-in cache for GET requests to endpoints that rarely change, such as
+    option chains and future products. Pass it to a
+    :class:`~tastytrade.session.Session` as `cache` and matching requests
+    are answered locally until their time to live runs out. After that, the
+    request is revalidated with the ``ETag`` or ``Last-Modified`` header the
+    API sent, if any, so unchanged responses aren't downloaded again.
+
+    The least recently used responses are evicted once there are more than
+    `max_entries`, or their total size exceeds `max_bytes`. If a `path` is
+    given, responses are also stored there, one file each, so they survive
+    restarts and can be shared between processes.
+
+    Example usage::
+
+        from tastytrade.cache import ResponseCache
+
+        cache = ResponseCache(path=".tastytrade-cache")
+        session = Session(user, password, cache=cache)
+        chain = get_option_chain(session, "SPY")  # fetched
+        chain = get_option_chain(session, "SPY")  # served locally
+
+    :param ttls:
+        the time to live in seconds for each path prefix to cache; paths
+        matching no prefix aren't cached. Defaults to :data:`DEFAULT_TTLS`.
+    :param max_entries: the most responses to keep
+    :param max_bytes: the most bytes of responses to keep, if limited
+    :param path: a directory to persist responses in
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[dict[str, float]] = None,
+        max_entries: int = 256,
+        max_bytes: Optional[int] = None,
+        path: Union[str, Path, None] = None,
+    ):
+        #: the time to live in seconds for each cached path prefix
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        #: the number of requests answered from the cache
+        self.hits = 0
+        #: the number of requests sent to the API
+        self.misses = 0
+        #: the number of requests the API confirmed were unchanged
+        self.revalidated = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._size = 0
+        self._path = Path(path) if path is not None else None
+        if self._path is not None:
+            self._path.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, url: str, params: Any = None, base_url: str = "") -> Optional[str]:
+        """
+        Returns the cache key for a request, or None if it isn't cached.
+
+        :param url: the path requested
+        :param params: the query parameters of the request
+        :param base_url:
+            the API the request is sent to, so responses from the sandbox and
+            production APIs are kept apart
+        """
+        if self._ttl(url) is None:
+            return None
+        return str(httpx.URL(base_url.rstrip("/") + url, params=params))
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Returns the cached response body for the key, if it hasn't expired.
+
+        :param key: a key from :meth:`key`
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._read(key)
+        if entry is None or entry.expires_at <= time.time():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.content
+
+    def validators(self, key: str) -> dict[str, str]:
+        """
+        Returns the headers to send to revalidate an expired response.
+
+        :param key: a key from :meth:`key`
+        """
+        entry = self._entries.get(key)
+        headers = {}
+        if entry is not None:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, key: str, response: httpx.Response) -> Optional[bytes]:
+        """
+        Caches a response, or renews the cached one if the API says it's
+        unchanged, and returns the response body. Error responses raise a
+        :class:`~tastytrade.utils.TastytradeError` and aren't cached.
+
+        If the cached response was evicted after its validators were sent, so
+        there's nothing to renew, None is returned and the request should be
+        sent again without them.
+
+        :param key: a key from :meth:`key`
+        :param response: the response to the request
+        """
+        expires_at = time.time() + (self._ttl(httpx.URL(key).path) or 0)
+        entry = self._entries.get(key)
+        if response.status_code == 304:
+            if entry is None:
+                headers = response.request.headers
+                if "If-None-Match" in headers or "If-Modified-Since" in headers:
+                    return None
+                raise TastytradeError(
+                    "Unexpected 304 response to an unconditional request!"
+                )
+            self.revalidated += 1
+            entry.expires_at = expires_at
+            self._write(key, entry)
+            return entry.content
+        validate_response(response)
+        entry = _Entry(
+            response.content,
+            expires_at,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+        self._put(key, entry)
+        self._write(key, entry)
+        return entry.content
+
+    def clear(self) -> None:
+        """
+        Removes every cached response, including any stored on disk.
+        """
+        self._entries.clear()
+        self._size = 0
+        if self._path is not None:
+            for file in self._path.glob("*.cache"):
+                file.unlink()
+
+    def _ttl(self, url: str) -> Optional[float]:
+        for prefix, ttl in self.ttls.items():
+            if url.startswith(prefix):
+                return ttl
+        return None
+
+    def _put(self, key: str, entry: _Entry) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old.content)
+        self._entries[key] = entry
+        self._size += len(entry.content)
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._size > self.max_bytes)
+        ):
+            evicted, old = self._entries.popitem(last=False)
+            self._size -= len(old.content)
+            if self._path is not None:
+                self._file(evicted).unlink(missing_ok=True)
+
+    def _file(self, key: str) -> Path:
+        assert self._path is not None
+        return self._path / f"{hashlib.sha1(key.encode()).hexdigest()}.cache"
+
+    def _read(self, key: str) -> Optional[_Entry]:
+        # each file is a line of JSON metadata followed by the response body
+        if self._path is None:
+            return None
+        file = self._file(key)
+        try:
+            header, content = file.read_bytes().split(b"\n", 1)
+            meta = json_loads(header)
+            if meta["key"] != key:
+                return None
+            entry = _Entry(
+                content, meta["expires-at"], meta["etag"], meta["last-modified"]
+            )
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # a corrupt or outdated file is a miss, and is replaced when the
+            # response is stored again
+            file.unlink(missing_ok=True)
+            return None
+        self._put(key, entry)
+        return entry
+
+    def _write(self, key: str, entry: _Entry) -> None:
+        if self._path is None:
+            return
+        header = json_dumps(
+            {
+                "key": key,
+                "expires-at": entry.expires_at,
+                "etag": entry.etag,
+                "last-modified": entry.last_modified,
+            }
+        )
+        # write then rename, so readers never see a partial file
+        file = self._file(key)
+        temp = file.with_suffix(f".{os.getpid()}.tmp")
+        temp.write_bytes(header.encode() + b"\n" + entry.content)
+        temp.replace(file)
@@ -0,0 +1,370 @@
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+
+from tastytrade.dxfeed.batch import EventBatch
+from tastytrade.dxfeed.event import REMOVE_EVENT
+from tastytrade.utils import TastytradeError
+
+#: the columns kept for each candle series, in order
+COLUMNS = ("time", "index", "open", "high", "low", "close", "volume")
+_UNITS = {"s": 1000, "m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+_INTERVAL = re.compile(r"(\d*)([smhdw])")
+
+
+def interval_ms(interval: str) -> int:
+    """
+    Converts a candle interval like '15s', '5m', '1h', '3d' or '1w' into
+    milliseconds. Periods without a fixed duration, like months ('1mo') or
+    years ('1y'), aren't supported.
+
+    :param interval: the interval, as passed to ``subscribe_candle``
+    """
+    match = _INTERVAL.fullmatch(interval)
+    if match is None:
+        raise TastytradeError(
+            f"Can't convert interval {interval} to a fixed duration; only "
+            "seconds, minutes, hours, days and weeks are supported!"
+        )
+    count, unit = match.groups()
+    return int(count or 1) * _UNITS[unit]
+
+
+def parse_candle_symbol(event_symbol: str) -> tuple[str, str]:
+    """
+    Splits a candle event symbol, e.g. 'SPY{=5m,tho=true}', into the ticker
+    and its attributes: the interval, followed by any others, e.g.
+    '5m,tho=true'.
+
+    :param event_symbol: the symbol of a :class:`~tastytrade.dxfeed.Candle`
+    """
+    ticker, _, attributes = event_symbol.partition("{=")
+    return ticker, attributes.rstrip("}")
+
+
+def _attributes(interval: str, extended_trading_hours: bool) -> str:
+    # the same attributes ``subscribe_candle`` subscribes with
+    return interval if extended_trading_hours else f"{interval},tho=true"
+
+
+def _to_ms(value: Union[datetime, int, None]) -> Optional[int]:
+    if isinstance(value, datetime):
+        return int(value.timestamp() * 1000)
+    return value
+
+
+def _float(value: Any) -> float:
+    return np.nan if value is None else float(value)
+
+
+class CandleSeries:
+    """
+    The candles for a single symbol and interval, stored as NumPy columns
+    sorted by time. Candles are deduplicated by their index, so receiving the
+    same candle again (e.g. when resubscribing after a reconnect) updates it
+    instead of adding a copy.
+
+    New candles are buffered and merged into the columns the next time
+    they're read: candles updating existing rows or coming after the last one
+    (the usual case for live data) are written in place, anything else causes
+    a single sort of the whole series.
+    """
+
+    def __init__(self, columns: Optional[dict[str, np.ndarray]] = None):
+        self._size = 0
+        self._columns: dict[str, np.ndarray] = {
+            name: np.empty(0, dtype=np.int64 if name in ("time", "index") else float)
+            for name in COLUMNS
+        }
+        # row of each candle index in the columns
+        self._positions: dict[int, int] = {}
+        # candles not yet merged, by index
+        self._pending: dict[int, tuple] = {}
+        self._removed: set[int] = set()
+        if columns is not None:
+            self._rebuild(list(zip(*(columns[n].tolist() for n in COLUMNS))))
+
+    def __len__(self) -> int:
+        self._merge()
+        return self._size
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        self._merge()
+        return self._columns[column][: self._size]
+
+    def __repr__(self) -> str:
+        return f"CandleSeries(rows={len(self)})"
+
+    @property
+    def columns(self) -> dict[str, np.ndarray]:
+        """
+        The columns of the series, as views of the underlying arrays. They're
+        invalidated by later updates, so copy them if they need to be kept.
+        """
+        self._merge()
+        return {name: values[: self._size] for name, values in self._columns.items()}
+
+    def add(self, candle: Any) -> None:
+        """
+        Adds or updates a candle.
+
+        :param candle: a regular or compact :class:`~tastytrade.dxfeed.Candle`
+        """
+        self._add(
+            candle.event_flags,
+            (
+                candle.time,
+                candle.index,
+                _float(candle.open),
+                _float(candle.high),
+                _float(candle.low),
+                _float(candle.close),
+                _float(candle.volume),
+            ),
+        )
+
+    def _add(self, flags: int, row: tuple) -> None:
+        index = row[1]
+        if flags & REMOVE_EVENT:
+            self._pending.pop(index, None)
+            self._removed.add(index)
+            return
+        self._removed.discard(index)
+        self._pending[index] = row
+
+    def between(
+        self,
+        start: Union[datetime, int, None] = None,
+        end: Union[datetime, int, None] = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Returns the candles with times from `start` (inclusive) to `end`
+        (exclusive), as views of the columns.
+
+        :param start: a datetime or epoch time in milliseconds
+        :param end: a datetime or epoch time in milliseconds
+        """
+        times = self["time"]
+        start_ms, end_ms = _to_ms(start), _to_ms(end)
+        lo = 0 if start_ms is None else int(np.searchsorted(times, start_ms, "left"))
+        hi = len(times) if end_ms is None else int(np.searchsorted(times, end_ms))
+        return {name: values[lo:hi] for name, values in self.columns.items()}
+
+    def resample(self, interval: str) -> "CandleSeries":
+        """
+        Aggregates the candles into a coarser interval, with buckets aligned
+        to the Unix epoch (in UTC): the first open, highest high, lowest low,
+        last close and total volume of the candles in each bucket.
+
+        :param interval: the new interval, e.g. '1h' or '1d'
+        """
+        columns = self.columns
+        if not len(columns["time"]):
+            return CandleSeries()
+        width = interval_ms(interval)
+        buckets = columns["time"] // width * width
+        times, starts = np.unique(buckets, return_index=True)
+        ends = np.append(starts[1:], len(buckets)) - 1
+        return CandleSeries(
+            {
+                "time": times,
+                "index": times << 32,
+                "open": columns["open"][starts],
+                "high": np.fmax.reduceat(columns["high"], starts),
+                "low": np.fmin.reduceat(columns["low"], starts),
+                "close": columns["close"][ends],
+                "volume": np.add.reduceat(np.nan_to_num(columns["volume"]), starts),
+            }
+        )
+
+    def _merge(self) -> None:
+        if self._removed:
+            removed = self._removed & self._positions.keys()
+            self._removed.clear()
+            if removed:
+                rows = [row for row in self._rows() if row[1] not in removed]
+                rows += self._pending.values()
+                self._pending.clear()
+                self._rebuild(rows)
+                return
+        if not self._pending:
+            return
+        new = []
+        for index, row in self._pending.items():
+            position = self._positions.get(index)
+            if position is None:
+                new.append(row)
+            else:
+                for name, value in zip(COLUMNS, row):
+                    self._columns[name][position] = value
+        self._pending.clear()
+        if not new:
+            return
+        new.sort()
+        if self._size and new[0][0] < self._columns["time"][self._size - 1]:
+            self._rebuild(self._rows() + new)
+            return
+        size = self._size + len(new)
+        if size > len(self._columns["time"]):
+            for name, values in self._columns.items():
+                grown = np.empty(max(size, 2 * len(values)), dtype=values.dtype)
+                grown[: self._size] = values[: self._size]
+                self._columns[name] = grown
+        for i, name in enumerate(COLUMNS):
+            self._columns[name][self._size : size] = [row[i] for row in new]
+        for position, row in enumerate(new, self._size):
+            self._positions[row[1]] = position
+        self._size = size
+
+    def _rows(self) -> list[tuple]:
+        return list(zip(*(self._columns[n][: self._size].tolist() for n in COLUMNS)))
+
+    def _rebuild(self, rows: list[tuple]) -> None:
+        # later rows win for duplicate indices; ties in time are kept in order
+        rows = list({row[1]: row for row in rows}.values())
+        rows.sort(key=lambda row: row[0])
+        self._size = len(rows)
+        for i, name in enumerate(COLUMNS):
+            self._columns[name] = np.array(
+                [row[i] for row in rows], dtype=self._columns[name].dtype
+            )
+        self._positions = {row[1]: position for position, row in enumerate(rows)}
+
+
+class CandleStore:
+    """
+    Keeps the candles received by a :class:`~tastytrade.streamer.DXLinkStreamer`
+    as :class:`CandleSeries`, one for each symbol, interval and trading hours
+    (so regular and extended hours candles are kept apart), which can be
+    sliced by time and resampled. Pass it to the streamer as `candle_store`
+    and every :class:`~tastytrade.dxfeed.Candle` it receives is added, while
+    still being delivered to :meth:`~tastytrade.streamer.DXLinkStreamer.listen`
+    (or :meth:`~tastytrade.streamer.DXLinkStreamer.listen_batches`) as usual.
+
+    Example usage::
+
+        from tastytrade import DXLinkStreamer
+        from tastytrade.candles import CandleStore
+
+        store = CandleStore.load("candles.npz")
+        async with DXLinkStreamer(session, candle_store=store) as streamer:
+            await streamer.subscribe_candle(["SPY"], "5m", start_time)
+            ...
+            hourly = store.series("SPY", "5m").resample("1h")
+        store.save("candles.npz")
+    """
+
+    def __init__(self):
+        self._series: dict[tuple[str, str], CandleSeries] = {}
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._series
+
+    def __repr__(self) -> str:
+        return f"CandleStore(series={len(self._series)})"
+
+    def keys(self) -> list[tuple[str, str]]:
+        """
+        Returns the (symbol, attributes) pairs candles have been received
+        for, e.g. ('SPY', '5m,tho=true'); see :func:`parse_candle_symbol`.
+        """
+        return list(self._series)
+
+    def series(
+        self, symbol: str, interval: str, extended_trading_hours: bool = False
+    ) -> CandleSeries:
+        """
+        Returns the candles for a symbol and interval, creating an empty
+        series if none have been received yet.
+
+        :param symbol: the ticker, e.g. 'SPY'
+        :param interval: the interval subscribed to, e.g. '5m'
+        :param extended_trading_hours:
+            whether to get the candles subscribed to with extended trading hours
+        """
+        key = (symbol, _attributes(interval, extended_trading_hours))
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = CandleSeries()
+        return series
+
+    def add(self, candle: Any) -> None:
+        """
+        Adds or updates a candle in the series for its symbol and interval.
+
+        :param candle: a regular or compact :class:`~tastytrade.dxfeed.Candle`
+        """
+        key = parse_candle_symbol(candle.event_symbol)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = CandleSeries()
+        series.add(candle)
+
+    def add_all(self, candles: Iterable[Any]) -> None:
+        """
+        Adds or updates a list of candles.
+
+        :param candles: regular or compact :class:`~tastytrade.dxfeed.Candle` s
+        """
+        for candle in candles:
+            self.add(candle)
+
+    def add_batch(self, batch: EventBatch) -> None:
+        """
+        Adds or updates the candles in a batch, e.g. from
+        :meth:`~tastytrade.streamer.DXLinkStreamer.listen_batches`.
+
+        :param batch: an :class:`~tastytrade.dxfeed.EventBatch` of candles
+        """
+        columns = batch.columns
+        if "time" not in columns or "index" not in columns:
+            raise TastytradeError("Candle batches need the time and index fields!")
+        size = len(batch)
+        missing = np.full(size, np.nan)
+        flags = columns.get("event_flags", np.zeros(size, dtype=np.int64)).tolist()
+        values = [columns.get(name, missing).tolist() for name in COLUMNS]
+        for symbol, row_flags, row in zip(
+            columns["event_symbol"].tolist(), flags, zip(*values)
+        ):
+            key = parse_candle_symbol(symbol)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = CandleSeries()
+            series._add(row_flags, row)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Saves all series to a NumPy ``.npz`` file, one array per column.
+
+        :param path: the file to write
+        """
+        arrays = {
+            f"{symbol}|{attributes}|{name}": values
+            for (symbol, attributes), series in self._series.items()
+            for name, values in series.columns.items()
+        }
+        with open(path, "wb") as file:
+            np.savez(file, **arrays)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CandleStore":
+        """
+        Loads a store saved with :meth:`save`; if the file doesn't exist, an
+        empty store is returned.
+
+        :param path: the file to read
+        """
+        store = cls()
+        if not Path(path).exists():
+            return store
+        with np.load(path) as arrays:
+            columns: dict[tuple[str, str], dict[str, np.ndarray]] = {}
+            for key in arrays.files:
+                symbol, attributes, name = key.rsplit("|", 2)
+                columns.setdefault((symbol, attributes), {})[name] = arrays[key]
+        for key, series_columns in columns.items():
+            store._series[key] = CandleSeries(series_columns)
+        return store
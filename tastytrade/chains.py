@@ -0,0 +1,317 @@
+import shutil
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from tastytrade.instruments import Option, OptionType
+from tastytrade.session import Session
+from tastytrade.utils import json_dumps, json_loads, today_in_new_york
+
+# the arrays stored for each chain; the options are sorted by expiration, then
+# option type and strike, and each one's JSON is kept in `data`, between its
+# offset and the next
+_ARRAYS = ("expiration", "option_type", "strike", "streamer_symbol", "offsets", "data")
+
+
+class StoredOptionChain:
+    """
+    An option chain stored as NumPy columns (expiration, option type, strike
+    and streamer symbol), which can be filtered without creating any
+    :class:`~tastytrade.instruments.Option` objects. Options are only created
+    when they're accessed, from the JSON they were downloaded as.
+
+    Chains are usually loaded from an :class:`OptionChainStore`, in which case
+    the columns are memory-mapped, so loading takes milliseconds no matter how
+    large the chain is. Options which expired since the chain was downloaded
+    are left out.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        fetched: date,
+        arrays: dict[str, np.ndarray],
+        today: Optional[date] = None,
+    ):
+        today = today or fetched
+        #: the underlying symbol of the chain
+        self.symbol = symbol
+        #: the trading day the chain was downloaded
+        self.fetched = fetched
+        self._arrays = arrays
+        self._options: dict[int, Option] = {}
+        # days_to_expiration is as of the day the chain was downloaded
+        self._elapsed = (today - fetched).days
+        self._start = int(np.searchsorted(arrays["expiration"], today.toordinal()))
+
+    def __len__(self) -> int:
+        return len(self._arrays["expiration"]) - self._start
+
+    def __repr__(self) -> str:
+        return f"StoredOptionChain(symbol={self.symbol!r}, options={len(self)})"
+
+    def expirations(self) -> list[date]:
+        """
+        Returns the expiration dates in the chain, in ascending order.
+        """
+        ordinals = np.unique(self._arrays["expiration"][self._start :])
+        return [date.fromordinal(o) for o in ordinals.tolist()]
+
+    def streamer_symbols(
+        self,
+        expiration: Optional[date] = None,
+        option_type: Optional[OptionType] = None,
+        min_strike: Optional[float] = None,
+        max_strike: Optional[float] = None,
+    ) -> list[str]:
+        """
+        Returns the streamer symbols of the matching options, e.g. to
+        subscribe to their quotes or greeks, without creating the options.
+
+        :param expiration: only include options with this expiration
+        :param option_type: only include calls or puts
+        :param min_strike: only include strikes at or above this
+        :param max_strike: only include strikes at or below this
+        """
+        rows = self._rows(expiration, option_type, min_strike, max_strike)
+        return self._arrays["streamer_symbol"][rows].tolist()
+
+    def options(
+        self,
+        expiration: Optional[date] = None,
+        option_type: Optional[OptionType] = None,
+        min_strike: Optional[float] = None,
+        max_strike: Optional[float] = None,
+    ) -> list[Option]:
+        """
+        Returns the matching options, ordered by expiration, option type and
+        strike.
+
+        :param expiration: only include options with this expiration
+        :param option_type: only include calls or puts
+        :param min_strike: only include strikes at or above this
+        :param max_strike: only include strikes at or below this
+        """
+        rows = self._rows(expiration, option_type, min_strike, max_strike)
+        return [self._option(row) for row in rows.tolist()]
+
+    def to_dict(self) -> dict[date, list[Option]]:
+        """
+        Returns the chain in the same format as
+        :func:`~tastytrade.instruments.get_option_chain`, creating every
+        option.
+        """
+        chain: dict[date, list[Option]] = {}
+        for option in self.options():
+            chain.setdefault(option.expiration_date, []).append(option)
+        return chain
+
+    def _rows(
+        self,
+        expiration: Optional[date],
+        option_type: Optional[OptionType],
+        min_strike: Optional[float],
+        max_strike: Optional[float],
+    ) -> np.ndarray:
+        expirations = self._arrays["expiration"]
+        lo, hi = self._start, len(expirations)
+        if expiration is not None:
+            ordinal = expiration.toordinal()
+            lo = max(lo, int(np.searchsorted(expirations, ordinal, "left")))
+            hi = int(np.searchsorted(expirations, ordinal, "right"))
+        rows = np.arange(lo, hi)
+        mask = np.ones(len(rows), dtype=bool)
+        if option_type is not None:
+            mask &= self._arrays["option_type"][lo:hi] == option_type.value
+        strikes = self._arrays["strike"][lo:hi]
+        if min_strike is not None:
+            mask &= strikes >= min_strike
+        if max_strike is not None:
+            mask &= strikes <= max_strike
+        return rows[mask]
+
+    def _option(self, row: int) -> Option:
+        option = self._options.get(row)
+        if option is None:
+            start, end = self._arrays["offsets"][row : row + 2].tolist()
+            option = Option(**json_loads(self._arrays["data"][start:end].tobytes()))
+            option.days_to_expiration -= self._elapsed
+            self._options[row] = option
+        return option
+
+
+def _build_arrays(items: list[dict[str, Any]]) -> dict[str, np.ndarray]:
+    rows = []
+    for item in items:
+        streamer_symbol = item.get("streamer-symbol") or Option(**item).streamer_symbol
+        rows.append(
+            (
+                date.fromisoformat(item["expiration-date"]).toordinal(),
+                item["option-type"],
+                float(item["strike-price"]),
+                streamer_symbol,
+                json_dumps(item).encode(),
+            )
+        )
+    rows.sort(key=lambda row: row[:3])
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(row[4]) for row in rows], out=offsets[1:])
+    return {
+        "expiration": np.array([row[0] for row in rows], dtype=np.int32),
+        "option_type": np.array([row[1] for row in rows], dtype="U1"),
+        "strike": np.array([row[2] for row in rows], dtype=np.float64),
+        "streamer_symbol": np.array([row[3] for row in rows], dtype=str),
+        "offsets": offsets,
+        "data": np.frombuffer(b"".join(row[4] for row in rows), dtype=np.uint8),
+    }
+
+
+def _nested_expirations(data: dict[str, Any]) -> set[str]:
+    return {
+        expiration["expiration-date"]
+        for item in data["items"]
+        for expiration in item["expirations"]
+    }
+
+
+class OptionChainStore:
+    """
+    Keeps option chains on disk, so they're downloaded and parsed at most
+    once per trading day rather than on every call to
+    :func:`~tastytrade.instruments.get_option_chain`. Each chain is stored as
+    a set of NumPy arrays, one directory per symbol and trading day, and
+    returned as a memory-mapped :class:`StoredOptionChain`.
+
+    On a new trading day, a stored chain is checked against the (much
+    smaller) nested chain from the API, and only downloaded again if
+    expirations were listed or delisted; otherwise it's reused, leaving out
+    the options which have expired.
+
+    Example usage::
+
+        from tastytrade.chains import OptionChainStore
+
+        store = OptionChainStore("chains")
+        chain = store.get_chain(session, "SPX")
+        subs = chain.streamer_symbols(chain.expirations()[0])
+
+    :param path: the directory to store chains in
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+
+    def load(
+        self, symbol: str, today: Optional[date] = None
+    ) -> Optional[StoredOptionChain]:
+        """
+        Returns the stored chain for the symbol, however old, or None if
+        there isn't one.
+
+        :param symbol: the underlying symbol
+        :param today: the day to leave out expired options as of
+        """
+        meta = self._meta(symbol)
+        return self._open(symbol, meta, today) if meta is not None else None
+
+    async def a_get_chain(self, session: Session, symbol: str) -> StoredOptionChain:
+        """
+        Returns the chain for the symbol, downloading it if it isn't stored
+        or its expirations have changed.
+
+        :param session: the session to use for the requests.
+        :param symbol: the underlying symbol
+        """
+        today = today_in_new_york()
+        meta = self._meta(symbol)
+        url = f"/option-chains/{symbol.replace('/', '%2F')}"
+        if meta is not None and meta["checked"] != today.isoformat():
+            nested = await session._a_get(f"{url}/nested")
+            self._check(symbol, meta, _nested_expirations(nested), today)
+        if meta is not None and meta["checked"] == today.isoformat():
+            return self._open(symbol, meta, today)
+        data = await session._a_get(url)
+        return self._save(symbol, data["items"], today)
+
+    def get_chain(self, session: Session, symbol: str) -> StoredOptionChain:
+        """
+        Returns the chain for the symbol, downloading it if it isn't stored
+        or its expirations have changed.
+
+        :param session: the session to use for the requests.
+        :param symbol: the underlying symbol
+        """
+        today = today_in_new_york()
+        meta = self._meta(symbol)
+        url = f"/option-chains/{symbol.replace('/', '%2F')}"
+        if meta is not None and meta["checked"] != today.isoformat():
+            nested = session._get(f"{url}/nested")
+            self._check(symbol, meta, _nested_expirations(nested), today)
+        if meta is not None and meta["checked"] == today.isoformat():
+            return self._open(symbol, meta, today)
+        data = session._get(url)
+        return self._save(symbol, data["items"], today)
+
+    def _directory(self, symbol: str) -> Path:
+        return self._path / symbol.replace("/", "_")
+
+    def _meta(self, symbol: str) -> Optional[dict[str, Any]]:
+        try:
+            return json_loads((self._directory(symbol) / "meta.json").read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def _write_meta(self, symbol: str, meta: dict[str, Any]) -> None:
+        # replace the file in one step, so readers never see a partial one
+        file = self._directory(symbol) / "meta.json"
+        temp = file.with_suffix(f".{time.time_ns()}.tmp")
+        temp.write_text(json_dumps(meta))
+        temp.replace(file)
+
+    def _check(
+        self, symbol: str, meta: dict[str, Any], expirations: set[str], today: date
+    ) -> None:
+        stored = {e for e in meta["expirations"] if e >= today.isoformat()}
+        if expirations == stored:
+            meta["checked"] = today.isoformat()
+            self._write_meta(symbol, meta)
+
+    def _open(
+        self, symbol: str, meta: dict[str, Any], today: Optional[date]
+    ) -> StoredOptionChain:
+        version = self._directory(symbol) / meta["version"]
+        arrays = {
+            name: np.load(version / f"{name}.npy", mmap_mode="r") for name in _ARRAYS
+        }
+        fetched = date.fromisoformat(meta["fetched"])
+        return StoredOptionChain(symbol, fetched, arrays, today)
+
+    def _save(
+        self, symbol: str, items: list[dict[str, Any]], today: date
+    ) -> StoredOptionChain:
+        arrays = _build_arrays(items)
+        directory = self._directory(symbol)
+        name = f"{today.isoformat()}.{time.time_ns()}"
+        version = directory / name
+        version.mkdir(parents=True)
+        for key, values in arrays.items():
+            np.save(version / f"{key}.npy", values)
+        expirations = np.unique(arrays["expiration"]).tolist()
+        meta = {
+            "symbol": symbol,
+            "version": name,
+            "fetched": today.isoformat(),
+            "checked": today.isoformat(),
+            "expirations": [date.fromordinal(e).isoformat() for e in expirations],
+        }
+        self._write_meta(symbol, meta)
+        # older versions may still be mapped by other processes, which is
+        # fine since the files stay readable until they're closed
+        for old in directory.iterdir():
+            if old.is_dir() and old.name != name:
+                shutil.rmtree(old, ignore_errors=True)
+        return self._open(symbol, meta, today)
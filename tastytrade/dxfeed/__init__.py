@@ -1,4 +1,6 @@
+from .batch import MISSING_INT, EventBatch
 from .candle import Candle
+from .compact import CompactEvent, compact_class
 from .event import Event
 from .greeks import Greeks
 from .profile import Profile
@@ -10,8 +12,11 @@ from .trade import Trade
 from .underlying import Underlying
 
 __all__ = [
+    "MISSING_INT",
     "Candle",
+    "CompactEvent",
     "Event",
+    "EventBatch",
     "Greeks",
     "Profile",
     "Quote",
@@ -20,4 +25,5 @@ __all__ = [
     "TimeAndSale",
     "Trade",
     "Underlying",
+    "compact_class",
 ]
@@ -0,0 +1,179 @@
+import sys
+from decimal import Decimal
+from typing import Any, Callable, Optional, Sequence, Type, Union, get_args, get_origin
+
+import numpy as np
+
+from tastytrade.utils import TastytradeError
+
+from .event import Event
+
+#: the value integer columns hold where the value is missing or invalid, since
+#: int64 has no NaN and float64 can't hold large integers exactly
+MISSING_INT = np.iinfo(np.int64).min
+
+Column = Callable[[list], Optional[np.ndarray]]
+# compiled column layouts, keyed by event class and the streamed field names
+_LAYOUTS: dict[tuple[type, Optional[tuple[str, ...]]], list[tuple[str, Column]]] = {}
+
+
+def _float(v: Any) -> float:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _floats(values: list) -> np.ndarray:
+    # numpy parses dxfeed's "NaN"/"Infinity" strings and maps None to NaN
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.array([_float(v) for v in values], dtype=np.float64)
+
+
+def _int(v: Any) -> int:
+    if v.__class__ is float and v.is_integer():
+        v = int(v)
+    elif v.__class__ is str:
+        try:
+            v = int(v)
+        except ValueError:
+            return MISSING_INT
+    if v.__class__ is not int or not MISSING_INT < v <= np.iinfo(np.int64).max:
+        return MISSING_INT
+    return v
+
+
+def _ints(values: list) -> np.ndarray:
+    try:
+        return np.array(values, dtype=np.int64)
+    except (TypeError, ValueError, OverflowError):
+        return np.array([_int(v) for v in values], dtype=np.int64)
+
+
+def _bools(values: list) -> np.ndarray:
+    return np.array(values, dtype=np.bool_)
+
+
+def _strings(values: list) -> np.ndarray:
+    interned = [sys.intern(v) if v.__class__ is str else v for v in values]
+    return np.array(interned, dtype=object)
+
+
+def _skip(values: list) -> None:
+    return None
+
+
+def _column_for(annotation: Any) -> Column:
+    """
+    Picks the column type for a field: prices and other decimals become
+    float64 (NaN when missing), integers int64 (:data:`MISSING_INT` when
+    missing), strings object arrays of interned strings.
+    """
+    if get_origin(annotation) is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        annotation = args[0] if len(args) == 1 else object
+    if annotation is Decimal or annotation is float:
+        return _floats
+    if annotation is int:
+        return _ints
+    if annotation is bool:
+        return _bools
+    if annotation is type(None):
+        return _skip
+    return _strings
+
+
+class EventBatch:
+    """
+    A batch of events of a single type, stored column-wise as NumPy arrays
+    instead of one pydantic object per event. Columns are named after the
+    event's fields, e.g. ``batch["bid_price"]``.
+    """
+
+    def __init__(self, event_class: Type[Event], columns: dict[str, np.ndarray]):
+        #: the type of event in the batch
+        self.event_class = event_class
+        #: mapping of field names to arrays of values, one per event
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.columns[field]
+
+    def __repr__(self) -> str:
+        return f"EventBatch({self.event_class.__name__}, rows={len(self)})"
+
+    @classmethod
+    def from_stream(
+        cls,
+        event_class: Type[Event],
+        data: list,
+        fields: Optional[Sequence[str]] = None,
+    ) -> "EventBatch":
+        """
+        Makes a batch directly from a list of raw COMPACT data fetched by a
+        :class:`~tastytrade.streamer.DXLinkStreamer`, without creating any
+        event objects.
+
+        :param event_class: the type of event contained in the data
+        :param data: list of raw event data from the streamer
+        :param fields:
+            the field names present in each event, in order; defaults to
+            :meth:`~tastytrade.dxfeed.Event.stream_fields`
+        """
+        key = (event_class, tuple(fields) if fields is not None else None)
+        layout = _LAYOUTS.get(key)
+        if layout is None:
+            by_alias = {
+                (f.alias or name): (name, f.annotation)
+                for name, f in event_class.model_fields.items()
+            }
+            try:
+                layout = _LAYOUTS[key] = [
+                    (by_alias[field][0], _column_for(by_alias[field][1]))
+                    for field in (fields or event_class.stream_fields())
+                ]
+            except KeyError as e:
+                raise TastytradeError(f"Unknown field {e} for {event_class.__name__}!")
+        size = len(layout)
+        if len(data) % size != 0:
+            raise TastytradeError(
+                "Mapper data input values are not a multiple of the key size!"
+            )
+        columns = {}
+        for i, (name, column) in enumerate(layout):
+            values = column(data[i::size])
+            if values is not None:
+                columns[name] = values
+        return cls(event_class, columns)
+
+    @classmethod
+    def concat(cls, batches: Sequence["EventBatch"]) -> "EventBatch":
+        """
+        Joins batches of the same event type into one.
+
+        :param batches: the batches to join, in order
+        """
+        if len(batches) == 1:
+            return batches[0]
+        columns = {
+            name: np.concatenate([b.columns[name] for b in batches])
+            for name in batches[0].columns
+        }
+        return cls(batches[0].event_class, columns)
+
+    def slice(self, start: int, stop: Optional[int] = None) -> "EventBatch":
+        """
+        Returns the rows from `start` to `stop` as a new batch. The arrays are
+        views, so no data is copied.
+
+        :param start: index of the first row
+        :param stop: index after the last row; defaults to the end of the batch
+        """
+        rows = slice(start, stop)
+        columns = {name: values[rows] for name, values in self.columns.items()}
+        return EventBatch(self.event_class, columns)
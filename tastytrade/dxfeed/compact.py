@@ -0,0 +1,284 @@
+import sys
+from decimal import Decimal
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from tastytrade.utils import TastytradeError
+
+from .candle import Candle
+from .event import NAN_STRINGS, Event
+from .greeks import Greeks
+from .profile import Profile
+from .quote import Quote
+from .summary import Summary
+from .theoprice import TheoPrice
+from .timeandsale import TimeAndSale
+from .trade import Trade
+from .underlying import Underlying
+
+CompactDecoder = Callable[[list], list[Any]]
+# compiled decoders, keyed by compact class and the streamed field names
+_COMPACT_DECODERS: dict[tuple[type, Optional[tuple[str, ...]]], CompactDecoder] = {}
+
+
+class _Skip(Exception):
+    """
+    Raised by a compact decoder for rows pydantic would reject.
+    """
+
+    pass
+
+
+def _to_float(v: Any) -> float:
+    if v is None or v in NAN_STRINGS:
+        raise _Skip
+    return float(v)
+
+
+def _to_int(v: Any) -> int:
+    if v is None or v in NAN_STRINGS or (v.__class__ is float and not v.is_integer()):
+        raise _Skip
+    return int(v)
+
+
+# source templates converting the variable `{v}` in place, for each annotation
+# and whether the field is optional
+_CONVERSIONS = {
+    (Decimal, False): "if {v}.__class__ is not float: {v} = _to_float({v})",
+    (Decimal, True): "{v} = None if {v} is None or {v} in NAN_STRINGS else float({v})",
+    (int, False): "if {v}.__class__ is not int: {v} = _to_int({v})",
+    (int, True): "if {v}.__class__ is not int: "
+    "{v} = None if {v} is None or {v} in NAN_STRINGS else _to_int({v})",
+    (str, False): "if {v}.__class__ is not str or {v} in NAN_STRINGS: raise _Skip\n"
+    "{v} = _intern({v})",
+    (str, True): "{v} = _intern({v}) "
+    "if {v}.__class__ is str and {v} not in NAN_STRINGS else None",
+    (bool, False): "if {v}.__class__ is not bool: raise _Skip",
+    (bool, True): "if {v}.__class__ is not bool and {v} is not None:\n"
+    "    if {v} not in NAN_STRINGS: raise _Skip\n"
+    "    {v} = None",
+    (type(None), False): "{v} = None",
+}
+# conversion for prices which pydantic sets to zero when missing (candles)
+_ZERO_FROM_NONE = (
+    "if {v}.__class__ is not float: "
+    "{v} = 0.0 if {v} is None or {v} in NAN_STRINGS else float({v})"
+)
+
+
+def _field_conversion(v: str, annotation: Any, metadata: list[Any]) -> str:
+    optional = False
+    if get_origin(annotation) is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        optional = True
+        annotation = args[0]
+    if metadata:
+        return _ZERO_FROM_NONE.format(v=v)
+    return _CONVERSIONS[annotation, optional].format(v=v)
+
+
+class CompactEvent:
+    """
+    Base class for lightweight, slotted versions of the dxfeed events, for
+    holding large numbers of live events in memory. Compact events skip
+    pydantic validation entirely: prices and other decimals are stored as
+    floats, strings (including the event symbol) are interned, and fields
+    have the same names as on the full event. Use :meth:`to_event` to get the
+    equivalent pydantic model.
+
+    Compact classes are created for each event type, e.g.
+    ``compact_class(Quote)``, and are produced by
+    :class:`~tastytrade.streamer.DXLinkStreamer` when it's created with
+    `compact_events=True`.
+    """
+
+    __slots__ = ()
+    #: the pydantic event class this is a compact version of
+    event_class: Type[Event] = Event
+    #: the names of the fields, in the order they're streamed
+    fields: tuple[str, ...] = ()
+
+    #: symbol of this event
+    event_symbol: str
+    #: time of this event
+    event_time: int
+
+    if TYPE_CHECKING:
+        # the other fields depend on the event type
+        def __getattr__(self, name: str) -> Any: ...
+
+    def __init__(self, **kwargs: Any):
+        for name in self.fields:
+            object.__setattr__(self, name, kwargs.get(name))
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{n}={getattr(self, n)!r}" for n in self.fields)
+        return f"{self.__class__.__name__}({values})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self.fields)
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, n) for n in self.fields)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.fields, state):
+            object.__setattr__(self, name, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the fields of the event as a dict.
+        """
+        return {n: getattr(self, n) for n in self.fields}
+
+    def to_event(self) -> Event:
+        """
+        Converts the event into the equivalent (validated) pydantic event.
+        """
+        return self.event_class.model_validate(self.to_dict())
+
+    @classmethod
+    def from_event(cls, event: Event) -> "CompactEvent":
+        """
+        Makes a compact event from the equivalent pydantic event.
+
+        :param event: the event to convert
+        """
+        return cls.from_stream([getattr(event, n) for n in cls.fields])[0]
+
+    @classmethod
+    def from_stream(
+        cls, data: list, fields: Optional[Sequence[str]] = None
+    ) -> list[Any]:
+        """
+        Makes a list of compact events from a list of raw COMPACT data fetched
+        by a :class:`~tastytrade.streamer.DXLinkStreamer`. Rows pydantic would
+        reject are skipped, just like with :meth:`Event.from_stream`.
+
+        :param data: list of raw event data from the streamer
+        :param fields:
+            the field names present in each event, in order; defaults to
+            :meth:`~tastytrade.dxfeed.Event.stream_fields`; fields left out
+            are set to None
+        """
+        key = (cls, tuple(fields) if fields is not None else None)
+        decoder = _COMPACT_DECODERS.get(key)
+        if decoder is None:
+            decoder = _COMPACT_DECODERS[key] = cls._compile_decoder(
+                fields if fields is not None else cls.event_class.stream_fields()
+            )
+        return decoder(data)
+
+    @classmethod
+    def _compile_decoder(cls, fields: Sequence[str]) -> CompactDecoder:
+        """
+        Generates a function converting flat COMPACT data into compact events,
+        with each field's conversion inlined from its annotation.
+        """
+        model_fields = cls.event_class.model_fields
+        by_alias = {(f.alias or name): name for name, f in model_fields.items()}
+        try:
+            names = [by_alias[field] for field in fields]
+        except KeyError as e:
+            raise TastytradeError(f"Unknown field {e} for {cls.__name__}!")
+        namespace: dict[str, Any] = {
+            "cls": cls,
+            "NAN_STRINGS": NAN_STRINGS,
+            "TastytradeError": TastytradeError,
+            "_Skip": _Skip,
+            "_intern": sys.intern,
+            "_to_float": _to_float,
+            "_to_int": _to_int,
+        }
+        variables = [f"v{i}" for i in range(len(names))]
+        conversions = [
+            _field_conversion(v, model_fields[n].annotation, model_fields[n].metadata)
+            for v, n in zip(variables, names)
+        ]
+        assignments = [f"obj.{n} = {v}" for n, v in zip(names, variables)]
+        assignments += [f"obj.{n} = None" for n in cls.fields if n not in names]
+        size = len(names)
+        body = "\n".join(
+            [
+                "def decode(data):",
+                f"    if len(data) % {size}:",
+                "        raise TastytradeError(",
+                "            'Mapper data input values are not a multiple of the key size!'",
+                "        )",
+                "    objs = []",
+                "    new = cls.__new__",
+                f"    for row in zip(*[iter(data)] * {size}):",
+                f"        {', '.join(variables)}, = row",
+                "        try:",
+                *[
+                    f"            {line}"
+                    for conversion in conversions
+                    for line in conversion.splitlines()
+                ],
+                "        except (_Skip, TypeError, ValueError):",
+                "            continue",
+                "        obj = new(cls)",
+                *[f"        {line}" for line in assignments],
+                "        objs.append(obj)",
+                "    return objs",
+            ]
+        )
+        exec(body, namespace)
+        return namespace["decode"]
+
+
+def _make_compact(event_class: Type[Event]) -> Type[CompactEvent]:
+    fields = tuple(event_class.model_fields)
+    return type(
+        f"Compact{event_class.__name__}",
+        (CompactEvent,),
+        {
+            "__slots__": fields,
+            "__module__": __name__,
+            "__doc__": f"Compact version of :class:`~tastytrade.dxfeed."
+            f"{event_class.__name__}`.",
+            "event_class": event_class,
+            "fields": fields,
+        },
+    )
+
+
+_COMPACT_CLASSES: dict[Type[Event], Type[CompactEvent]] = {
+    cls: _make_compact(cls)
+    for cls in (
+        Candle,
+        Greeks,
+        Profile,
+        Quote,
+        Summary,
+        TheoPrice,
+        TimeAndSale,
+        Trade,
+        Underlying,
+    )
+}
+# make the classes importable by name, so they can be pickled
+globals().update({cls.__name__: cls for cls in _COMPACT_CLASSES.values()})
+
+
+def compact_class(event_class: Type[Event]) -> Type[CompactEvent]:
+    """
+    Returns the compact version of an event class.
+
+    :param event_class: the pydantic event class, e.g. :class:`Quote`
+    """
+    try:
+        return _COMPACT_CLASSES[event_class]
+    except KeyError:
+        raise TastytradeError(f"No compact version of {event_class.__name__}!")
@@ -1,6 +1,26 @@
-from typing import Any
+from decimal import Decimal
+from math import isfinite
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
-from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    TypeAdapter,
+    ValidationError,
+    create_model,
+    field_validator,
+)
 from pydantic.alias_generators import to_camel
 
 from tastytrade.utils import TastytradeError
@@ -12,6 +32,135 @@ SNAPSHOT_MODE = 0x40
 SNAPSHOT_SNIP = 0x10
 TX_PENDING = 0x1
 
+#: string values sent by dxfeed in place of non-finite numbers
+NAN_STRINGS = frozenset({"NaN", "Infinity", "-Infinity"})
+
+E = TypeVar("E", bound="Event")
+Decoder = Callable[[list], list[Any]]
+# compiled decoders, keyed by event class, streamed field names and partiality
+_DECODERS: dict[tuple[type, Optional[tuple[str, ...]], bool], Decoder] = {}
+# subclasses with some required fields made optional, keyed by class and fields
+_PARTIAL_MODELS: dict[tuple[type, tuple[str, ...]], type] = {}
+# prices repeat constantly, so short floats are cached (up to a limit)
+_DECIMAL_CACHE_SIZE = 1 << 16
+_DECIMALS: dict[float, Decimal] = {}
+
+
+class _SlowPath(Exception):
+    """
+    Raised by a compiled decoder when a value needs full pydantic validation.
+    """
+
+    pass
+
+
+def _to_int(v: Any) -> int:
+    if v.__class__ is float and v.is_integer():
+        return int(v)
+    raise _SlowPath
+
+
+def _to_decimal(v: Any) -> Decimal:
+    if v.__class__ is float:
+        d = _DECIMALS.get(v)
+        if d is None:
+            if not isfinite(v):
+                raise _SlowPath
+            # pydantic converts floats through their string representation
+            s = repr(v)
+            d = Decimal(s)
+            # only cache price-like values; 0.0 == -0.0, so zeros are skipped
+            if len(s) <= 10 and v:
+                if len(_DECIMALS) >= _DECIMAL_CACHE_SIZE:
+                    _DECIMALS.clear()
+                _DECIMALS[v] = d
+        return d
+    if v.__class__ is int:
+        return Decimal(v)
+    raise _SlowPath
+
+
+def _to_none(v: Any) -> None:
+    if v is None or v in NAN_STRINGS:
+        return None
+    raise _SlowPath
+
+
+def _adapted(adapter: TypeAdapter) -> Callable[[Any], Any]:
+    def _convert(v: Any) -> Any:
+        if v in NAN_STRINGS:
+            v = None
+        try:
+            return adapter.validate_python(v)
+        except ValidationError:
+            raise _SlowPath
+
+    return _convert
+
+
+def _partial_model(cls: Type[E], missing: tuple[str, ...]) -> Type[E]:
+    """
+    Returns a subclass of the event class in which the given required fields
+    are optional and default to None, for events streamed without them.
+    """
+    model = _PARTIAL_MODELS.get((cls, missing))
+    if model is None:
+        fields: dict[str, Any] = {
+            name: (Optional[cls.model_fields[name].annotation], None)
+            for name in missing
+        }
+        model = create_model(  # type: ignore
+            cls.__name__, __base__=cls, __module__=cls.__module__, **fields
+        )
+        # the class can't be found by name, so pickle the way to recreate it
+        model.__reduce__ = lambda self: (  # type: ignore
+            _unpickle_partial,
+            (cls, missing, self.__getstate__()),
+        )
+        _PARTIAL_MODELS[(cls, missing)] = model
+    return model  # type: ignore
+
+
+def _unpickle_partial(cls: type, missing: tuple[str, ...], state: Any) -> Any:
+    model = _partial_model(cls, missing)
+    obj = model.__new__(model)
+    obj.__setstate__(state)
+    return obj
+
+
+# source templates converting the variable `{v}` in place
+_CONVERSIONS = {
+    int: "if {v}.__class__ is not int: {v} = _to_int({v})",
+    Decimal: "{v} = _to_decimal({v})",
+    str: "if {v}.__class__ is not str or {v} in NAN_STRINGS: raise _SlowPath",
+    bool: "if {v}.__class__ is not bool: raise _SlowPath",
+    type(None): "{v} = _to_none({v})",
+}
+
+
+def _field_conversion(
+    v: str, annotation: Any, metadata: list[Any], namespace: dict[str, Any]
+) -> str:
+    """
+    Generates the source converting a single model field. Plain scalar types
+    and their optional variants get an inline type check; anything else, e.g.
+    fields with custom validators, is validated by pydantic on its own.
+    """
+    if metadata:
+        annotation = Annotated[(annotation, *metadata)]  # type: ignore
+    elif annotation in _CONVERSIONS:
+        return _CONVERSIONS[annotation].format(v=v)
+    elif get_origin(annotation) is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1 and args[0] in _CONVERSIONS:
+            inner = _CONVERSIONS[args[0]].format(v=v)
+            return "\n".join(
+                [f"if {v} is None or {v} in NAN_STRINGS:", f"    {v} = None", "else:"]
+                + [f"    {line}" for line in inner.splitlines()]
+            )
+    namespace[f"_adapt_{v}"] = _adapted(TypeAdapter(annotation))
+    return f"{v} = _adapt_{v}({v})"
+
 
 class Event(BaseModel):
     """
@@ -28,38 +177,145 @@ class Event(BaseModel):
     @field_validator("*", mode="before")
     @classmethod
     def change_nan_to_none(cls, v: Any) -> Any:
-        if v in {"NaN", "Infinity", "-Infinity"}:
+        if v in NAN_STRINGS:
             return None
         return v
 
     @classmethod
-    def from_stream(cls, data: list) -> list["Event"]:
+    def stream_fields(cls) -> list[str]:
+        """
+        Returns the names of the fields as they're requested from (and sent
+        by) the data streamer, in positional order.
+        """
+        return [f.alias or name for name, f in cls.model_fields.items()]
+
+    @classmethod
+    def from_stream(
+        cls: Type[E],
+        data: list,
+        fields: Optional[Sequence[str]] = None,
+        partial: bool = False,
+    ) -> list[E]:
         """
         Makes a list of event objects from a list of raw trade data fetched by
         a :class:`~tastyworks.streamer.DXFeedStreamer`.
 
         :param data: list of raw quote data from streamer
+        :param fields:
+            the field names present in each event, in order; defaults to
+            :meth:`stream_fields`
+        :param partial:
+            whether `fields` may leave out required fields instead of raising
+            an error; the events are then of a subclass in which those fields
+            are optional and set to None
 
         :return: list of event objects from data
         """
-        objs = []
-        size = len(cls.model_fields)
-        multiples = len(data) / size
-        if not multiples.is_integer():
+        key = (cls, tuple(fields) if fields is not None else None, partial)
+        decoder = _DECODERS.get(key)
+        if decoder is None:
+            decoder = _DECODERS[key] = cls._compile_decoder(
+                fields if fields is not None else cls.stream_fields(), partial
+            )
+        return decoder(data)
+
+    @classmethod
+    def _compile_decoder(
+        cls: Type[E], fields: Sequence[str], partial: bool = False
+    ) -> Decoder:
+        """
+        Generates a function converting flat COMPACT data into event objects.
+        Each field's conversion is inlined from its annotation and the object
+        is built without per-field validator dispatch; rows the generated code
+        can't handle are validated by pydantic as usual.
+        """
+        by_alias = {(f.alias or name): name for name, f in cls.model_fields.items()}
+        try:
+            names = [by_alias[field] for field in fields]
+        except KeyError as e:
+            raise TastytradeError(f"Unknown field {e} for {cls.__name__}!")
+        missing = [
+            name
+            for name, f in cls.model_fields.items()
+            if name not in names and f.is_required()
+        ]
+        if missing and not partial:
             raise TastytradeError(
-                "Mapper data input values are not a multiple of the key size!"
+                f"Missing required fields {missing} for {cls.__name__}!"
+            )
+        if missing:
+            cls = _partial_model(cls, tuple(missing))
+        namespace: dict[str, Any] = {
+            "cls": cls,
+            "names": names,
+            "fields_set": frozenset(names),
+            "NAN_STRINGS": NAN_STRINGS,
+            "TastytradeError": TastytradeError,
+            "ValidationError": ValidationError,
+            "_SlowPath": _SlowPath,
+            "_to_decimal": _to_decimal,
+            "_to_int": _to_int,
+            "_to_none": _to_none,
+            "_setattr": object.__setattr__,
+        }
+        variables = [f"v{i}" for i in range(len(names))]
+        conversions = [
+            _field_conversion(
+                v,
+                cls.model_fields[n].annotation,
+                cls.model_fields[n].metadata,
+                namespace,
             )
-        keys = cls.model_fields.keys()
-        for i in range(int(multiples)):
-            offset = i * size
-            local_values = data[offset : (i + 1) * size]
-            event_dict = dict(zip(keys, local_values))
-            try:
-                objs.append(cls.model_validate(event_dict))
-            except ValidationError:
-                # we just skip these events as they're generally not helpful
-                pass
-        return objs
+            for v, n in zip(variables, names)
+        ]
+        values = [f"{n!r}: {v}" for n, v in zip(names, variables)]
+        for i, (name, f) in enumerate(cls.model_fields.items()):
+            if name not in names:
+                namespace[f"default{i}"] = f.get_default(call_default_factory=True)
+                values.append(f"{name!r}: default{i}")
+        if cls.__pydantic_post_init__ is None:
+            construct = [
+                "obj = cls.__new__(cls)",
+                f"_setattr(obj, '__dict__', {{{', '.join(values)}}})",
+                "_setattr(obj, '__pydantic_fields_set__', set(fields_set))",
+                "_setattr(obj, '__pydantic_extra__', None)",
+                "_setattr(obj, '__pydantic_private__', None)",
+            ]
+        else:
+            construct = [
+                f"obj = cls.model_construct(set(fields_set), **{{{', '.join(values)}}})"
+            ]
+        size = len(names)
+        body = "\n".join(
+            [
+                "def decode(data):",
+                f"    if len(data) % {size}:",
+                "        raise TastytradeError(",
+                "            'Mapper data input values are not a multiple of the key size!'",
+                "        )",
+                "    objs = []",
+                f"    for row in zip(*[iter(data)] * {size}):",
+                f"        {', '.join(variables)}, = row",
+                "        try:",
+                *[
+                    f"            {line}"
+                    for conversion in conversions
+                    for line in conversion.splitlines()
+                ],
+                "        except _SlowPath:",
+                "            try:",
+                "                objs.append(cls.model_validate(dict(zip(names, row))))",
+                "            except ValidationError:",
+                "                # we just skip these events as they're generally not helpful",
+                "                pass",
+                "            continue",
+                *[f"        {line}" for line in construct],
+                "        objs.append(obj)",
+                "    return objs",
+            ]
+        )
+        exec(body, namespace)
+        return namespace["decode"]
 
 
 class IndexedEvent(Event):
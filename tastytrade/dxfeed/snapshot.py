@@ -0,0 +1,216 @@
+from bisect import bisect_left
+from typing import Any, Callable, Generic, Iterator, Optional, TypeVar
+
+from .event import (
+    REMOVE_EVENT,
+    SNAPSHOT_BEGIN,
+    SNAPSHOT_END,
+    SNAPSHOT_SNIP,
+    TX_PENDING,
+)
+
+E = TypeVar("E")
+
+
+class IndexedSnapshot(Generic[E]):
+    """
+    A consistent view of the indexed events (e.g. candles) for a symbol,
+    ordered by index. Events are looked up and replaced by index in constant
+    time; the sorted order of the indices is only rebuilt when a new index
+    arrives out of order, which is cheap since the indices are nearly sorted,
+    and range queries use binary search.
+    """
+
+    def __init__(self):
+        self._events: dict[int, E] = {}
+        self._indices: list[int] = []
+        self._sorted = True
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __contains__(self, index: int) -> bool:
+        return index in self._events
+
+    def __getitem__(self, index: int) -> E:
+        return self._events[index]
+
+    def __iter__(self) -> Iterator[E]:
+        events = self._events
+        return (events[i] for i in self.indices())
+
+    def __repr__(self) -> str:
+        return f"IndexedSnapshot(events={len(self)})"
+
+    def indices(self) -> list[int]:
+        """
+        Returns the indices of the events, in ascending order.
+        """
+        if not self._sorted:
+            self._indices.sort()
+            self._sorted = True
+        return self._indices
+
+    def range(self, start: Optional[int] = None, stop: Optional[int] = None) -> list[E]:
+        """
+        Returns the events with indices from `start` (inclusive) to `stop`
+        (exclusive), in ascending order.
+
+        :param start: the first index to include; defaults to the first event
+        :param stop: the index to stop before; defaults to after the last event
+        """
+        indices = self.indices()
+        lo = 0 if start is None else bisect_left(indices, start)
+        hi = len(indices) if stop is None else bisect_left(indices, stop)
+        return [self._events[i] for i in indices[lo:hi]]
+
+    def last(self) -> Optional[E]:
+        """
+        Returns the event with the highest index, if any.
+        """
+        indices = self.indices()
+        return self._events[indices[-1]] if indices else None
+
+    def _put(self, index: int, event: E) -> None:
+        if index not in self._events:
+            if self._sorted and self._indices and index < self._indices[-1]:
+                self._sorted = False
+            self._indices.append(index)
+        self._events[index] = event
+
+    def _remove(self, index: int) -> None:
+        if self._events.pop(index, None) is not None:
+            indices = self.indices()
+            del indices[bisect_left(indices, index)]
+
+
+class _SymbolState(Generic[E]):
+    def __init__(self):
+        self.snapshot: IndexedSnapshot[E] = IndexedSnapshot()
+        # events received but not yet applied
+        self.pending: list[Any] = []
+        # whether a snapshot is being received
+        self.in_snapshot = False
+        # whether the pending events replace the snapshot when applied
+        self.replace = False
+
+
+class SnapshotAssembler(Generic[E]):
+    """
+    Rebuilds the state of indexed events, such as :class:`Candle`,
+    :class:`TimeAndSale` or :class:`Greeks`, for each symbol from the stream
+    of events, following the dxfeed snapshot and transaction protocol:
+
+    - events between ``snapshot_begin`` and ``snapshot_end`` (or
+      ``snapshot_snip``) make up a new snapshot, which replaces the previous
+      state once it's complete;
+    - events flagged ``pending`` are held back until the end of their
+      transaction, and then applied all at once;
+    - events flagged ``remove`` remove the event with the same index.
+
+    Snapshots are only ever exposed in a consistent state. Works with both
+    regular and compact events.
+
+    Example usage::
+
+        from tastytrade.dxfeed import Candle
+        from tastytrade.dxfeed.snapshot import SnapshotAssembler
+
+        assembler = SnapshotAssembler()
+        await streamer.subscribe_candle(["SPY"], "5m", start_time)
+        async for candle in streamer.listen(Candle):
+            if assembler.process(candle):
+                candles = assembler.snapshot(candle.event_symbol)
+                print(candles.last())
+
+    :param on_update:
+        an optional function called with the symbol and its snapshot whenever
+        a symbol's snapshot changes
+    """
+
+    def __init__(
+        self, on_update: Optional[Callable[[str, IndexedSnapshot[E]], Any]] = None
+    ):
+        self._states: dict[str, _SymbolState[E]] = {}
+        #: function called with the symbol and snapshot when a snapshot changes
+        self.on_update = on_update
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._states
+
+    def symbols(self) -> list[str]:
+        """
+        Returns the symbols events have been received for.
+        """
+        return list(self._states)
+
+    def snapshot(self, symbol: str) -> Optional[IndexedSnapshot[E]]:
+        """
+        Returns the latest consistent snapshot for the symbol, or None if no
+        events have been received for it.
+
+        :param symbol: the event symbol, e.g. "SPY{=5m}" for candles
+        """
+        state = self._states.get(symbol)
+        return state.snapshot if state is not None else None
+
+    def reset(self, symbol: Optional[str] = None) -> None:
+        """
+        Forgets the state of a symbol, e.g. after unsubscribing from it, or of
+        all symbols.
+
+        :param symbol: the symbol to forget; if not given, all are forgotten
+        """
+        if symbol is None:
+            self._states.clear()
+        else:
+            self._states.pop(symbol, None)
+
+    def process(self, event: E) -> bool:
+        """
+        Applies an event to its symbol's state.
+
+        :param event: an indexed event
+        :return:
+            whether the symbol's snapshot changed; False while a snapshot or
+            transaction is still incomplete
+        """
+        symbol: str = event.event_symbol  # type: ignore
+        flags: int = event.event_flags  # type: ignore
+        state = self._states.get(symbol)
+        if state is None:
+            state = self._states[symbol] = _SymbolState()
+        if flags & SNAPSHOT_BEGIN:
+            state.pending.clear()
+            state.in_snapshot = True
+        state.pending.append(event)
+        if state.in_snapshot:
+            if not flags & (SNAPSHOT_END | SNAPSHOT_SNIP):
+                return False
+            state.in_snapshot = False
+            state.replace = True
+        if flags & TX_PENDING:
+            return False
+        if state.replace:
+            state.snapshot = IndexedSnapshot()
+            state.replace = False
+        snapshot = state.snapshot
+        for e in state.pending:
+            if e.event_flags & REMOVE_EVENT:
+                snapshot._remove(e.index)
+            else:
+                snapshot._put(e.index, e)
+        state.pending.clear()
+        if self.on_update is not None:
+            self.on_update(symbol, snapshot)
+        return True
+
+    def process_all(self, events: list[E]) -> set[str]:
+        """
+        Applies a list of events, e.g. from
+        :meth:`~tastytrade.streamer.DXLinkStreamer.listen`.
+
+        :param events: the indexed events to apply, in the order received
+        :return: the symbols whose snapshots changed
+        """
+        return {e.event_symbol for e in events if self.process(e)}  # type: ignore
@@ -0,0 +1,236 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from tastytrade.account import Account, Transaction
+from tastytrade.session import Session
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    account_number TEXT NOT NULL,
+    executed_at INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_by_account
+    ON transactions (account_number, executed_at, id);
+CREATE TABLE IF NOT EXISTS watermarks (
+    account_number TEXT PRIMARY KEY,
+    transaction_id INTEGER NOT NULL,
+    executed_at INTEGER NOT NULL
+);
+"""
+_UPSERT = """
+INSERT INTO transactions (id, account_number, executed_at, data)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    executed_at=excluded.executed_at,
+    data=excluded.data
+"""
+# only ever moves the watermark forward
+_ADVANCE = """
+INSERT INTO watermarks (account_number, transaction_id, executed_at)
+VALUES (?, ?, ?)
+ON CONFLICT(account_number) DO UPDATE SET
+    transaction_id=excluded.transaction_id,
+    executed_at=excluded.executed_at
+WHERE (excluded.executed_at, excluded.transaction_id)
+    > (watermarks.executed_at, watermarks.transaction_id)
+"""
+
+
+def _to_ms(value: datetime) -> int:
+    return int(value.timestamp() * 1000)
+
+
+def _from_ms(value: int) -> datetime:
+    return datetime.fromtimestamp(value / 1000, timezone.utc)
+
+
+class TransactionStore:
+    """
+    Keeps a local copy of the transaction history of one or more accounts in
+    a SQLite database, along with a watermark for each account: the latest
+    transaction stored. Each :meth:`sync` only fetches the transactions
+    executed since the watermark and upserts them, so keeping the copy up to
+    date costs as much as the new transactions rather than the whole history.
+
+    Transactions are written in batches, each in a single database
+    transaction along with the new watermark, so an interrupted sync resumes
+    where it stopped.
+
+    Example usage::
+
+        from tastytrade.history import TransactionStore
+
+        with TransactionStore("transactions.db") as store:
+            new = store.sync(session, account)
+            for txn in store.transactions(account.account_number):
+                ...
+
+    :param path: the database file; defaults to an in-memory database
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "TransactionStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self._conn.close()
+
+    def watermark(self, account_number: str) -> Optional[tuple[int, datetime]]:
+        """
+        Returns the ID and execution time of the latest transaction stored
+        for the account, or None if nothing has been synced yet.
+
+        :param account_number: the account to check
+        """
+        row = self._conn.execute(
+            "SELECT transaction_id, executed_at FROM watermarks "
+            "WHERE account_number = ?",
+            (account_number,),
+        ).fetchone()
+        return (row[0], _from_ms(row[1])) if row else None
+
+    def add(self, transactions: Iterable[Transaction]) -> None:
+        """
+        Upserts transactions, advancing the watermarks of their accounts.
+
+        :param transactions: the transactions to store
+        """
+        rows = [
+            (
+                t.id,
+                t.account_number,
+                _to_ms(t.executed_at),
+                t.model_dump_json(by_alias=True, exclude_none=True),
+            )
+            for t in transactions
+        ]
+        latest: dict[str, tuple[int, int]] = {}
+        for id, account_number, executed_at, _ in rows:
+            mark = (executed_at, id)
+            if mark > latest.get(account_number, (-1, -1)):
+                latest[account_number] = mark
+        with self._conn:
+            self._conn.executemany(_UPSERT, rows)
+            self._conn.executemany(
+                _ADVANCE, [(a, id, ms) for a, (ms, id) in latest.items()]
+            )
+
+    def transactions(
+        self,
+        account_number: str,
+        start_at: Optional[datetime] = None,
+        end_at: Optional[datetime] = None,
+    ) -> Iterator[Transaction]:
+        """
+        Iterates over the stored transactions for the account, oldest first.
+
+        :param account_number: the account to get transactions for
+        :param start_at: only include transactions executed at or after this
+        :param end_at: only include transactions executed before this
+        """
+        cursor = self._conn.execute(
+            "SELECT data FROM transactions WHERE account_number = ? "
+            "AND executed_at >= ? AND executed_at < ? ORDER BY executed_at, id",
+            (
+                account_number,
+                _to_ms(start_at) if start_at else -(2**62),
+                _to_ms(end_at) if end_at else 2**62,
+            ),
+        )
+        for (data,) in cursor:
+            yield Transaction.model_validate_json(data)
+
+    def _start_at(
+        self, account: Account, start_at: Optional[datetime], overlap: timedelta
+    ) -> Optional[datetime]:
+        watermark = self.watermark(account.account_number)
+        if watermark is None:
+            return start_at
+        return watermark[1] - overlap
+
+    async def a_sync(
+        self,
+        session: Session,
+        account: Account,
+        start_at: Optional[datetime] = None,
+        overlap: timedelta = timedelta(days=1),
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Fetches the transactions executed since the account's watermark and
+        upserts them.
+
+        :param session: the session to use for the requests.
+        :param account: the account to sync.
+        :param start_at:
+            where to start the first sync of the account; if not given, the
+            whole history is fetched. Ignored once the account has a watermark.
+        :param overlap:
+            how far before the watermark to start fetching, to pick up
+            transactions posted after the last sync with an earlier execution
+            time; transactions fetched again are simply updated.
+        :param batch_size: the number of transactions to write at once.
+
+        :return: the number of transactions fetched.
+        """
+        start = self._start_at(account, start_at, overlap)
+        batch: list[Transaction] = []
+        count = 0
+        async for txn in account.a_iter_history(session, sort="Asc", start_at=start):
+            batch.append(txn)
+            if len(batch) >= batch_size:
+                self.add(batch)
+                count += len(batch)
+                batch.clear()
+        self.add(batch)
+        return count + len(batch)
+
+    def sync(
+        self,
+        session: Session,
+        account: Account,
+        start_at: Optional[datetime] = None,
+        overlap: timedelta = timedelta(days=1),
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Fetches the transactions executed since the account's watermark and
+        upserts them.
+
+        :param session: the session to use for the requests.
+        :param account: the account to sync.
+        :param start_at:
+            where to start the first sync of the account; if not given, the
+            whole history is fetched. Ignored once the account has a watermark.
+        :param overlap:
+            how far before the watermark to start fetching, to pick up
+            transactions posted after the last sync with an earlier execution
+            time; transactions fetched again are simply updated.
+        :param batch_size: the number of transactions to write at once.
+
+        :return: the number of transactions fetched.
+        """
+        start = self._start_at(account, start_at, overlap)
+        batch: list[Transaction] = []
+        count = 0
+        for txn in account.iter_history(session, sort="Asc", start_at=start):
+            batch.append(txn)
+            if len(batch) >= batch_size:
+                self.add(batch)
+                count += len(batch)
+                batch.clear()
+        self.add(batch)
+        return count + len(batch)
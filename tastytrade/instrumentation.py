@@ -0,0 +1,163 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Callable, Optional
+
+
+class Histogram:
+    """
+    A histogram of non-negative values with power-of-two buckets, cheap
+    enough to record into on every message: bucket `i` counts the values
+    from 2 ** (i - 1) up to 2 ** i, so quantiles are accurate to within a
+    factor of two.
+    """
+
+    def __init__(self):
+        #: the number of values recorded in each bucket
+        self.buckets: list[int] = [0] * 64
+        #: the number of values recorded
+        self.count = 0
+        #: the sum of the values recorded
+        self.total = 0.0
+        #: the largest value recorded
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """
+        Adds a value to the histogram; negative values count as zero.
+
+        :param value: the value to add
+        """
+        if value < 0:
+            value = 0
+        self.buckets[min(int(value).bit_length(), 63)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        """
+        The average of the values recorded.
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns an upper bound for the given quantile of the values recorded.
+
+        :param q: the quantile, between 0 and 1, e.g. 0.99
+        """
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(float(1 << i), self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        """
+        Returns the count, mean, p50, p99 and max of the values recorded.
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class StreamerMetrics:
+    """
+    Counters and histograms describing the traffic handled by a streamer,
+    available as the streamer's ``metrics`` attribute. Recording is a few
+    dict updates per message, so they're always on.
+
+    Example usage::
+
+        async with DXLinkStreamer(session) as streamer:
+            streamer.metrics.add_hook(print, interval=60)
+            ...
+            print(streamer.metrics.snapshot()["lag_ms"])
+    """
+
+    def __init__(self):
+        #: the number of websocket messages received, by message type
+        self.frames: dict[str, int] = defaultdict(int)
+        #: the number of events (or alerts) received, by type
+        self.events: dict[str, int] = defaultdict(int)
+        #: the total size of the websocket messages received, in characters
+        self.bytes_received = 0
+        #: the number of times the connection was re-established
+        self.reconnects = 0
+        #: time taken to decode messages on the event loop, in microseconds, by type
+        self.decode_us: dict[str, Histogram] = defaultdict(Histogram)
+        #: time from each batch's last event time until it was received, in
+        #: milliseconds, by type
+        self.lag_ms: dict[str, Histogram] = defaultdict(Histogram)
+        # functions returning the current value of each gauge
+        self._gauges: dict[str, Callable[[], Any]] = {}
+        self._hooks: list[asyncio.Task] = []
+
+    def add_gauge(self, name: str, read: Callable[[], Any]) -> None:
+        """
+        Adds a value which is read whenever a snapshot is taken, e.g. the
+        size of a queue.
+
+        :param name: the name of the value in snapshots
+        :param read: a function returning the current value
+        """
+        self._gauges[name] = read
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Returns the current value of every metric as plain Python types, e.g.
+        to be logged or exported as JSON.
+        """
+        return {
+            "frames": dict(self.frames),
+            "events": dict(self.events),
+            "bytes_received": self.bytes_received,
+            "reconnects": self.reconnects,
+            "decode_us": {k: h.summary() for k, h in self.decode_us.items()},
+            "lag_ms": {k: h.summary() for k, h in self.lag_ms.items()},
+            **{name: read() for name, read in self._gauges.items()},
+        }
+
+    def add_hook(
+        self, callback: Callable[[dict[str, Any]], Any], interval: float = 10
+    ) -> None:
+        """
+        Calls a function with a :meth:`snapshot` periodically, e.g. to export
+        the metrics to a monitoring system. The function may be a coroutine
+        function. Hooks stop when the streamer is closed.
+
+        :param callback: the function to call with each snapshot
+        :param interval: the time between calls, in seconds
+        """
+        self._hooks.append(asyncio.create_task(self._export(callback, interval)))
+
+    async def _export(
+        self, callback: Callable[[dict[str, Any]], Any], interval: float
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            result = callback(self.snapshot())
+            if asyncio.iscoroutine(result):
+                await result
+
+    async def close(self) -> None:
+        """
+        Stops any hooks added with :meth:`add_hook`.
+        """
+        for task in self._hooks:
+            task.cancel()
+        await asyncio.gather(*self._hooks, return_exceptions=True)
+        self._hooks.clear()
+
+    def _lag(self, kind: str, event_time: Optional[int], now_ms: float) -> None:
+        # dxfeed leaves the event time at 0 for many events
+        if event_time:
+            self.lag_ms[kind].record(now_ms - event_time)
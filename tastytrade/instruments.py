@@ -10,7 +10,7 @@ from typing_extensions import Self
 
 from tastytrade.order import InstrumentType, TradeableTastytradeJsonDataclass
 from tastytrade.session import Session
-from tastytrade.utils import TastytradeJsonDataclass, validate_response
+from tastytrade.utils import TastytradeJsonDataclass, json_loads, validate_response
 
 
 class OptionType(str, Enum):
@@ -317,7 +317,7 @@ class Equity(TradeableTastytradeJsonDataclass):
                 params={k: v for k, v in params.items() if v is not None},
             )
             validate_response(response)
-            json = response.json()
+            json = json_loads(response.content)
             equities.extend([cls(**i) for i in json["data"]["items"]])
             # handle pagination
             pagination = json["pagination"]
@@ -368,7 +368,7 @@ class Equity(TradeableTastytradeJsonDataclass):
                 params={k: v for k, v in params.items() if v is not None},
             )
             validate_response(response)
-            json = response.json()
+            json = json_loads(response.content)
             equities.extend([cls(**i) for i in json["data"]["items"]])
             # handle pagination
             pagination = json["pagination"]
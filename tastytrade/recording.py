@@ -0,0 +1,143 @@
+import struct
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from tastytrade.utils import TastytradeError
+
+MAGIC = b"TTFEED1\n"
+# each chunk: compressed size and number of frames, then the zlib data
+_CHUNK = struct.Struct("<II")
+# each frame within a chunk: receive timestamp and size, then the raw JSON
+_FRAME = struct.Struct("<dI")
+
+
+class FeedRecorder:
+    """
+    Records the raw FEED_DATA (and FEED_CONFIG) messages received by a
+    :class:`~tastytrade.streamer.DXLinkStreamer`, along with when they were
+    received, to an append-only file which can be replayed later with a
+    :class:`~tastytrade.streamer.ReplayStreamer`.
+
+    Frames are buffered and written as zlib-compressed chunks, so a capture
+    is only complete after :meth:`close` (or leaving the context manager);
+    if the process dies, only the frames in the last chunk are lost. Full
+    chunks are compressed and written by a background thread, so recording
+    doesn't hold up the streamer.
+
+    Example usage::
+
+        from tastytrade import DXLinkStreamer
+        from tastytrade.recording import FeedRecorder
+
+        with FeedRecorder("open.feed") as recorder:
+            async with DXLinkStreamer(session, recorder=recorder) as streamer:
+                ...
+
+    :param path: the file to record to; appended to if it already exists
+    :param chunk_size: the uncompressed size in bytes of each chunk
+    """
+
+    def __init__(self, path: Union[str, Path], chunk_size: int = 1 << 20):
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._frames = 0
+        # compresses and writes chunks, one at a time and in order
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        self._writing: Optional[Future] = None
+        #: the number of frames recorded so far
+        self.frames_recorded = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record(self, raw_message: str, timestamp: Optional[float] = None) -> None:
+        """
+        Adds a raw message to the recording.
+
+        :param raw_message: the message as received from the websocket
+        :param timestamp:
+            when the message was received, in seconds since the epoch; defaults
+            to now
+        """
+        data = raw_message.encode()
+        if timestamp is None:
+            timestamp = time.time()
+        self._buffer += _FRAME.pack(timestamp, len(data))
+        self._buffer += data
+        self._frames += 1
+        self.frames_recorded += 1
+        if len(self._buffer) >= self._chunk_size:
+            self._submit()
+
+    def flush(self) -> None:
+        """
+        Compresses and writes out any buffered frames, waiting until they've
+        been written.
+        """
+        self._submit()
+        if self._writing is not None:
+            self._writing.result()
+
+    def close(self) -> None:
+        """
+        Writes out any buffered frames and closes the file.
+        """
+        self.flush()
+        self._writer.shutdown()
+        self._file.close()
+
+    def _submit(self) -> None:
+        if not self._frames:
+            return
+        # wait for the previous chunk, which also raises any error writing it
+        # and keeps at most one chunk in flight
+        if self._writing is not None:
+            self._writing.result()
+        self._writing = self._writer.submit(
+            self._write_chunk, self._buffer, self._frames
+        )
+        self._buffer = bytearray()
+        self._frames = 0
+
+    def _write_chunk(self, buffer: bytearray, frames: int) -> None:
+        compressed = zlib.compress(buffer, 1)
+        self._file.write(_CHUNK.pack(len(compressed), frames))
+        self._file.write(compressed)
+        self._file.flush()
+
+
+def read_feed(path: Union[str, Path]) -> Iterator[tuple[float, str]]:
+    """
+    Reads back a recording made by a :class:`FeedRecorder`, one chunk at a
+    time.
+
+    :param path: the recording to read
+
+    :return: an iterator of (timestamp, raw message) pairs, in recorded order
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise TastytradeError(f"{path} is not a feed recording!")
+        while header := file.read(_CHUNK.size):
+            if len(header) < _CHUNK.size:
+                break  # truncated by a crash while writing
+            size, frames = _CHUNK.unpack(header)
+            compressed = file.read(size)
+            if len(compressed) < size:
+                break
+            chunk = memoryview(zlib.decompress(compressed))
+            offset = 0
+            for _ in range(frames):
+                timestamp, length = _FRAME.unpack_from(chunk, offset)
+                offset += _FRAME.size
+                yield timestamp, str(chunk[offset : offset + length], "utf-8")
+                offset += length
@@ -1,5 +1,5 @@
 from tastytrade.session import Session
-from tastytrade.utils import TastytradeJsonDataclass
+from tastytrade.utils import TastytradeJsonDataclass, json_loads
 
 
 class SymbolData(TastytradeJsonDataclass):
@@ -25,7 +25,7 @@ async def a_symbol_search(session: Session, symbol: str) -> list[SymbolData]:
         # here it doesn't really make sense to throw an exception
         return []
     else:
-        data = response.json()["data"]
+        data = json_loads(response.content)["data"]
         return [SymbolData(**i) for i in data["items"]]
 
 
@@ -43,5 +43,5 @@ def symbol_search(session: Session, symbol: str) -> list[SymbolData]:
         # here it doesn't really make sense to throw an exception
         return []
     else:
-        data = response.json()["data"]
+        data = json_loads(response.content)["data"]
         return [SymbolData(**i) for i in data["items"]]
@@ -4,7 +4,13 @@ from typing import Any, Optional, Union
 import httpx
 
 from tastytrade import API_URL, CERT_URL
-from tastytrade.utils import TastytradeError, TastytradeJsonDataclass, validate_response
+from tastytrade.cache import ResponseCache
+from tastytrade.utils import (
+    TastytradeError,
+    TastytradeJsonDataclass,
+    json_loads,
+    validate_response,
+)
 
 
 class Address(TastytradeJsonDataclass):
@@ -273,6 +279,9 @@ class Session:
         user's device
     :param dxfeed_tos_compliant:
         whether to use the dxfeed TOS-compliant API endpoint for the streamer
+    :param cache:
+        an optional :class:`~tastytrade.cache.ResponseCache` for reference
+        data, such as option chains, which rarely changes
     """
 
     def __init__(
@@ -284,6 +293,7 @@ class Session:
         is_test: bool = False,
         two_factor_authentication: Optional[str] = None,
         dxfeed_tos_compliant: bool = False,
+        cache: Optional[ResponseCache] = None,
     ):
         body = {"login": login, "remember-me": remember_me}
         if password is not None:
@@ -296,6 +306,8 @@ class Session:
             )
         #: Whether this is a cert or real session
         self.is_test = is_test
+        #: Cache for responses from reference data endpoints, if any
+        self.cache = cache
         # The headers to use for API requests
         headers = {
             "Accept": "application/json",
@@ -315,7 +327,7 @@ class Session:
             response = self.sync_client.post("/sessions", json=body)
         validate_response(response)  # throws exception if not 200
 
-        json = response.json()
+        json = json_loads(response.content)
         #: The user dict returned by the API; contains basic user information
         self.user = User(**json["data"]["user"])
         #: The session token used to authenticate requests
@@ -342,12 +354,46 @@ class Session:
         self.dxlink_url = data["dxlink-url"]
 
     async def _a_get(self, url, **kwargs) -> dict[str, Any]:
-        response = await self.async_client.get(url, timeout=30, **kwargs)
-        return self._validate_and_parse(response)
+        cache = self.cache
+        key = (
+            cache.key(url, kwargs.get("params"), str(self.async_client.base_url))
+            if cache is not None
+            else None
+        )
+        if cache is None or key is None:
+            response = await self.async_client.get(url, timeout=30, **kwargs)
+            return self._validate_and_parse(response)
+        content = cache.get(key)
+        headers = cache.validators(key)
+        while content is None:
+            response = await self.async_client.get(
+                url, timeout=30, headers=headers, **kwargs
+            )
+            content = cache.store(key, response)
+            # if the cached response was evicted before the API said it was
+            # unchanged, it has to be downloaded again
+            headers = {}
+        return json_loads(content)["data"]
 
     def _get(self, url, **kwargs) -> dict[str, Any]:
-        response = self.sync_client.get(url, timeout=30, **kwargs)
-        return self._validate_and_parse(response)
+        cache = self.cache
+        key = (
+            cache.key(url, kwargs.get("params"), str(self.sync_client.base_url))
+            if cache is not None
+            else None
+        )
+        if cache is None or key is None:
+            response = self.sync_client.get(url, timeout=30, **kwargs)
+            return self._validate_and_parse(response)
+        content = cache.get(key)
+        headers = cache.validators(key)
+        while content is None:
+            response = self.sync_client.get(url, timeout=30, headers=headers, **kwargs)
+            content = cache.store(key, response)
+            # if the cached response was evicted before the API said it was
+            # unchanged, it has to be downloaded again
+            headers = {}
+        return json_loads(content)["data"]
 
     async def _a_delete(self, url, **kwargs) -> None:
         response = await self.async_client.delete(url, **kwargs)
@@ -375,7 +421,7 @@ class Session:
 
     def _validate_and_parse(self, response: httpx._models.Response) -> dict[str, Any]:
         validate_response(response)
-        return response.json()["data"]
+        return json_loads(response.content)["data"]
 
     async def a_validate(self) -> bool:
         """
@@ -0,0 +1,287 @@
+import asyncio
+import random
+import time
+from decimal import Decimal
+from typing import Any, Optional, Union, get_args, get_origin
+
+from websockets.asyncio.server import Server, ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+
+from tastytrade import logger
+from tastytrade.streamer import DXLINK_VERSION, MAP_EVENTS
+from tastytrade.utils import TastytradeError, json_dumps, json_loads
+
+
+def _sample(field: str, annotation: Any, symbol: str) -> Any:
+    """
+    Makes up a plausible value for an event field.
+    """
+    if get_origin(annotation) is Union:
+        annotation = next(a for a in get_args(annotation) if a is not type(None))
+    if field == "eventSymbol":
+        return symbol
+    if field == "eventFlags":
+        # random flags would mark events as snapshot parts or removals
+        return 0
+    if annotation is Decimal or annotation is float:
+        return round(random.uniform(1, 500), 2)
+    if annotation is int:
+        if field.endswith("Time") or field == "time":
+            return int(time.time() * 1000)
+        return random.randint(0, 1000)
+    if annotation is bool:
+        return False
+    if annotation is str:
+        return "Q"
+    return None
+
+
+class _Channel:
+    """
+    State of a feed channel opened by a client.
+    """
+
+    def __init__(self, number: int):
+        self.number = number
+        self.event_type: Optional[str] = None
+        self.fields: dict[str, list[str]] = {}
+        # one row of values per subscribed symbol, in field order
+        self.rows: dict[str, list[Any]] = {}
+        self.task: Optional[asyncio.Task] = None
+
+    def add(self, event_type: str, symbol: str) -> None:
+        self.event_type = event_type
+        cls = MAP_EVENTS[event_type]
+        fields = self.fields.get(event_type) or cls.stream_fields()
+        annotations = {
+            (f.alias or name): f.annotation for name, f in cls.model_fields.items()
+        }
+        self.rows[symbol] = [
+            _sample(field, annotations.get(field), symbol) for field in fields
+        ]
+
+
+class DXLinkSimulator:
+    """
+    A local websocket server speaking enough of the DXLink protocol for a
+    :class:`~tastytrade.streamer.DXLinkStreamer` to connect, authenticate,
+    open channels and subscribe, which then streams synthetic events for the
+    subscribed symbols. Useful for measuring streamer performance, or for
+    tests, without a production session.
+
+    The event time of every event is set to when it was sent, so the
+    end-to-end latency can be computed on the receiving side.
+
+    Example usage::
+
+        from types import SimpleNamespace
+        from tastytrade import DXLinkStreamer
+        from tastytrade.dxfeed import Quote
+        from tastytrade.simulator import DXLinkSimulator
+
+        async with DXLinkSimulator(events_per_second=10_000) as simulator:
+            session = SimpleNamespace(
+                dxlink_url=simulator.url, streamer_token=simulator.token
+            )
+            async with DXLinkStreamer(session) as streamer:
+                await streamer.subscribe(Quote, ["SPY", "QQQ"])
+                quote = await streamer.get_event(Quote)
+
+    :param events_per_second:
+        the number of events to send per second on each channel, spread over
+        all symbols subscribed to on it
+    :param events_per_frame: the maximum number of events in a FEED_DATA message
+    :param host: the interface to listen on
+    :param port: the port to listen on; by default a free port is picked
+    :param token: the token clients must authenticate with
+    """
+
+    def __init__(
+        self,
+        events_per_second: float = 1000,
+        events_per_frame: int = 100,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        token: str = "simulator",
+    ):
+        #: the number of events to send per second on each channel
+        self.events_per_second = events_per_second
+        #: the maximum number of events in a FEED_DATA message
+        self.events_per_frame = events_per_frame
+        #: the token clients must authenticate with
+        self.token = token
+        #: the number of events sent so far
+        self.events_sent = 0
+        self._host = host
+        self._port = port
+        self._server: Optional[Server] = None
+
+    async def __aenter__(self):
+        self._server = await serve(
+            self._handle, self._host, self._port, compression=None
+        )
+        self._port = next(iter(self._server.sockets)).getsockname()[1]
+        return self
+
+    def __await__(self):
+        return self.__aenter__().__await__()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the server and all connections to it.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def disconnect(self) -> None:
+        """
+        Closes all current connections while leaving the server running, so
+        clients can reconnect.
+        """
+        if self._server is not None:
+            for connection in list(self._server.connections):
+                await connection.close()
+
+    @property
+    def url(self) -> str:
+        """
+        The URL to connect to, to be used in place of the session's
+        ``dxlink_url``.
+        """
+        return f"ws://{self._host}:{self._port}"
+
+    async def _handle(self, websocket: ServerConnection) -> None:
+        channels: dict[int, _Channel] = {}
+        try:
+            async for raw_message in websocket:
+                message = json_loads(raw_message)
+                await self._reply(websocket, channels, message)
+        except ConnectionClosed:
+            pass
+        finally:
+            for channel in channels.values():
+                if channel.task is not None:
+                    channel.task.cancel()
+
+    async def _reply(
+        self,
+        websocket: ServerConnection,
+        channels: dict[int, _Channel],
+        message: dict[str, Any],
+    ) -> None:
+        kind = message["type"]
+        number = message.get("channel", 0)
+        if kind == "SETUP":
+            await websocket.send(
+                json_dumps(
+                    {
+                        "type": "SETUP",
+                        "channel": 0,
+                        "keepaliveTimeout": 60,
+                        "acceptKeepaliveTimeout": 60,
+                        "version": DXLINK_VERSION,
+                    }
+                )
+            )
+            await self._send_auth_state(websocket, "UNAUTHORIZED")
+        elif kind == "AUTH":
+            authorized = message.get("token") == self.token
+            await self._send_auth_state(
+                websocket, "AUTHORIZED" if authorized else "UNAUTHORIZED"
+            )
+        elif kind == "CHANNEL_REQUEST":
+            channels[number] = _Channel(number)
+            await websocket.send(
+                json_dumps(
+                    {
+                        "type": "CHANNEL_OPENED",
+                        "channel": number,
+                        "service": "FEED",
+                        "parameters": message.get("parameters", {}),
+                    }
+                )
+            )
+        elif kind == "FEED_SETUP":
+            channel = channels[number]
+            channel.fields = message.get("acceptEventFields", {})
+            await websocket.send(
+                json_dumps(
+                    {
+                        "type": "FEED_CONFIG",
+                        "channel": number,
+                        "dataFormat": "COMPACT",
+                        "aggregationPeriod": message.get("acceptAggregationPeriod", 0),
+                        "eventFields": channel.fields,
+                    }
+                )
+            )
+        elif kind == "FEED_SUBSCRIPTION":
+            channel = channels[number]
+            if message.get("reset"):
+                channel.rows.clear()
+            for entry in message.get("remove", []):
+                channel.rows.pop(entry["symbol"], None)
+            for entry in message.get("add", []):
+                channel.add(entry["type"], entry["symbol"])
+            if channel.rows and (channel.task is None or channel.task.done()):
+                channel.task = asyncio.create_task(self._stream(websocket, channel))
+        elif kind == "CHANNEL_CANCEL":
+            channel = channels.pop(number, None)
+            if channel is not None and channel.task is not None:
+                channel.task.cancel()
+            await websocket.send(
+                json_dumps({"type": "CHANNEL_CLOSED", "channel": number})
+            )
+        elif kind == "KEEPALIVE":
+            await websocket.send(json_dumps({"type": "KEEPALIVE", "channel": 0}))
+        else:
+            logger.error(f"Simulator received unknown message: {message}")
+
+    async def _send_auth_state(self, websocket: ServerConnection, state: str) -> None:
+        await websocket.send(
+            json_dumps({"type": "AUTH_STATE", "channel": 0, "state": state})
+        )
+
+    async def _stream(self, websocket: ServerConnection, channel: _Channel) -> None:
+        """
+        Sends FEED_DATA messages for the channel's symbols at the configured
+        rate, cycling through the symbols.
+        """
+        if channel.event_type is None:
+            raise TastytradeError("No event type subscribed to on channel!")
+        fields = channel.fields.get(channel.event_type) or (
+            MAP_EVENTS[channel.event_type].stream_fields()
+        )
+        time_index = fields.index("eventTime") if "eventTime" in fields else None
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        sent = 0
+        position = 0
+        while channel.rows:
+            rows = list(channel.rows.values())
+            data: list[Any] = []
+            now = int(time.time() * 1000)
+            for _ in range(self.events_per_frame):
+                row = rows[position % len(rows)]
+                if time_index is not None:
+                    row[time_index] = now
+                data.extend(row)
+                position += 1
+            await websocket.send(
+                json_dumps(
+                    {
+                        "type": "FEED_DATA",
+                        "channel": channel.number,
+                        "data": [channel.event_type, data],
+                    }
+                )
+            )
+            sent += self.events_per_frame
+            self.events_sent += self.events_per_frame
+            # sleep until the next frame is due; if behind, send right away
+            delay = start + sent / self.events_per_second - loop.time()
+            await asyncio.sleep(max(delay, 0))
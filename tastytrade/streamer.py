@@ -1,30 +1,41 @@
 import asyncio
-import json
+import re
+import zlib
 from asyncio import Queue, QueueEmpty
 from collections import defaultdict
+from concurrent.futures import Executor
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from pathlib import Path
 from ssl import SSLContext, create_default_context
+from time import perf_counter, time
+from types import SimpleNamespace
 from typing import (
     Any,
     AsyncIterator,
     Callable,
+    Container,
     Coroutine,
+    Iterable,
     Optional,
     Type,
     TypeVar,
     Union,
 )
 
+import numpy as np
 from pydantic import model_validator
 from websockets.asyncio.client import ClientConnection, connect
 from websockets.exceptions import ConnectionClosed
 
 from tastytrade import logger
 from tastytrade.account import Account, AccountBalance, CurrentPosition, TradingStatus
+from tastytrade.candles import CandleSeries, CandleStore
 from tastytrade.dxfeed import (
     Candle,
+    CompactEvent,
+    EventBatch,
     Greeks,
     Profile,
     Quote,
@@ -33,21 +44,38 @@ from tastytrade.dxfeed import (
     TimeAndSale,
     Trade,
     Underlying,
+    compact_class,
 )
+from tastytrade.dxfeed.event import SNAPSHOT_END, SNAPSHOT_SNIP
+from tastytrade.dxfeed.snapshot import SnapshotAssembler
+from tastytrade.instrumentation import StreamerMetrics
 from tastytrade.order import (
     InstrumentType,
     OrderChain,
     PlacedComplexOrder,
     PlacedOrder,
 )
+from tastytrade.recording import FeedRecorder, read_feed
 from tastytrade.session import Session
-from tastytrade.utils import TastytradeError, TastytradeJsonDataclass, _set_sign_for
+from tastytrade.utils import (
+    TastytradeError,
+    TastytradeJsonDataclass,
+    _gather_or_cancel,
+    _set_sign_for,
+    json_dumps,
+    json_loads,
+)
 from tastytrade.watchlists import Watchlist
 
 CERT_STREAMER_URL = "wss://streamer.cert.tastyworks.com"
 STREAMER_URL = "wss://streamer.tastyworks.com"
 
 DXLINK_VERSION = "0.1-js/1.0.0-beta.4"
+#: Maximum size in bytes of a FEED_SUBSCRIPTION message; larger subscriptions
+#: are split across several messages so the server doesn't reject them (1009)
+MAX_SUBSCRIPTION_SIZE = 1 << 16
+# FEED_DATA messages start with their type; others are parsed as usual
+_FEED_DATA_PREFIX = re.compile(r'\s*\{\s*"type"\s*:\s*"FEED_DATA"')
 
 
 class QuoteAlert(TastytradeJsonDataclass):
@@ -111,6 +139,22 @@ class SubscriptionType(str, Enum):
     USER_MESSAGE = "user-message-subscribe"
 
 
+class OverflowPolicy(str, Enum):
+    """
+    This is an :class:`~enum.Enum` that contains the ways the streamers can
+    handle a new message when the queue for its type is full.
+    """
+
+    #: wait for the consumer to make room, pausing the websocket reader
+    BLOCK = "block"
+    #: discard the oldest queued message to make room for the new one
+    DROP_OLDEST = "drop-oldest"
+    #: discard the new message
+    DROP_NEWEST = "drop-newest"
+    #: keep only the latest event per symbol (data streamer only)
+    CONFLATE = "conflate"
+
+
 MAP_ALERTS = {
     "AccountBalance": AccountBalance,
     "ComplexOrder": PlacedComplexOrder,
@@ -135,6 +179,7 @@ AlertType = Union[
     Watchlist,
 ]
 T = TypeVar("T", bound=AlertType)
+MAP_ALERTS_REVERSE = {v: k for k, v in MAP_ALERTS.items()}
 
 MAP_EVENTS = {
     "Candle": Candle,
@@ -163,6 +208,84 @@ EventType = Union[
 U = TypeVar("U", bound=EventType)
 
 
+class ConflatingQueue(Queue):
+    """
+    An :class:`asyncio.Queue` of dxfeed events holding at most one event per
+    symbol: putting an event for a symbol that's already queued replaces the
+    queued event in place. Consumers always get the most recent data, and the
+    size of the queue is bounded by the number of symbols rather than by the
+    rate of events.
+    """
+
+    def put_nowait(self, item: Any) -> None:
+        # a replaced event isn't a new task, so it mustn't count towards join()
+        if item.event_symbol in self._queue:
+            self._put(item)
+        else:
+            super().put_nowait(item)
+
+    async def put(self, item: Any) -> None:
+        # replacing never needs room, even if the queue is full
+        if item.event_symbol in self._queue:
+            self.put_nowait(item)
+        else:
+            await super().put(item)
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: dict[str, Any] = {}  # type: ignore
+        #: number of queued events replaced by a newer event for the same symbol
+        self.conflated = 0
+
+    def _put(self, item: Any) -> None:
+        if item.event_symbol in self._queue:
+            self.conflated += 1
+        self._queue[item.event_symbol] = item
+
+    def _get(self) -> Any:
+        return self._queue.pop(next(iter(self._queue)))
+
+
+def _per_type(value: Any, names: dict[Any, str], default: Any) -> dict[str, Any]:
+    """
+    Expands a streamer option that's either given once for all message types
+    or as a dict of message classes to values (with `default` used for any
+    missing types) into a dict of type names to values.
+    """
+    if isinstance(value, dict):
+        return defaultdict(lambda: default, {names[cls]: v for cls, v in value.items()})
+    return defaultdict(lambda: value)
+
+
+def _frame_size(raw_message: Union[str, bytes]) -> int:
+    """
+    Returns the size in bytes of a websocket frame. Text frames are almost
+    always ASCII, in which case there's no need to encode them to count.
+    """
+    if isinstance(raw_message, str) and not raw_message.isascii():
+        return len(raw_message.encode())
+    return len(raw_message)
+
+
+async def _put(queue: Queue, item: Any, policy: OverflowPolicy) -> bool:
+    """
+    Puts the item in the queue according to the overflow policy, returning
+    whether a message was dropped as a result.
+    """
+    if not queue.full():
+        queue.put_nowait(item)
+        return False
+    if policy == OverflowPolicy.DROP_NEWEST:
+        return True
+    if policy == OverflowPolicy.DROP_OLDEST:
+        queue.get_nowait()
+        # the discarded item won't be processed, so it's done as far as join() goes
+        queue.task_done()
+        queue.put_nowait(item)
+        return True
+    await queue.put(item)
+    return False
+
+
 class AlertStreamer:
     """
     Used to subscribe to account-level updates (balances, orders, positions),
@@ -192,6 +315,12 @@ class AlertStreamer:
 
         streamer = await AlertStreamer(session)
 
+    By default, messages are queued until they're consumed. To bound memory
+    use, pass `queue_size`, either as an int for all types or as a dict of
+    alert classes to sizes, along with an :class:`OverflowPolicy` (again, once
+    or per class) deciding what happens when a queue is full. The number of
+    messages discarded for each type is kept in :attr:`dropped`.
+
     """
 
     def __init__(
@@ -199,6 +328,11 @@ class AlertStreamer:
         session: Session,
         reconnect_args: tuple[Any, ...] = (),
         reconnect_fn: Optional[Callable[..., Coroutine[Any, Any, None]]] = None,
+        queue_size: Union[int, dict[Type[AlertType], int]] = 0,
+        overflow_policy: Union[
+            OverflowPolicy, dict[Type[AlertType], OverflowPolicy]
+        ] = OverflowPolicy.BLOCK,
+        connect_timeout: float = 10,
     ):
         #: The active session used to initiate the streamer or make requests
         self.token: str = session.session_token
@@ -210,18 +344,35 @@ class AlertStreamer:
         #: Variable number of arguments to pass to the reconnect function
         self.reconnect_args = reconnect_args
 
-        self._queues: dict[str, Queue] = defaultdict(Queue)
+        sizes = _per_type(queue_size, MAP_ALERTS_REVERSE, 0)
+        self._policies = _per_type(
+            overflow_policy, MAP_ALERTS_REVERSE, OverflowPolicy.BLOCK
+        )
+        if OverflowPolicy.CONFLATE in self._policies.values():
+            raise TastytradeError("Alerts can't be conflated!")
+        self._queues: dict[str, Queue] = {
+            name: Queue(maxsize=sizes[name]) for name in MAP_ALERTS
+        }
+        #: number of messages of each type discarded because the queue was full
+        self.dropped: dict[str, int] = defaultdict(int)
+        #: counters and histograms describing the messages received
+        self.metrics = StreamerMetrics()
+        self.metrics.add_gauge(
+            "queue_depths", lambda: {k: q.qsize() for k, q in self._queues.items()}
+        )
+        self.metrics.add_gauge("dropped", lambda: dict(self.dropped))
         self._websocket: Optional[ClientConnection] = None
+        #: seconds to wait for the connection to be established
+        self.connect_timeout = connect_timeout
+        self._connected = asyncio.Event()
         self._connect_task = asyncio.create_task(self._connect())
         self._reconnect_task = None
 
     async def __aenter__(self):
-        time_out = 100
-        while not self._websocket:
-            await asyncio.sleep(0.1)
-            time_out -= 1
-            if time_out < 0:
-                raise TastytradeError("Connection timed out")
+        try:
+            await asyncio.wait_for(self._connected.wait(), self.connect_timeout)
+        except asyncio.TimeoutError:
+            raise TastytradeError("Connection timed out")
 
         return self
 
@@ -242,6 +393,7 @@ class AlertStreamer:
             self._reconnect_task.cancel()
             tasks.append(self._reconnect_task)
         await asyncio.gather(*tasks)
+        await self.metrics.close()
 
     async def _connect(self) -> None:
         """
@@ -253,8 +405,11 @@ class AlertStreamer:
         async for websocket in connect(self.base_url, additional_headers=headers):
             self._websocket = websocket
             self._heartbeat_task = asyncio.create_task(self._heartbeat())
+            self._connected.set()
             logger.debug("Websocket connection established.")
 
+            if reconnecting:
+                self.metrics.reconnects += 1
             if reconnecting and self.reconnect_fn is not None:
                 self._reconnect_task = asyncio.create_task(
                     self.reconnect_fn(self, *self.reconnect_args)
@@ -262,8 +417,10 @@ class AlertStreamer:
             try:
                 async for raw_message in websocket:
                     logger.debug("raw message: %s", raw_message)
-                    data = json.loads(raw_message)
+                    self.metrics.bytes_received += _frame_size(raw_message)
+                    data = json_loads(raw_message)
                     type_str = data.get("type")
+                    self.metrics.frames[type_str or data.get("action", "")] += 1
                     if type_str is not None:
                         await self._map_message(type_str, data["data"])
             except ConnectionClosed as e:
@@ -284,7 +441,7 @@ class AlertStreamer:
 
         :param alert_class: the type of alert to listen for, should be of :any:`AlertType`
         """
-        cls_str = next(k for k, v in MAP_ALERTS.items() if v == alert_class)
+        cls_str = MAP_ALERTS_REVERSE[alert_class]
         while True:
             yield await self._queues[cls_str].get()
 
@@ -296,7 +453,12 @@ class AlertStreamer:
             raise NotImplementedError(
                 f"Unknown message type {type_str} received: {data}"
             )
-        await self._queues[type_str].put(MAP_ALERTS[type_str](**data))
+        start = perf_counter()
+        alert = MAP_ALERTS[type_str](**data)
+        self.metrics.decode_us[type_str].record((perf_counter() - start) * 1e6)
+        self.metrics.events[type_str] += 1
+        if await _put(self._queues[type_str], alert, self._policies[type_str]):
+            self.dropped[type_str] += 1
 
     async def subscribe_accounts(self, accounts: list[Account]) -> None:
         """
@@ -355,7 +517,134 @@ class AlertStreamer:
         if value:
             message["value"] = value
         logger.debug("sending alert subscription: %s", message)
-        await self._websocket.send(json.dumps(message))  # type: ignore
+        await self._websocket.send(json_dumps(message))  # type: ignore
+
+
+def _decode_feed_data(
+    message: list,
+    batch_types: Container[str],
+    event_fields: Optional[dict[str, list[str]]] = None,
+    compact: bool = False,
+    partial: bool = False,
+) -> tuple[str, Union[EventBatch, list[Any]]]:
+    """
+    Decodes the data of a FEED_DATA message into events (compact ones if
+    `compact` is set), or into a single :class:`~tastytrade.dxfeed.EventBatch`
+    for types in `batch_types`, using the fields the channel was configured
+    with (from its FEED_CONFIG). `partial` allows the fields to leave out
+    required ones, for channels set up with a subset of the fields.
+    """
+    if isinstance(message[0], str):
+        msg_type = message[0]
+    else:
+        msg_type = message[0][0]
+    data = message[1]
+    # parse type or warn for unknown type
+    if msg_type not in MAP_EVENTS:
+        raise NotImplementedError(f"Unknown message type {msg_type} received: {data}")
+    cls = MAP_EVENTS[msg_type]
+    fields = event_fields.get(msg_type) if event_fields else None
+    if msg_type in batch_types:
+        return msg_type, EventBatch.from_stream(cls, data, fields)
+    if compact:
+        return msg_type, compact_class(cls).from_stream(data, fields)
+    return msg_type, cls.from_stream(data, fields, partial)
+
+
+def _decode_raw_feed_data(
+    raw_message: str,
+    batch_types: frozenset[str],
+    event_fields: dict[int, dict[str, list[str]]],
+    default_channels: frozenset[int],
+    compact: bool = False,
+) -> tuple[str, Union[EventBatch, list[Any]]]:
+    """
+    Parses and decodes a raw FEED_DATA message; runs in a decode executor.
+    """
+    message = json_loads(raw_message)
+    channel = message.get("channel", 0)
+    return _decode_feed_data(
+        message["data"],
+        batch_types,
+        event_fields.get(channel),
+        compact,
+        channel not in default_channels,
+    )
+
+
+async def _fetch_candles(
+    streamer: Union["DXLinkStreamer", "ShardedDXLinkStreamer"],
+    symbols: list[str],
+    interval: str,
+    start_time: datetime,
+    end_time: Optional[datetime],
+    extended_trading_hours: bool,
+    max_concurrent: int,
+    timeout: float,
+) -> dict[str, CandleSeries]:
+    """
+    Fetches the candle history of each symbol by subscribing to it, waiting
+    for its snapshot to be complete and unsubscribing again (unless it was
+    already subscribed to), with up to `max_concurrent` symbols in flight at
+    once. If any symbol fails, the others are cancelled.
+    """
+    if not symbols:
+        return {}
+    event_symbols = {
+        (
+            f"{ticker}{{={interval}}}"
+            if extended_trading_hours
+            else f"{ticker}{{={interval},tho=true}}"
+        ): ticker
+        for ticker in symbols
+    }
+    # symbols the caller was already subscribed to, which are left that way
+    existing = {
+        symbol
+        for symbol, ticker in event_symbols.items()
+        if streamer._has_candle_subscription(ticker, interval, extended_trading_hours)
+    }
+    assembler: SnapshotAssembler[Candle] = SnapshotAssembler()
+    ended: set[str] = set()
+    finished = {symbol: asyncio.Event() for symbol in event_symbols}
+
+    def on_candle(candle: Candle) -> None:
+        symbol = candle.event_symbol
+        if candle.event_flags & (SNAPSHOT_END | SNAPSHOT_SNIP):
+            ended.add(symbol)
+        if assembler.process(candle) and symbol in ended:
+            finished[symbol].set()
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def fetch(symbol: str, ticker: str) -> None:
+        async with semaphore:
+            try:
+                await streamer.subscribe_candle(
+                    [ticker], interval, start_time, extended_trading_hours
+                )
+                await asyncio.wait_for(finished[symbol].wait(), timeout)
+            except asyncio.TimeoutError:
+                raise TastytradeError(f"Timed out fetching candles for {ticker}!")
+            finally:
+                if symbol not in existing:
+                    await streamer.unsubscribe_candle(
+                        ticker, interval, extended_trading_hours
+                    )
+
+    streamer.add_listener(Candle, list(event_symbols), on_candle)
+    try:
+        await _gather_or_cancel(*(fetch(s, t) for s, t in event_symbols.items()))
+    finally:
+        streamer.remove_listener(Candle, on_candle)
+    end = int(end_time.timestamp() * 1000) if end_time is not None else None
+    results = {}
+    for symbol, ticker in event_symbols.items():
+        series = results[ticker] = CandleSeries()
+        for candle in assembler.snapshot(symbol) or []:
+            if end is None or candle.time < end:
+                series.add(candle)
+    return results
 
 
 class DXLinkStreamer:
@@ -381,6 +670,49 @@ class DXLinkStreamer:
 
         streamer = await DXLinkStreamer(session)
 
+    If the consumer only cares about the current state of each symbol, pass
+    `conflate=True`: for each event type, only the latest event per symbol is
+    kept, which can be read at any time with :meth:`latest`, and the events
+    that changed since they were last read can be drained with
+    :meth:`get_updates`. :meth:`listen` and :meth:`get_event` then skip over
+    stale events.
+
+    Otherwise, events are queued until they're consumed. To bound memory use,
+    pass `queue_size`, either as an int for all types or as a dict of event
+    classes to sizes, along with an :class:`OverflowPolicy` (again, once or
+    per class) deciding what happens when a queue is full. The number of
+    events discarded or conflated for each type is kept in :attr:`dropped`
+    and :attr:`conflated`.
+
+    To keep the event loop responsive under heavy load, pass a
+    :class:`~concurrent.futures.ProcessPoolExecutor` as `decode_executor`:
+    FEED_DATA messages are then parsed and decoded in the worker processes,
+    and the decoded events are delivered in the order they were received.
+
+    If the connection drops, the streamer reconnects, reopens its channels
+    and restores every active subscription on its own; candle subscriptions
+    resume from the last candle received. Code that resubscribes in
+    `reconnect_fn` instead should pass `restore_subscriptions=False`, so
+    nothing is subscribed to twice.
+
+    To capture the feed for replaying later with a :class:`ReplayStreamer`,
+    pass a :class:`~tastytrade.recording.FeedRecorder` as `recorder`.
+
+    When holding many live events in memory, pass `compact_events=True` to
+    receive slotted :class:`~tastytrade.dxfeed.CompactEvent` objects with
+    float prices instead of pydantic models; each can be converted back with
+    :meth:`~tastytrade.dxfeed.CompactEvent.to_event`. They're then read with
+    the compact variants of the usual methods, e.g. :meth:`listen_compact`
+    and :meth:`latest_compact`, and the regular ones raise an error.
+
+    To keep the candles received in time-sorted, deduplicated columns, pass a
+    :class:`~tastytrade.candles.CandleStore` as `candle_store`.
+
+    To merge the events of several connections, pass the streamer they should
+    be delivered to as `share_with`: this streamer then uses its queues,
+    listeners, latest values and counters instead of its own, and ignores
+    `conflate`, `queue_size` and `overflow_policy`.
+
     """
 
     def __init__(
@@ -389,8 +721,35 @@ class DXLinkStreamer:
         reconnect_args: tuple[Any, ...] = (),
         reconnect_fn: Optional[Callable[..., Coroutine[Any, Any, None]]] = None,
         ssl_context: SSLContext = create_default_context(),
+        conflate: bool = False,
+        queue_size: Union[int, dict[Type[EventType], int]] = 0,
+        overflow_policy: Union[
+            OverflowPolicy, dict[Type[EventType], OverflowPolicy]
+        ] = OverflowPolicy.BLOCK,
+        subscription_delay_ms: float = 0,
+        decode_executor: Optional[Executor] = None,
+        recorder: Optional[FeedRecorder] = None,
+        compact_events: bool = False,
+        candle_store: Optional[CandleStore] = None,
+        connect_timeout: float = 10,
+        channel_timeout: float = 10,
+        share_with: Optional["DXLinkStreamer"] = None,
+        restore_subscriptions: bool = True,
     ):
-        self._queues: dict[str, Queue] = defaultdict(Queue)
+        if share_with is not None:
+            # everything events are delivered to, along with their counters
+            self._sizes = share_with._sizes
+            self._policies = share_with._policies
+            self._queues = share_with._queues
+            self.dropped = share_with.dropped
+            self._latest = share_with._latest
+            self._batch_queues = share_with._batch_queues
+            self._routes = share_with._routes
+            self._listener_queues = share_with._listener_queues
+            self._listener_conflated = share_with._listener_conflated
+            self.metrics = share_with.metrics
+        else:
+            self._init_delivery(conflate, queue_size, overflow_policy)
         self._channels: dict[str, int] = {
             "Candle": 1,
             "Greeks": 3,
@@ -402,27 +761,139 @@ class DXLinkStreamer:
             "Trade": 15,
             "Underlying": 17,
         }
-        self._subscription_state: dict[str, str] = defaultdict(lambda: "CHANNEL_CLOSED")
-        #: An async function to be called upon reconnection. The first argument must be
-        #: of type `DXLinkStreamer` and will be a reference to the streamer object.
+        self._default_channels = frozenset(self._channels.values())
+        # event type of each channel, including any allocated later on
+        self._channel_types: dict[int, str] = {v: k for k, v in self._channels.items()}
+        # channels allocated for non-default feed settings, and their settings
+        self._feeds: dict[tuple[str, Optional[float], Optional[tuple]], int] = {}
+        self._feed_settings: dict[int, tuple[Optional[float], Optional[list[str]]]] = {}
+        # fields of each event type sent on each channel, from FEED_CONFIG
+        self._event_fields: dict[int, dict[str, list[str]]] = {}
+        self._subscription_state: dict[int, str] = defaultdict(lambda: "CHANNEL_CLOSED")
+        # active subscriptions on each channel, by symbol, to restore on reconnect
+        self._subscriptions: dict[int, dict[str, dict[str, Any]]] = defaultdict(dict)
+        # time of the latest candle received for each candle symbol
+        self._candle_times: dict[str, int] = {}
+        # handlers for each type of message received from the server
+        self._handlers: dict[
+            str, Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
+        ] = {
+            "SETUP": self._on_setup,
+            "AUTH_STATE": self._on_auth_state,
+            "CHANNEL_OPENED": self._on_channel_opened,
+            "CHANNEL_CLOSED": self._on_channel_closed,
+            "FEED_CONFIG": self._on_feed_config,
+            "FEED_DATA": self._on_feed_data,
+            "KEEPALIVE": self._on_keepalive,
+        }
+        self._reconnecting = False
+        #: An async function to be called upon reconnection, once subscriptions have
+        #: been restored. The first argument must be of type `DXLinkStreamer` and
+        #: will be a reference to the streamer object.
         self.reconnect_fn = reconnect_fn
         #: Variable number of arguments to pass to the reconnect function
         self.reconnect_args = reconnect_args
+        #: whether to restore subscriptions after reconnecting; if not, they're
+        #: forgotten and it's up to the reconnect function to subscribe again
+        self.restore_subscriptions = restore_subscriptions
 
         self._authenticated = False
+        #: seconds to wait for the connection to be authorized
+        self.connect_timeout = connect_timeout
+        #: seconds to wait for the server to open a channel
+        self.channel_timeout = channel_timeout
+        # resolved when the connection is authorized, and when each channel opens
+        self._authorized: Optional[asyncio.Future] = None
+        self._channel_waiters: dict[int, asyncio.Future] = {}
+        # in-progress channel openings, shared by concurrent subscribes
+        self._opening: dict[int, asyncio.Task] = {}
         self._wss_url = session.dxlink_url
         self._auth_token = session.streamer_token
         self._ssl_context = ssl_context
         self._reconnect_task = None
+        # subscription changes not yet sent, keyed by channel and symbol, along
+        # with whether the server had the symbol before the changes
+        self._pending: dict[int, dict[str, tuple[str, dict[str, Any], bool]]] = (
+            defaultdict(dict)
+        )
+        #: milliseconds to wait for more subscription changes before sending; if
+        #: 0, each change is sent right away
+        self.subscription_delay_ms = subscription_delay_ms
+        self._flush_task: Optional[asyncio.Task] = None
+        self._decode_executor = decode_executor
+        self._recorder = recorder
+        self._compact_events = compact_events
+        self._candle_store = candle_store
+        # decoded FEED_DATA messages, in the order they were received
+        self._decoded: Queue[asyncio.Future] = Queue(maxsize=1024)
+        self._dispatch_task: Optional[asyncio.Task] = None
+
+    def _init_delivery(
+        self,
+        conflate: bool,
+        queue_size: Union[int, dict[Type[EventType], int]],
+        overflow_policy: Union[OverflowPolicy, dict[Type[EventType], OverflowPolicy]],
+    ) -> None:
+        """
+        Creates the queues, listeners and counters events are delivered to,
+        which are shared with any streamers created with `share_with`.
+        """
+        self._sizes = _per_type(queue_size, MAP_EVENTS_REVERSE, 0)
+        self._policies = _per_type(
+            OverflowPolicy.CONFLATE if conflate else overflow_policy,
+            MAP_EVENTS_REVERSE,
+            OverflowPolicy.BLOCK,
+        )
+        self._queues: dict[str, Queue] = {
+            name: self._new_queue(name) for name in MAP_EVENTS
+        }
+        #: number of events of each type discarded because the queue was full
+        self.dropped: dict[str, int] = defaultdict(int)
+        # latest event per symbol for each event type, when conflating any type
+        self._latest: Optional[dict[str, dict[str, Any]]] = (
+            defaultdict(dict)
+            if any(p == OverflowPolicy.CONFLATE for p in self._policies.values())
+            else None
+        )
+        self._batch_queues: dict[str, Queue] = {}
+        # functions (or listener queues) to route events to, by type and symbol
+        self._routes: dict[str, dict[str, list[Union[Callable[[Any], Any], Queue]]]] = (
+            defaultdict(lambda: defaultdict(list))
+        )
+        # queues of listeners with symbols, and how many events the closed ones
+        # conflated
+        self._listener_queues: dict[str, set[Queue]] = defaultdict(set)
+        self._listener_conflated: dict[str, int] = defaultdict(int)
+        #: counters and histograms describing the messages and events received
+        self.metrics = StreamerMetrics()
+        self.metrics.add_gauge(
+            "queue_depths", lambda: {k: q.qsize() for k, q in self._queues.items()}
+        )
+        self.metrics.add_gauge("dropped", lambda: dict(self.dropped))
+        self.metrics.add_gauge("conflated", lambda: self.conflated)
+
+    def _new_queue(self, name: str) -> Queue:
+        """
+        Creates a queue for events of the given type, with the size and
+        overflow policy the streamer was created with.
+        """
+        if self._policies[name] == OverflowPolicy.CONFLATE:
+            return ConflatingQueue(maxsize=self._sizes[name])
+        return Queue(maxsize=self._sizes[name])
 
     async def __aenter__(self):
+        self._authorized = asyncio.get_running_loop().create_future()
         self._connect_task = asyncio.create_task(self._connect())
-        time_out = 100
-        while not self._authenticated:
-            await asyncio.sleep(0.1)
-            time_out -= 1
-            if time_out < 0:
-                raise TastytradeError("Connection timed out")
+        await asyncio.wait(
+            [self._authorized, self._connect_task],
+            timeout=self.connect_timeout,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if not self._authenticated:
+            if self._connect_task.done():
+                self._connect_task.result()  # raise the error, if any
+            self._connect_task.cancel()
+            raise TastytradeError("Connection timed out")
 
         return self
 
@@ -439,62 +910,58 @@ class DXLinkStreamer:
         self._connect_task.cancel()
         self._heartbeat_task.cancel()
         tasks = [self._connect_task, self._heartbeat_task]
-        if self._reconnect_task is not None and not self._reconnect_task.done():
-            self._reconnect_task.cancel()
-            tasks.append(self._reconnect_task)
-        await asyncio.gather(*tasks)
+        for task in (
+            self._reconnect_task,
+            self._flush_task,
+            self._dispatch_task,
+            *self._opening.values(),
+        ):
+            if task is not None and not task.done():
+                task.cancel()
+                tasks.append(task)
+        # cancelled tasks that don't handle cancellation themselves raise here
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error while closing streamer", exc_info=result)
+        await self.metrics.close()
 
     async def _connect(self) -> None:
         """
         Connect to the websocket server using the URL and
         authorization token provided during initialization.
         """
-        reconnecting = False
-        async for websocket in connect(self._wss_url, ssl=self._ssl_context):
+        self._reconnecting = False
+        # plain ws:// URLs are only used for local testing
+        ssl = self._ssl_context if self._wss_url.startswith("wss") else None
+        async for websocket in connect(self._wss_url, ssl=ssl):
             self._websocket = websocket
             await self._setup_connection()
+            metrics = self.metrics
             try:
                 async for raw_message in websocket:
-                    message = json.loads(raw_message)
+                    metrics.bytes_received += _frame_size(raw_message)
+                    # FEED_DATA, and FEED_CONFIG to know how to decode it later
+                    if (
+                        self._recorder is not None
+                        and isinstance(raw_message, str)
+                        and '"FEED_' in raw_message
+                    ):
+                        self._recorder.record(raw_message)
+                    if (
+                        self._decode_executor is not None
+                        and isinstance(raw_message, str)
+                        and _FEED_DATA_PREFIX.match(raw_message)
+                    ):
+                        metrics.frames["FEED_DATA"] += 1
+                        await self._offload(raw_message)
+                        continue
+                    message = json_loads(raw_message)
                     logger.debug("received: %s", message)
-                    if message["type"] == "SETUP":
-                        await self._authenticate_connection()
-                    elif message["type"] == "AUTH_STATE":
-                        if message["state"] == "AUTHORIZED":
-                            logger.debug("Websocket connection established.")
-                            self._authenticated = True
-                            self._heartbeat_task = asyncio.create_task(
-                                self._heartbeat()
-                            )
-                        # run reconnect hook upon auth completion
-                        if reconnecting and self.reconnect_fn is not None:
-                            self._subscription_state.clear()
-                            reconnecting = False
-                            self._reconnect_task = asyncio.create_task(
-                                self.reconnect_fn(self, *self.reconnect_args)
-                            )
-                    elif message["type"] == "CHANNEL_OPENED":
-                        channel = next(
-                            k
-                            for k, v in self._channels.items()
-                            if v == message["channel"]
-                        )
-                        self._subscription_state[channel] = "CHANNEL_OPENED"
-                        logger.debug("Channel opened: %s", message)
-                    elif message["type"] == "CHANNEL_CLOSED":
-                        channel = next(
-                            k
-                            for k, v in self._channels.items()
-                            if v == message["channel"]
-                        )
-                        del self._subscription_state[channel]
-                        logger.debug("Channel closed: %s", message)
-                    elif message["type"] == "FEED_CONFIG":
-                        logger.debug("Feed configured: %s", message)
-                    elif message["type"] == "FEED_DATA":
-                        await self._map_message(message["data"])
-                    elif message["type"] == "KEEPALIVE":
-                        pass
+                    metrics.frames[message["type"]] += 1
+                    handler = self._handlers.get(message["type"])
+                    if handler is not None:
+                        await handler(message)
                     else:
                         logger.error(f"Streamer error: {message}")
             except ConnectionClosed as e:
@@ -508,7 +975,92 @@ class DXLinkStreamer:
                 logger.debug("Websocket interrupted, cancelling main loop.")
                 return
             logger.debug("Websocket connection closed, retrying...")
-            reconnecting = True
+            self._reconnecting = True
+
+    async def _on_setup(self, message: dict[str, Any]) -> None:
+        await self._authenticate_connection()
+
+    async def _on_auth_state(self, message: dict[str, Any]) -> None:
+        if message["state"] == "AUTHORIZED":
+            logger.debug("Websocket connection established.")
+            self._authenticated = True
+            if self._authorized is not None and not self._authorized.done():
+                self._authorized.set_result(None)
+            self._heartbeat_task = asyncio.create_task(self._heartbeat())
+            # restore subscriptions and run reconnect hook upon auth completion
+            if self._reconnecting:
+                self.metrics.reconnects += 1
+                self._subscription_state.clear()
+                self._reconnecting = False
+                self._reconnect_task = asyncio.create_task(self._resubscribe())
+
+    async def _resubscribe(self) -> None:
+        """
+        Reopens the channels that had subscriptions when the connection was
+        lost and subscribes to everything again, in chunks, then calls the
+        reconnect hook. Candles resume from the last one received instead of
+        fetching the whole history again.
+        """
+        self._pending.clear()
+        self._opening.clear()
+        if not self.restore_subscriptions:
+            self._subscriptions.clear()
+            self._candle_times.clear()
+        channels = [c for c, subs in self._subscriptions.items() if subs]
+        await asyncio.gather(*(self._ensure_channel(c) for c in channels))
+        for channel in channels:
+            subscriptions = self._subscriptions[channel]
+            entries = []
+            for symbol, entry in subscriptions.items():
+                last = self._candle_times.get(symbol)
+                if last is not None and last > entry.get("fromTime", last):
+                    entry = subscriptions[symbol] = {**entry, "fromTime": last}
+                entries.append(entry)
+            await self._send_subscription(channel, "add", entries)
+        if self.reconnect_fn is not None:
+            await self.reconnect_fn(self, *self.reconnect_args)
+
+    async def _on_channel_opened(self, message: dict[str, Any]) -> None:
+        self._subscription_state[message["channel"]] = "CHANNEL_OPENED"
+        waiter = self._channel_waiters.pop(message["channel"], None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+        logger.debug("Channel opened: %s", message)
+
+    async def _on_channel_closed(self, message: dict[str, Any]) -> None:
+        self._subscription_state.pop(message["channel"], None)
+        logger.debug("Channel closed: %s", message)
+
+    async def _on_feed_config(self, message: dict[str, Any]) -> None:
+        logger.debug("Feed configured: %s", message)
+        # data is sent in the order of the fields agreed on, not requested
+        if "eventFields" in message:
+            self._event_fields[message["channel"]] = message["eventFields"]
+
+    async def _on_feed_data(self, message: dict[str, Any]) -> None:
+        channel = message["channel"]
+        await self._map_message(
+            message["data"],
+            self._event_fields.get(channel),
+            channel not in self._default_channels,
+        )
+
+    async def _on_keepalive(self, message: dict[str, Any]) -> None:
+        pass
+
+    def _allocate_channel(self, event_type: str) -> int:
+        """
+        Reserves a new channel number for the given event type, in addition to
+        its default channel, so that events of the same type can be received
+        with different feed settings.
+
+        :param event_type: the name of the event type the channel is for
+
+        :return: the new channel number
+        """
+        channel = max(self._channel_types) + 2
+        self._channel_types[channel] = event_type
+        return channel
 
     async def _setup_connection(self) -> None:
         message = {
@@ -518,7 +1070,7 @@ class DXLinkStreamer:
             "acceptKeepaliveTimeout": 60,
             "version": DXLINK_VERSION,
         }
-        await self._websocket.send(json.dumps(message))
+        await self._websocket.send(json_dumps(message))
 
     async def _authenticate_connection(self) -> None:
         message = {
@@ -526,22 +1078,255 @@ class DXLinkStreamer:
             "channel": 0,
             "token": self._auth_token,
         }
-        await self._websocket.send(json.dumps(message))
+        await self._websocket.send(json_dumps(message))
 
-    async def listen(self, event_class: Type[U]) -> AsyncIterator[U]:
+    def listen(
+        self, event_class: Type[U], symbols: Optional[list[str]] = None
+    ) -> AsyncIterator[U]:
         """
         Using the existing subscriptions, pulls events of the given type and
         yield returns them. Never exits unless there's an error or the channel
         is closed.
 
+        If `symbols` is given, only events for those symbols are yielded, from
+        a queue of this listener's own, so several consumers interested in
+        different symbols can share the streamer without seeing each other's
+        events. Events for symbols with a listener of their own aren't put in
+        the shared queue used by :meth:`get_event` and by listeners without
+        `symbols`. The listener's queue has the same size and overflow policy
+        as the shared one.
+
         This is designed to be friendly for type checking; the return
         type will be the same class you pass in.
 
         :param event_class: the type of alert to listen for, should be of :any:`EventType`
+        :param symbols: the symbols to listen for; defaults to all of them
         """
+        return self._listen(event_class, symbols, False)
+
+    def listen_compact(
+        self, event_class: Type[EventType], symbols: Optional[list[str]] = None
+    ) -> AsyncIterator[CompactEvent]:
+        """
+        Like :meth:`listen`, for streamers created with `compact_events=True`,
+        yielding the compact version of the given event type.
+
+        :param event_class: the type of event to listen for, should be of :any:`EventType`
+        :param symbols: the symbols to listen for; defaults to all of them
+        """
+        return self._listen(event_class, symbols, True)
+
+    def _check_compact(self, compact: bool) -> None:
+        if compact and not self._compact_events:
+            raise TastytradeError(
+                "Streamer must be created with `compact_events=True`!"
+            )
+        if not compact and self._compact_events:
+            raise TastytradeError(
+                "Streamer was created with `compact_events=True`, use the compact "
+                "methods instead, e.g. `listen_compact`!"
+            )
+
+    async def _listen(
+        self,
+        event_class: Type[EventType],
+        symbols: Optional[list[str]],
+        compact: bool,
+    ) -> AsyncIterator[Any]:
+        self._check_compact(compact)
         cls_str = MAP_EVENTS_REVERSE[event_class]
-        while True:
-            yield await self._queues[cls_str].get()
+        if symbols is None:
+            while True:
+                yield await self._queues[cls_str].get()
+        queue = self._new_queue(cls_str)
+        routes = self._routes[cls_str]
+        for symbol in symbols:
+            routes[symbol].append(queue)
+        self._listener_queues[cls_str].add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._remove_route(cls_str, queue)
+            self._listener_queues[cls_str].discard(queue)
+            if isinstance(queue, ConflatingQueue):
+                self._listener_conflated[cls_str] += queue.conflated
+
+    def add_listener(
+        self,
+        event_class: Type[U],
+        symbols: list[str],
+        callback: Callable[[U], Any],
+    ) -> None:
+        """
+        Registers a function to be called with each event of the given type
+        for any of the given symbols, as soon as it's decoded. The callback
+        runs on the event loop, so it shouldn't block; any exception it raises
+        is logged. Like listeners created by :meth:`listen` with `symbols`,
+        these events aren't put in the shared queue.
+
+        :param event_class: the type of event to listen for, should be of :any:`EventType`
+        :param symbols: the symbols to call the function for
+        :param callback: the function to call with each event
+        """
+        routes = self._routes[MAP_EVENTS_REVERSE[event_class]]
+        for symbol in symbols:
+            routes[symbol].append(callback)
+
+    def remove_listener(
+        self, event_class: Type[EventType], callback: Callable[[Any], Any]
+    ) -> None:
+        """
+        Stops calling a function registered with :meth:`add_listener`.
+
+        :param event_class: the type of event the function was registered for
+        :param callback: the function to stop calling
+        """
+        self._remove_route(MAP_EVENTS_REVERSE[event_class], callback)
+
+    def _remove_route(
+        self, event_type: str, subscriber: Union[Callable[[Any], Any], Queue]
+    ) -> None:
+        routes = self._routes[event_type]
+        for symbol in list(routes):
+            subscribers = [s for s in routes[symbol] if s != subscriber]
+            if subscribers:
+                routes[symbol] = subscribers
+            else:
+                del routes[symbol]
+
+    async def listen_batches(
+        self,
+        event_class: Type[EventType],
+        max_rows: int = 10_000,
+        max_latency_ms: float = 100,
+    ) -> AsyncIterator[EventBatch]:
+        """
+        Using the existing subscriptions, pulls events of the given type and
+        yield returns them in columnar batches, decoded straight from the
+        stream without creating an object per event. While this is being
+        iterated, events of this type aren't delivered to :meth:`listen`,
+        :meth:`get_event` or :meth:`get_event_nowait`.
+
+        Batches are queued up to `queue_size` (counting batches, not events)
+        according to the streamer's :class:`OverflowPolicy`, except that
+        conflating types block instead. Stop listening by closing the
+        iterator, e.g. with :func:`contextlib.aclosing`, rather than just
+        dropping it.
+
+        :param event_class: the type of event to listen for, should be of :any:`EventType`
+        :param max_rows: the maximum number of events in each batch
+        :param max_latency_ms:
+            the longest time to wait for more events after the first event in a
+            batch arrives before yielding it
+        """
+        cls_str = MAP_EVENTS_REVERSE[event_class]
+        if cls_str in self._batch_queues:
+            raise TastytradeError(f"Already listening to {cls_str} batches!")
+        queue = self._batch_queues[cls_str] = Queue(maxsize=self._sizes[cls_str])
+        loop = asyncio.get_running_loop()
+        pending: list[EventBatch] = []
+        rows = 0
+        try:
+            while True:
+                if not pending:
+                    pending.append(await queue.get())
+                    rows = len(pending[0])
+                deadline = loop.time() + max_latency_ms / 1000
+                while rows < max_rows:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    pending.append(batch)
+                    rows += len(batch)
+                batch = EventBatch.concat(pending)
+                # anything past max_rows starts the next batch
+                pending = [batch.slice(max_rows)] if rows > max_rows else []
+                rows = max(rows - max_rows, 0)
+                yield batch.slice(0, max_rows) if pending else batch
+        finally:
+            del self._batch_queues[cls_str]
+
+    @property
+    def conflated(self) -> dict[str, int]:
+        """
+        The number of events of each type replaced by a newer event for the
+        same symbol before being consumed.
+        """
+        counts = defaultdict(int, self._listener_conflated)
+        for name, queue in self._queues.items():
+            for q in (queue, *self._listener_queues.get(name, ())):
+                if isinstance(q, ConflatingQueue):
+                    counts[name] += q.conflated
+        return dict(counts)
+
+    def latest(self, event_class: Type[U], symbol: str) -> Optional[U]:
+        """
+        Returns the most recent event of the given type received for the
+        symbol, or None if there hasn't been one yet. Only available when the
+        streamer was created with `conflate=True` or a
+        :attr:`OverflowPolicy.CONFLATE` policy.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        :param symbol: the symbol to get the event for
+        """
+        return self._latest_event(event_class, symbol, False)
+
+    def latest_compact(
+        self, event_class: Type[EventType], symbol: str
+    ) -> Optional[CompactEvent]:
+        """
+        Like :meth:`latest`, for streamers created with `compact_events=True`.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        :param symbol: the symbol to get the event for
+        """
+        return self._latest_event(event_class, symbol, True)
+
+    def _latest_event(
+        self, event_class: Type[EventType], symbol: str, compact: bool
+    ) -> Any:
+        self._check_compact(compact)
+        if self._latest is None:
+            raise TastytradeError("Streamer must be created with conflation enabled!")
+        return self._latest[MAP_EVENTS_REVERSE[event_class]].get(symbol)
+
+    def get_updates(self, event_class: Type[U]) -> dict[str, U]:
+        """
+        Returns the most recent event for each symbol which has received events
+        of the given type since it was last read, by this method or otherwise.
+        Only available when the streamer was created with `conflate=True` or a
+        :attr:`OverflowPolicy.CONFLATE` policy.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        """
+        return self._updates(event_class, False)
+
+    def get_compact_updates(
+        self, event_class: Type[EventType]
+    ) -> dict[str, CompactEvent]:
+        """
+        Like :meth:`get_updates`, for streamers created with
+        `compact_events=True`.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        """
+        return self._updates(event_class, True)
+
+    def _updates(self, event_class: Type[EventType], compact: bool) -> dict[str, Any]:
+        self._check_compact(compact)
+        if self._latest is None:
+            raise TastytradeError("Streamer must be created with conflation enabled!")
+        queue = self._queues[MAP_EVENTS_REVERSE[event_class]]
+        updates = {}
+        while not queue.empty():
+            event = queue.get_nowait()
+            updates[event.event_symbol] = event
+        return updates
 
     def get_event_nowait(self, event_class: Type[U]) -> Optional[U]:
         """
@@ -553,6 +1338,21 @@ class DXLinkStreamer:
 
         :param event_class: the type of alert to listen for, should be of :any:`EventType`
         """
+        return self._event_nowait(event_class, False)
+
+    def get_compact_event_nowait(
+        self, event_class: Type[EventType]
+    ) -> Optional[CompactEvent]:
+        """
+        Like :meth:`get_event_nowait`, for streamers created with
+        `compact_events=True`.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        """
+        return self._event_nowait(event_class, True)
+
+    def _event_nowait(self, event_class: Type[EventType], compact: bool) -> Any:
+        self._check_compact(compact)
         cls_str = MAP_EVENTS_REVERSE[event_class]
         try:
             return self._queues[cls_str].get_nowait()
@@ -569,6 +1369,17 @@ class DXLinkStreamer:
 
         :param event_class: the type of alert to listen for, should be of :any:`EventType`
         """
+        self._check_compact(False)
+        cls_str = MAP_EVENTS_REVERSE[event_class]
+        return await self._queues[cls_str].get()
+
+    async def get_compact_event(self, event_class: Type[EventType]) -> CompactEvent:
+        """
+        Like :meth:`get_event`, for streamers created with `compact_events=True`.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        """
+        self._check_compact(True)
         cls_str = MAP_EVENTS_REVERSE[event_class]
         return await self._queues[cls_str].get()
 
@@ -581,32 +1392,170 @@ class DXLinkStreamer:
         try:
             while True:
                 logger.debug("sending keepalive message: %s", message)
-                await self._websocket.send(json.dumps(message))
+                await self._websocket.send(json_dumps(message))
                 # send the heartbeat every 30 seconds
                 await asyncio.sleep(30)
         except asyncio.CancelledError:
             logger.debug("Websocket interrupted, cancelling heartbeat.")
             return
 
-    async def subscribe(self, event_class: Type[EventType], symbols: list[str]) -> None:
+    async def subscribe(
+        self,
+        event_class: Type[EventType],
+        symbols: list[str],
+        aggregation_period: Optional[float] = None,
+        fields: Optional[list[str]] = None,
+    ) -> None:
         """
         Subscribes to quotes for given list of symbols. Used for recurring data
         feeds.
         For candles, use :meth:`subscribe_candle` instead.
 
+        Subscriptions with a different aggregation period or fields than the
+        defaults get a channel of their own, shared by all subscriptions with
+        the same settings.
+
         :param event_class: type of subscription to add, should be of :any:`EventType`
         :param symbols: list of symbols to subscribe for
+        :param aggregation_period:
+            the minimum time in seconds between updates for each symbol; events
+            in between are conflated by the server. Defaults to 10.
+        :param fields:
+            the names of the fields to receive, e.g. ``["bid_price", "ask_price"]``;
+            the symbol and event time are always included and other fields will
+            be None. Defaults to all fields.
         """
         cls_str = MAP_EVENTS_REVERSE[event_class]
-        if self._subscription_state[cls_str] != "CHANNEL_OPENED":
-            await self._channel_request(cls_str)
+        channel = self._feed_channel(cls_str, aggregation_period, fields)
+        await self._ensure_channel(channel)
+        await self._queue_subscription(
+            channel, "add", [{"symbol": symbol, "type": cls_str} for symbol in symbols]
+        )
+
+    def _feed_channel(
+        self,
+        event_type: str,
+        aggregation_period: Optional[float],
+        fields: Optional[list[str]],
+    ) -> int:
+        """
+        Finds the channel for events of the given type with the given feed
+        settings, allocating one if there isn't one yet.
+        """
+        if aggregation_period is None and fields is None:
+            return self._channels[event_type]
+        aliases = None
+        if fields is not None:
+            model_fields = MAP_EVENTS[event_type].model_fields
+            unknown = set(fields) - model_fields.keys()
+            if unknown:
+                raise TastytradeError(f"Unknown fields {unknown} for {event_type}!")
+            aliases = [
+                f.alias or name
+                for name, f in model_fields.items()
+                if name in fields or name in ("event_symbol", "event_time")
+            ]
+        key = (event_type, aggregation_period, tuple(aliases) if aliases else None)
+        if key not in self._feeds:
+            channel = self._feeds[key] = self._allocate_channel(event_type)
+            self._feed_settings[channel] = (aggregation_period, aliases)
+        return self._feeds[key]
+
+    def _open_channels(self, event_type: str) -> list[int]:
+        """
+        Returns the default channel for the given event type, along with any
+        other channels for it which are open.
+        """
+        return [
+            channel
+            for channel, channel_type in self._channel_types.items()
+            if channel_type == event_type
+            and (
+                channel == self._channels[event_type]
+                or self._subscription_state[channel] == "CHANNEL_OPENED"
+            )
+        ]
+
+    async def _queue_subscription(
+        self, channel: int, action: str, entries: list[dict[str, Any]]
+    ) -> None:
+        """
+        Adds subscription changes to the pending ones, to be sent together
+        after :attr:`subscription_delay_ms`. Only the last change for each
+        symbol is kept, so removing a symbol and adding it again before the
+        changes are sent results in a single message, and adding a new symbol
+        and removing it again results in none.
+        """
+        pending = self._pending[channel]
+        active = self._subscriptions[channel]
+        for entry in entries:
+            symbol = entry["symbol"]
+            change = pending.get(symbol)
+            sent = change[2] if change is not None else symbol in active
+            if action == "remove" and not sent and change is not None:
+                del pending[symbol]
+            else:
+                pending[symbol] = (action, entry, sent)
+            if action == "add":
+                active[symbol] = entry
+            else:
+                active.pop(symbol, None)
+        if self.subscription_delay_ms <= 0:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.subscription_delay_ms / 1000)
+        try:
+            await self.flush()
+        except Exception:
+            # nobody awaits this task, so the error would otherwise go unseen
+            logger.exception("Failed to send subscriptions")
+
+    async def flush(self) -> None:
+        """
+        Immediately sends any pending subscription changes instead of waiting
+        for :attr:`subscription_delay_ms` to elapse.
+        """
+        pending, self._pending = self._pending, defaultdict(dict)
+        for channel, changes in pending.items():
+            for action in ("remove", "add"):
+                entries = [e for a, e, _ in changes.values() if a == action]
+                if entries:
+                    await self._send_subscription(channel, action, entries)
+
+    async def _send_subscription(
+        self, channel: int, action: str, entries: list[dict[str, Any]]
+    ) -> None:
+        """
+        Sends FEED_SUBSCRIPTION messages adding or removing the given entries,
+        split into as many messages as needed to stay under
+        :data:`MAX_SUBSCRIPTION_SIZE`.
+        """
+        chunk: list[dict[str, Any]] = []
+        size = 0
+        for entry in entries:
+            # generous estimate of the entry's JSON size
+            entry_size = len(entry["symbol"]) + 64
+            if chunk and size + entry_size > MAX_SUBSCRIPTION_SIZE:
+                await self._send_subscription_chunk(channel, action, chunk)
+                chunk, size = [], 0
+            chunk.append(entry)
+            size += entry_size
+        if chunk:
+            await self._send_subscription_chunk(channel, action, chunk)
+
+    async def _send_subscription_chunk(
+        self, channel: int, action: str, entries: list[dict[str, Any]]
+    ) -> None:
         message = {
             "type": "FEED_SUBSCRIPTION",
-            "channel": self._channels[cls_str],
-            "add": [{"symbol": symbol, "type": cls_str} for symbol in symbols],
+            "channel": channel,
+            action: entries,
         }
         logger.debug("sending subscription: %s", message)
-        await self._websocket.send(json.dumps(message))
+        await self._websocket.send(json_dumps(message))
 
     async def unsubscribe_all(self, event_class: Type[EventType]) -> None:
         """
@@ -614,51 +1563,87 @@ class DXLinkStreamer:
 
         :param event_class: type of event to unsubscribe from.
         """
-        message = {
-            "type": "CHANNEL_CANCEL",
-            "channel": self._channels[MAP_EVENTS_REVERSE[event_class]],
-        }
-        logger.debug("sending channel cancel: %s", message)
-        await self._websocket.send(json.dumps(message))
-
-    async def _channel_request(self, event_type: str) -> None:
+        cls_str = MAP_EVENTS_REVERSE[event_class]
+        for channel, event_type in self._channel_types.items():
+            if event_type == cls_str:
+                self._pending.pop(channel, None)
+                self._subscriptions.pop(channel, None)
+        for channel in self._open_channels(cls_str):
+            message = {"type": "CHANNEL_CANCEL", "channel": channel}
+            logger.debug("sending channel cancel: %s", message)
+            await self._websocket.send(json_dumps(message))
+
+    async def _channel_request(self, channel: int) -> None:
         message = {
             "type": "CHANNEL_REQUEST",
-            "channel": self._channels[event_type],
+            "channel": channel,
             "service": "FEED",
             "parameters": {
                 "contract": "AUTO",
             },
         }
+        waiter = self._channel_waiters[channel] = (
+            asyncio.get_running_loop().create_future()
+        )
         logger.debug("sending subscription: %s", message)
-        await self._websocket.send(json.dumps(message))
-        time_out = 100
-        while not self._subscription_state[event_type] == "CHANNEL_OPENED":
-            await asyncio.sleep(0.1)
-            time_out -= 1
-            if time_out <= 0:
-                raise TastytradeError("Subscription channel not opened")
+        await self._websocket.send(json_dumps(message))
+        try:
+            await asyncio.wait_for(waiter, self.channel_timeout)
+        except asyncio.TimeoutError:
+            raise TastytradeError("Subscription channel not opened")
+        finally:
+            self._channel_waiters.pop(channel, None)
         # setup the feed
-        await self._channel_setup(event_type)
+        await self._channel_setup(channel)
 
-    async def _channel_setup(self, event_type: str) -> None:
+    async def _ensure_channel(self, channel: int) -> None:
+        """
+        Opens and sets up the channel unless it's already open. Concurrent
+        calls for the same channel share a single request.
+        """
+        # the channel is marked open as soon as the server says so, before
+        # FEED_SETUP is sent, so an opening in progress has to be waited for
+        task = self._opening.get(channel)
+        if task is None or task.done():
+            if self._subscription_state[channel] == "CHANNEL_OPENED":
+                return
+            task = self._opening[channel] = asyncio.create_task(
+                self._channel_request(channel)
+            )
+        await asyncio.shield(task)
+
+    async def open_channels(self, event_classes: list[Type[EventType]]) -> None:
+        """
+        Opens the default channels for several event types at once, so they
+        take a single round trip to the server instead of one each. Channels
+        are otherwise opened on the first subscription to each type.
+
+        :param event_classes: the types of event to open channels for
+        """
+        await asyncio.gather(
+            *(
+                self._ensure_channel(self._channels[MAP_EVENTS_REVERSE[cls]])
+                for cls in event_classes
+            )
+        )
+
+    async def _channel_setup(self, channel: int) -> None:
+        event_type = self._channel_types[channel]
+        aggregation_period, fields = self._feed_settings.get(channel, (None, None))
         message = {
             "type": "FEED_SETUP",
-            "channel": self._channels[event_type],
-            "acceptAggregationPeriod": 10,
+            "channel": channel,
+            "acceptAggregationPeriod": (
+                10 if aggregation_period is None else aggregation_period
+            ),
             "acceptDataFormat": "COMPACT",
         }
 
-        def dict_from_schema(event_class: Any):
-            schema = event_class.schema()
-            return {schema["title"]: list(schema["properties"].keys())}
-
         cls = MAP_EVENTS[event_type]
-        accept = dict_from_schema(cls)
-        message["acceptEventFields"] = accept
+        message["acceptEventFields"] = {event_type: fields or cls.stream_fields()}
         # send message
         logger.debug("setting up feed: %s", message)
-        await self._websocket.send(json.dumps(message))
+        await self._websocket.send(json_dumps(message))
 
     async def unsubscribe(
         self, event_class: Type[EventType], symbols: list[str]
@@ -673,13 +1658,16 @@ class DXLinkStreamer:
         if not self._authenticated:
             raise TastytradeError("Stream not authenticated")
         cls_str = MAP_EVENTS_REVERSE[event_class]
-        message = {
-            "type": "FEED_SUBSCRIPTION",
-            "channel": self._channels[cls_str],
-            "remove": [{"symbol": symbol, "type": cls_str} for symbol in symbols],
-        }
-        logger.debug("sending subscription: %s", message)
-        await self._websocket.send(json.dumps(message))
+        for channel in self._open_channels(cls_str):
+            # only remove symbols from the channels they were subscribed on
+            active = self._subscriptions[channel]
+            entries = [
+                {"symbol": symbol, "type": cls_str}
+                for symbol in symbols
+                if symbol in active
+            ]
+            if entries:
+                await self._queue_subscription(channel, "remove", entries)
 
     async def subscribe_candle(
         self,
@@ -699,13 +1687,12 @@ class DXLinkStreamer:
         :param end_time: ending time for the data range
         :param extended_trading_hours: whether to include extended trading
         """
-        cls_str = "Candle"
-        if self._subscription_state[cls_str] != "CHANNEL_OPENED":
-            await self._channel_request(cls_str)
-        message = {
-            "type": "FEED_SUBSCRIPTION",
-            "channel": self._channels[cls_str],
-            "add": [
+        channel = self._channels["Candle"]
+        await self._ensure_channel(channel)
+        await self._queue_subscription(
+            channel,
+            "add",
+            [
                 {
                     "symbol": (
                         f"{ticker}{{={interval}}}"
@@ -717,8 +1704,60 @@ class DXLinkStreamer:
                 }
                 for ticker in symbols
             ],
-        }
-        await self._websocket.send(json.dumps(message))
+        )
+
+    async def fetch_candles(
+        self,
+        symbols: list[str],
+        interval: str,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        extended_trading_hours: bool = False,
+        max_concurrent: int = 100,
+        timeout: float = 30,
+    ) -> dict[str, CandleSeries]:
+        """
+        Fetches the candle history for the given symbols, returning once the
+        full history of each has arrived. Symbols are subscribed to in
+        parallel, up to `max_concurrent` at a time, and each is unsubscribed
+        from as soon as its history is complete; the candles aren't delivered
+        to :meth:`listen`. Any existing live subscription to the same candles
+        is kept, though its events go to this method until it returns. If
+        fetching any symbol fails, the rest are cancelled and the error is
+        raised.
+
+        :param symbols: list of symbols to get data for
+        :param interval:
+            the width of each candle in time, e.g. '15s', '5m', '1h', '3d',
+            '1w', '1mo'
+        :param start_time: starting time for the data range
+        :param end_time: ending time for the data range; defaults to now
+        :param extended_trading_hours: whether to include extended trading
+        :param max_concurrent: the most symbols to fetch at once
+        :param timeout: how long to wait for each symbol's history, in seconds
+
+        :return: a :class:`~tastytrade.candles.CandleSeries` for each symbol
+        """
+        return await _fetch_candles(
+            self,
+            symbols,
+            interval,
+            start_time,
+            end_time,
+            extended_trading_hours,
+            max_concurrent,
+            timeout,
+        )
+
+    def _has_candle_subscription(
+        self, ticker: str, interval: str, extended_trading_hours: bool
+    ) -> bool:
+        symbol = (
+            f"{ticker}{{={interval}}}"
+            if extended_trading_hours
+            else f"{ticker}{{={interval},tho=true}}"
+        )
+        return symbol in self._subscriptions[self._channels["Candle"]]
 
     async def unsubscribe_candle(
         self,
@@ -734,41 +1773,790 @@ class DXLinkStreamer:
         :param extended_trading_hours:
             whether candle to unsubscribe from contains extended trading hours
         """
-        message = {
-            "type": "FEED_SUBSCRIPTION",
-            "channel": self._channels["Candle"],
-            "remove": [
-                {
-                    "symbol": (
-                        f"{ticker}{{={interval}}}"
-                        if extended_trading_hours
-                        else f"{ticker}{{={interval},tho=true}}"
-                    ),
-                    "type": "Candle",
-                }
-            ],
-        }
-        await self._websocket.send(json.dumps(message))
+        symbol = (
+            f"{ticker}{{={interval}}}"
+            if extended_trading_hours
+            else f"{ticker}{{={interval},tho=true}}"
+        )
+        # a later subscription to the same candles shouldn't resume from here
+        self._candle_times.pop(symbol, None)
+        await self._queue_subscription(
+            self._channels["Candle"],
+            "remove",
+            [{"symbol": symbol, "type": "Candle"}],
+        )
 
-    async def _map_message(self, message) -> None:
+    async def _offload(self, raw_message: str) -> None:
+        """
+        Sends a raw FEED_DATA message to the decode executor. Results are
+        dispatched in order by a separate task; the queue of pending results
+        is bounded, so a slow executor applies backpressure to the reader.
+        Errors decoding or dispatching earlier messages are raised here, as
+        they would have been had the messages been decoded inline.
+        """
+        task = self._dispatch_task
+        if task is not None and task.done() and not task.cancelled():
+            task.result()
+        if task is None or task.done():
+            self._dispatch_task = asyncio.create_task(self._dispatch_decoded())
+        future = asyncio.get_running_loop().run_in_executor(
+            self._decode_executor,
+            _decode_raw_feed_data,
+            raw_message,
+            frozenset(self._batch_queues),
+            self._event_fields,
+            self._default_channels,
+            self._compact_events,
+        )
+        await self._decoded.put(future)
+
+    async def _dispatch_decoded(self) -> None:
+        while True:
+            future = await self._decoded.get()
+            await self._dispatch(*await future)
+
+    async def _map_message(
+        self,
+        message,
+        event_fields: Optional[dict[str, list[str]]] = None,
+        partial: bool = False,
+    ) -> None:
         """
         Takes the raw JSON data, parses the events and places them into their
         respective queues.
 
         :param message: raw JSON data from the websocket
+        :param event_fields: the fields configured for the channel, by event type
+        :param partial: whether the channel was set up with a subset of the fields
         """
-        logger.debug("received message: %s", message)
-        if isinstance(message[0], str):
-            msg_type = message[0]
-        else:
-            msg_type = message[0][0]
-        data = message[1]
-        # parse type or warn for unknown type
-        if msg_type not in MAP_EVENTS:
-            raise NotImplementedError(
-                f"Unknown message type {msg_type} received: {data}"
+        start = perf_counter()
+        msg_type, results = _decode_feed_data(
+            message, self._batch_queues, event_fields, self._compact_events, partial
+        )
+        self.metrics.decode_us[msg_type].record((perf_counter() - start) * 1e6)
+        await self._dispatch(msg_type, results)
+
+    def _track_candles(
+        self, symbols: Iterable[str], times: Iterable[Optional[int]]
+    ) -> None:
+        """
+        Remembers the time of the latest candle for each candle symbol, to
+        resume from after reconnecting.
+        """
+        latest = self._candle_times
+        for symbol, candle_time in zip(symbols, times):
+            if candle_time is not None and candle_time > latest.get(symbol, 0):
+                latest[symbol] = candle_time
+
+    async def _dispatch(
+        self, msg_type: str, results: Union[EventBatch, list[Any]]
+    ) -> None:
+        """
+        Places decoded events into their respective queues.
+        """
+        if len(results):
+            self.metrics.events[msg_type] += len(results)
+            last = (
+                results["event_time"][-1]
+                if isinstance(results, EventBatch)
+                else results[-1].event_time
             )
-        cls = MAP_EVENTS[msg_type]
-        results = cls.from_stream(data)
+            self.metrics._lag(msg_type, last, time() * 1000)
+        if isinstance(results, EventBatch):
+            if msg_type == "Candle":
+                self._track_candles(
+                    results["event_symbol"].tolist(), results["time"].tolist()
+                )
+                if self._candle_store is not None:
+                    self._candle_store.add_batch(results)
+            # the batch listener may have stopped while this was being decoded
+            queue = self._batch_queues.get(msg_type)
+            if queue is not None:
+                policy = self._policies[msg_type]
+                if policy == OverflowPolicy.DROP_OLDEST and queue.full():
+                    # count the events in the batch discarded, not the new one
+                    self.dropped[msg_type] += len(queue.get_nowait())
+                    queue.task_done()
+                elif policy == OverflowPolicy.CONFLATE:
+                    policy = OverflowPolicy.BLOCK
+                if await _put(queue, results, policy):
+                    self.dropped[msg_type] += len(results)
+            return
+        if msg_type == "Candle":
+            self._track_candles(
+                (r.event_symbol for r in results), (r.time for r in results)
+            )
+            if self._candle_store is not None:
+                self._candle_store.add_all(results)
+        if self._latest is not None:
+            latest = self._latest[msg_type]
+            for r in results:
+                latest[r.event_symbol] = r
+        policy = self._policies[msg_type]
+        routes = self._routes.get(msg_type)
+        if routes:
+            unclaimed = []
+            for r in results:
+                subscribers = routes.get(r.event_symbol)
+                if subscribers is None:
+                    unclaimed.append(r)
+                    continue
+                for subscriber in subscribers:
+                    if isinstance(subscriber, Queue):
+                        if await _put(subscriber, r, policy):
+                            self.dropped[msg_type] += 1
+                        continue
+                    # a failing callback mustn't take the connection down
+                    try:
+                        subscriber(r)
+                    except Exception:
+                        logger.exception(f"Error in listener for {r.event_symbol}")
+            results = unclaimed
+        queue = self._queues[msg_type]
         for r in results:
-            await self._queues[msg_type].put(r)
+            if await _put(queue, r, policy):
+                self.dropped[msg_type] += 1
+
+
+class ShardedDXLinkStreamer:
+    """
+    A drop-in replacement for :class:`DXLinkStreamer` for very large symbol
+    universes, which spreads subscriptions across several websocket
+    connections by symbol hash while exposing a single interface: events from
+    all connections are merged into the same queues, so :meth:`listen`,
+    :meth:`get_event` etc. work exactly like they do on a single streamer.
+
+    Subscriptions are remembered and restored whenever a connection is
+    re-established; if a connection is lost for good, its symbols are moved
+    to the remaining connections. Like :class:`DXLinkStreamer`, it should
+    always be initialized as an async context manager, or by awaiting it.
+
+    Example usage::
+
+        from tastytrade.streamer import ShardedDXLinkStreamer
+        from tastytrade.dxfeed import Greeks
+
+        async with ShardedDXLinkStreamer(session, shards=4) as streamer:
+            await streamer.subscribe(Greeks, streamer_symbols)
+            async for greeks in streamer.listen(Greeks):
+                print(greeks)
+
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        shards: int = 4,
+        ssl_context: SSLContext = create_default_context(),
+        conflate: bool = False,
+        queue_size: Union[int, dict[Type[EventType], int]] = 0,
+        overflow_policy: Union[
+            OverflowPolicy, dict[Type[EventType], OverflowPolicy]
+        ] = OverflowPolicy.BLOCK,
+        subscription_delay_ms: float = 0,
+        decode_executor: Optional[Executor] = None,
+        compact_events: bool = False,
+        candle_store: Optional[CandleStore] = None,
+    ):
+        self._shards: list[DXLinkStreamer] = []
+        for _ in range(shards):
+            self._shards.append(
+                DXLinkStreamer(
+                    session,
+                    ssl_context=ssl_context,
+                    conflate=conflate,
+                    queue_size=queue_size,
+                    overflow_policy=overflow_policy,
+                    subscription_delay_ms=subscription_delay_ms,
+                    decode_executor=decode_executor,
+                    compact_events=compact_events,
+                    candle_store=candle_store,
+                    # all shards deliver their events to the first shard's queues
+                    share_with=self._shards[0] if self._shards else None,
+                )
+            )
+        #: counters and histograms for all connections together
+        self.metrics = self._shards[0].metrics
+        # shard owning each subscription, keyed by event type and symbol
+        self._owners: dict[tuple[str, str], int] = {}
+        # aggregation period and fields of each subscription, if not the defaults
+        self._settings: dict[
+            tuple[str, str], tuple[Optional[float], Optional[tuple[str, ...]]]
+        ] = {}
+        # candle subscriptions, keyed by (ticker, interval, extended hours)
+        self._candles: dict[tuple[str, str, bool], tuple[datetime, int]] = {}
+        self._closing = False
+        self._rebalance_tasks: set[asyncio.Task] = set()
+
+    async def __aenter__(self):
+        await asyncio.gather(*(shard.__aenter__() for shard in self._shards))
+        for i, shard in enumerate(self._shards):
+            shard._connect_task.add_done_callback(lambda _, i=i: self._on_shard_lost(i))
+        return self
+
+    def __await__(self):
+        return self.__aenter__().__await__()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes all of the websocket connections and cancels pending tasks.
+        """
+        self._closing = True
+        for task in self._rebalance_tasks:
+            task.cancel()
+        await asyncio.gather(
+            *self._rebalance_tasks, *(shard.close() for shard in self._shards)
+        )
+
+    async def flush(self) -> None:
+        """
+        Immediately sends any pending subscription changes on all connections.
+        """
+        await asyncio.gather(*(shard.flush() for shard in self._shards))
+
+    @property
+    def dropped(self) -> dict[str, int]:
+        """
+        The number of events of each type discarded because the queue was full.
+        """
+        return self._shards[0].dropped
+
+    @property
+    def conflated(self) -> dict[str, int]:
+        """
+        The number of events of each type replaced by a newer event for the
+        same symbol before being consumed.
+        """
+        return self._shards[0].conflated
+
+    def _live_shards(self) -> list[int]:
+        live = [
+            i for i, shard in enumerate(self._shards) if not shard._connect_task.done()
+        ]
+        if not live:
+            raise TastytradeError("All streamer connections have been closed!")
+        return live
+
+    def _shard_for(self, symbol: str, live: list[int]) -> int:
+        return live[zlib.crc32(symbol.encode()) % len(live)]
+
+    async def open_channels(self, event_classes: list[Type[EventType]]) -> None:
+        """
+        Opens the default channels for several event types at once on every
+        connection. See :meth:`DXLinkStreamer.open_channels`.
+
+        :param event_classes: the types of event to open channels for
+        """
+        await asyncio.gather(
+            *(self._shards[i].open_channels(event_classes) for i in self._live_shards())
+        )
+
+    async def subscribe(
+        self,
+        event_class: Type[EventType],
+        symbols: list[str],
+        aggregation_period: Optional[float] = None,
+        fields: Optional[list[str]] = None,
+    ) -> None:
+        """
+        Subscribes to quotes for given list of symbols, spread across the
+        connections. For candles, use :meth:`subscribe_candle` instead. See
+        :meth:`DXLinkStreamer.subscribe`.
+
+        :param event_class: type of subscription to add, should be of :any:`EventType`
+        :param symbols: list of symbols to subscribe for
+        :param aggregation_period:
+            the minimum time in seconds between updates for each symbol
+        :param fields: the names of the fields to receive
+        """
+        cls_str = MAP_EVENTS_REVERSE[event_class]
+        live = self._live_shards()
+        settings = (aggregation_period, tuple(fields) if fields is not None else None)
+        by_shard: dict[int, list[str]] = defaultdict(list)
+        for symbol in symbols:
+            key = (cls_str, symbol)
+            if key not in self._owners:
+                self._owners[key] = self._shard_for(symbol, live)
+            if settings == (None, None):
+                self._settings.pop(key, None)
+            else:
+                self._settings[key] = settings
+            by_shard[self._owners[key]].append(symbol)
+        await asyncio.gather(
+            *(
+                self._shards[i].subscribe(event_class, subs, aggregation_period, fields)
+                for i, subs in by_shard.items()
+            )
+        )
+
+    async def unsubscribe(
+        self, event_class: Type[EventType], symbols: list[str]
+    ) -> None:
+        """
+        Removes existing subscription for given list of symbols.
+        For candles, use :meth:`unsubscribe_candle` instead.
+
+        :param event_class: type of subscription to remove
+        :param symbols: list of symbols to unsubscribe from
+        """
+        cls_str = MAP_EVENTS_REVERSE[event_class]
+        by_shard: dict[int, list[str]] = defaultdict(list)
+        for symbol in symbols:
+            self._settings.pop((cls_str, symbol), None)
+            owner = self._owners.pop((cls_str, symbol), None)
+            if owner is not None:
+                by_shard[owner].append(symbol)
+        await asyncio.gather(
+            *(
+                self._shards[i].unsubscribe(event_class, subs)
+                for i, subs in by_shard.items()
+            )
+        )
+
+    async def unsubscribe_all(self, event_class: Type[EventType]) -> None:
+        """
+        Unsubscribes to all events of the given event type.
+
+        :param event_class: type of event to unsubscribe from.
+        """
+        cls_str = MAP_EVENTS_REVERSE[event_class]
+        if cls_str == "Candle":
+            self._candles.clear()
+        for key in [k for k in self._owners if k[0] == cls_str]:
+            del self._owners[key]
+            self._settings.pop(key, None)
+        await asyncio.gather(
+            *(self._shards[i].unsubscribe_all(event_class) for i in self._live_shards())
+        )
+
+    async def subscribe_candle(
+        self,
+        symbols: list[str],
+        interval: str,
+        start_time: datetime,
+        extended_trading_hours: bool = False,
+    ) -> None:
+        """
+        Subscribes to candle data for the given list of symbols, spread across
+        the connections.
+
+        :param symbols: list of symbols to get data for
+        :param interval:
+            the width of each candle in time, e.g. '15s', '5m', '1h', '3d',
+            '1w', '1mo'
+        :param start_time: starting time for the data range
+        :param extended_trading_hours: whether to include extended trading
+        """
+        live = self._live_shards()
+        by_shard: dict[int, list[str]] = defaultdict(list)
+        for ticker in symbols:
+            owner = self._shard_for(ticker, live)
+            self._candles[(ticker, interval, extended_trading_hours)] = (
+                start_time,
+                owner,
+            )
+            by_shard[owner].append(ticker)
+        await asyncio.gather(
+            *(
+                self._shards[i].subscribe_candle(
+                    subs, interval, start_time, extended_trading_hours
+                )
+                for i, subs in by_shard.items()
+            )
+        )
+
+    async def fetch_candles(
+        self,
+        symbols: list[str],
+        interval: str,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        extended_trading_hours: bool = False,
+        max_concurrent: int = 100,
+        timeout: float = 30,
+    ) -> dict[str, CandleSeries]:
+        """
+        Fetches the candle history for the given symbols, returning once the
+        full history of each has arrived. Symbols are subscribed to in
+        parallel, up to `max_concurrent` at a time, and each is unsubscribed
+        from as soon as its history is complete; the candles aren't delivered
+        to :meth:`listen`. Any existing live subscription to the same candles
+        is kept, though its events go to this method until it returns. If
+        fetching any symbol fails, the rest are cancelled and the error is
+        raised.
+
+        :param symbols: list of symbols to get data for
+        :param interval:
+            the width of each candle in time, e.g. '15s', '5m', '1h', '3d',
+            '1w', '1mo'
+        :param start_time: starting time for the data range
+        :param end_time: ending time for the data range; defaults to now
+        :param extended_trading_hours: whether to include extended trading
+        :param max_concurrent: the most symbols to fetch at once
+        :param timeout: how long to wait for each symbol's history, in seconds
+
+        :return: a :class:`~tastytrade.candles.CandleSeries` for each symbol
+        """
+        return await _fetch_candles(
+            self,
+            symbols,
+            interval,
+            start_time,
+            end_time,
+            extended_trading_hours,
+            max_concurrent,
+            timeout,
+        )
+
+    def _has_candle_subscription(
+        self, ticker: str, interval: str, extended_trading_hours: bool
+    ) -> bool:
+        return (ticker, interval, extended_trading_hours) in self._candles
+
+    async def unsubscribe_candle(
+        self,
+        ticker: str,
+        interval: Optional[str] = None,
+        extended_trading_hours: bool = False,
+    ) -> None:
+        """
+        Removes existing subscription for a candle.
+
+        :param ticker: symbol to unsubscribe from
+        :param interval: candle width to unsubscribe from
+        :param extended_trading_hours:
+            whether candle to unsubscribe from contains extended trading hours
+        """
+        key = (ticker, str(interval), extended_trading_hours)
+        _, owner = self._candles.pop(key, (None, None))
+        if owner is not None:
+            await self._shards[owner].unsubscribe_candle(
+                ticker, interval, extended_trading_hours
+            )
+
+    def _on_shard_lost(self, index: int) -> None:
+        if self._closing:
+            return
+        logger.error("Streamer shard %d closed, rebalancing subscriptions.", index)
+        task = asyncio.create_task(self._rebalance(index))
+        self._rebalance_tasks.add(task)
+        task.add_done_callback(self._rebalance_tasks.discard)
+
+    async def _rebalance(self, lost: int) -> None:
+        """
+        Moves the subscriptions of a shard whose connection ended for good to
+        the remaining shards.
+        """
+        live = self._live_shards()
+        by_type: dict[tuple, list[str]] = defaultdict(list)
+        for key, owner in self._owners.items():
+            if owner == lost:
+                cls_str, symbol = key
+                new_owner = self._shard_for(symbol, live)
+                self._owners[key] = new_owner
+                settings = self._settings.get(key, (None, None))
+                by_type[(cls_str, new_owner, settings)].append(symbol)
+        for (cls_str, i, (period, fields)), symbols in by_type.items():
+            await self._shards[i].subscribe(
+                MAP_EVENTS[cls_str],
+                symbols,
+                period,
+                list(fields) if fields is not None else None,
+            )
+        for (ticker, interval, eth), (start, owner) in list(self._candles.items()):
+            if owner == lost:
+                new_owner = self._shard_for(ticker, live)
+                self._candles[(ticker, interval, eth)] = (start, new_owner)
+                await self._shards[new_owner].subscribe_candle(
+                    [ticker], interval, start, eth
+                )
+
+    async def listen(
+        self, event_class: Type[U], symbols: Optional[list[str]] = None
+    ) -> AsyncIterator[U]:
+        """
+        Using the existing subscriptions, pulls events of the given type from
+        all connections and yield returns them. See
+        :meth:`DXLinkStreamer.listen`.
+
+        :param event_class: the type of event to listen for, should be of :any:`EventType`
+        :param symbols: the symbols to listen for; defaults to all of them
+        """
+        async for event in self._shards[0].listen(event_class, symbols):
+            yield event
+
+    async def listen_compact(
+        self, event_class: Type[EventType], symbols: Optional[list[str]] = None
+    ) -> AsyncIterator[CompactEvent]:
+        """
+        Like :meth:`listen`, for streamers created with `compact_events=True`.
+        See :meth:`DXLinkStreamer.listen_compact`.
+
+        :param event_class: the type of event to listen for, should be of :any:`EventType`
+        :param symbols: the symbols to listen for; defaults to all of them
+        """
+        async for event in self._shards[0].listen_compact(event_class, symbols):
+            yield event
+
+    def add_listener(
+        self,
+        event_class: Type[U],
+        symbols: list[str],
+        callback: Callable[[U], Any],
+    ) -> None:
+        """
+        Registers a function to be called with each event of the given type
+        for any of the given symbols. See :meth:`DXLinkStreamer.add_listener`.
+
+        :param event_class: the type of event to listen for, should be of :any:`EventType`
+        :param symbols: the symbols to call the function for
+        :param callback: the function to call with each event
+        """
+        self._shards[0].add_listener(event_class, symbols, callback)
+
+    def remove_listener(
+        self, event_class: Type[EventType], callback: Callable[[Any], Any]
+    ) -> None:
+        """
+        Stops calling a function registered with :meth:`add_listener`.
+
+        :param event_class: the type of event the function was registered for
+        :param callback: the function to stop calling
+        """
+        self._shards[0].remove_listener(event_class, callback)
+
+    async def listen_batches(
+        self,
+        event_class: Type[EventType],
+        max_rows: int = 10_000,
+        max_latency_ms: float = 100,
+    ) -> AsyncIterator[EventBatch]:
+        """
+        Using the existing subscriptions, pulls events of the given type from
+        all connections and yield returns them in columnar batches. See
+        :meth:`DXLinkStreamer.listen_batches`.
+
+        :param event_class: the type of event to listen for, should be of :any:`EventType`
+        :param max_rows: the maximum number of events in each batch
+        :param max_latency_ms:
+            the longest time to wait for more events after the first event in a
+            batch arrives before yielding it
+        """
+        batches = self._shards[0].listen_batches(event_class, max_rows, max_latency_ms)
+        async for batch in batches:
+            yield batch
+
+    def get_event_nowait(self, event_class: Type[U]) -> Optional[U]:
+        """
+        Pulls an event of the given type and returns it. If the queue is empty
+        None is returned.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        """
+        return self._shards[0].get_event_nowait(event_class)
+
+    def get_compact_event_nowait(
+        self, event_class: Type[EventType]
+    ) -> Optional[CompactEvent]:
+        """
+        Like :meth:`get_event_nowait`, for streamers created with
+        `compact_events=True`.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        """
+        return self._shards[0].get_compact_event_nowait(event_class)
+
+    async def get_event(self, event_class: Type[U]) -> U:
+        """
+        Pulls an event of the given type and returns it.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        """
+        return await self._shards[0].get_event(event_class)
+
+    async def get_compact_event(self, event_class: Type[EventType]) -> CompactEvent:
+        """
+        Like :meth:`get_event`, for streamers created with `compact_events=True`.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        """
+        return await self._shards[0].get_compact_event(event_class)
+
+    def latest(self, event_class: Type[U], symbol: str) -> Optional[U]:
+        """
+        Returns the most recent event of the given type received for the
+        symbol. See :meth:`DXLinkStreamer.latest`.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        :param symbol: the symbol to get the event for
+        """
+        return self._shards[0].latest(event_class, symbol)
+
+    def latest_compact(
+        self, event_class: Type[EventType], symbol: str
+    ) -> Optional[CompactEvent]:
+        """
+        Like :meth:`latest`, for streamers created with `compact_events=True`.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        :param symbol: the symbol to get the event for
+        """
+        return self._shards[0].latest_compact(event_class, symbol)
+
+    def get_updates(self, event_class: Type[U]) -> dict[str, U]:
+        """
+        Returns the events for each symbol updated since it was last read. See
+        :meth:`DXLinkStreamer.get_updates`.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        """
+        return self._shards[0].get_updates(event_class)
+
+    def get_compact_updates(
+        self, event_class: Type[EventType]
+    ) -> dict[str, CompactEvent]:
+        """
+        Like :meth:`get_updates`, for streamers created with
+        `compact_events=True`.
+
+        :param event_class: the type of event to get, should be of :any:`EventType`
+        """
+        return self._shards[0].get_compact_updates(event_class)
+
+
+class ReplayStreamer(DXLinkStreamer):
+    """
+    A :class:`DXLinkStreamer` which, instead of connecting to the server,
+    replays a capture made with a :class:`~tastytrade.recording.FeedRecorder`.
+    Subscribing, listening and getting events work the same way, and only
+    events for the subscribed symbols are delivered, so strategy code can be
+    tested and benchmarked offline against real market data.
+
+    Example usage::
+
+        from tastytrade.streamer import ReplayStreamer
+        from tastytrade.dxfeed import Quote
+
+        # replay at 10x the recorded speed
+        async with ReplayStreamer("open.feed", speed=10) as streamer:
+            await streamer.subscribe(Quote, ["SPY"])
+            async for quote in streamer.listen(Quote):
+                print(quote)
+
+    :param path: the recording to replay
+    :param speed:
+        how fast to replay the recording relative to how it was received, or
+        None to replay it as fast as possible
+    :param start_delay_ms:
+        how long to wait before starting the replay, leaving time to subscribe
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        speed: Optional[float] = 1,
+        start_delay_ms: float = 100,
+        conflate: bool = False,
+        queue_size: Union[int, dict[Type[EventType], int]] = 0,
+        overflow_policy: Union[
+            OverflowPolicy, dict[Type[EventType], OverflowPolicy]
+        ] = OverflowPolicy.BLOCK,
+        compact_events: bool = False,
+        candle_store: Optional[CandleStore] = None,
+    ):
+        # no connection is made, so the session is only a placeholder
+        session = SimpleNamespace(dxlink_url=str(path), streamer_token="")
+        super().__init__(
+            session,  # type: ignore
+            conflate=conflate,
+            queue_size=queue_size,
+            overflow_policy=overflow_policy,
+            subscription_delay_ms=0,
+            compact_events=compact_events,
+            candle_store=candle_store,
+        )
+        self._path = path
+        #: how fast to replay relative to the recording; None for max speed
+        self.speed = speed
+        self._start_delay_ms = start_delay_ms
+        # subscribed symbols for each event type
+        self._symbols: dict[str, set[str]] = defaultdict(set)
+
+    async def __aenter__(self):
+        self._authenticated = True
+        self._connect_task = asyncio.create_task(self._replay())
+        return self
+
+    async def close(self) -> None:
+        """
+        Stops the replay.
+        """
+        self._connect_task.cancel()
+        await asyncio.gather(self._connect_task, return_exceptions=True)
+
+    async def wait_finished(self) -> None:
+        """
+        Waits until the whole recording has been replayed.
+        """
+        await asyncio.shield(self._connect_task)
+
+    async def _channel_request(self, channel: int) -> None:
+        self._subscription_state[channel] = "CHANNEL_OPENED"
+
+    async def _queue_subscription(
+        self, channel: int, action: str, entries: list[dict[str, Any]]
+    ) -> None:
+        symbols = self._symbols[self._channel_types[channel]]
+        for entry in entries:
+            if action == "add":
+                symbols.add(entry["symbol"])
+            else:
+                symbols.discard(entry["symbol"])
+
+    async def unsubscribe_all(self, event_class: Type[EventType]) -> None:
+        """
+        Unsubscribes to all events of the given event type.
+
+        :param event_class: type of event to unsubscribe from.
+        """
+        self._symbols.pop(MAP_EVENTS_REVERSE[event_class], None)
+
+    async def _replay(self) -> None:
+        await asyncio.sleep(self._start_delay_ms / 1000)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        first: Optional[float] = None
+        for timestamp, raw_message in read_feed(self._path):
+            if first is None:
+                first = timestamp
+            if self.speed is not None:
+                delay = start + (timestamp - first) / self.speed - loop.time()
+                await asyncio.sleep(max(delay, 0))
+            else:
+                await asyncio.sleep(0)  # let consumers run
+            message = json_loads(raw_message)
+            if message["type"] == "FEED_CONFIG":
+                await self._on_feed_config(message)
+                continue
+            data = message["data"]
+            msg_type = data[0] if isinstance(data[0], str) else data[0][0]
+            symbols = self._symbols.get(msg_type)
+            if not symbols:
+                continue
+            msg_type, results = _decode_feed_data(
+                data,
+                self._batch_queues,
+                self._event_fields.get(message["channel"]),
+                self._compact_events,
+                message["channel"] not in self._default_channels,
+            )
+            if isinstance(results, EventBatch):
+                mask = np.isin(results["event_symbol"], list(symbols))
+                columns = {k: v[mask] for k, v in results.columns.items()}
+                results = EventBatch(results.event_class, columns)
+            else:
+                results = [r for r in results if r.event_symbol in symbols]
+            await self._dispatch(msg_type, results)
@@ -1,7 +1,9 @@
+import asyncio
+import json
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional, TypeVar, Union
 from zoneinfo import ZoneInfo
 
 import pandas_market_calendars as mcal  # type: ignore
@@ -11,6 +13,8 @@ from pydantic import BaseModel, ConfigDict
 NYSE = mcal.get_calendar("NYSE")
 TZ = ZoneInfo("US/Eastern")
 
+T = TypeVar("T")
+
 
 class PriceEffect(str, Enum):
     """
@@ -221,6 +225,32 @@ def get_future_index_monthly(day: Optional[date] = None) -> date:
     return valid_range[-1]
 
 
+def _json_codec() -> tuple[Callable[[Union[str, bytes]], Any], Callable[[Any], str]]:
+    """
+    Picks the fastest JSON library available: orjson, then msgspec, falling
+    back to the standard library.
+    """
+    try:
+        import orjson  # type: ignore
+
+        return orjson.loads, lambda obj: orjson.dumps(obj).decode()
+    except ImportError:
+        pass
+    try:
+        import msgspec  # type: ignore
+
+        encoder = msgspec.json.Encoder()
+        return msgspec.json.decode, lambda obj: encoder.encode(obj).decode()
+    except ImportError:
+        pass
+    return json.loads, lambda obj: json.dumps(obj, separators=(",", ":"))
+
+
+# parse JSON from str/bytes and serialize objects to str with the fastest
+# library installed; used for all REST responses and websocket messages
+json_loads, json_dumps = _json_codec()
+
+
 class TastytradeError(Exception):
     """
     An internal error raised by the Tastytrade API.
@@ -229,6 +259,27 @@ class TastytradeError(Exception):
     pass
 
 
+async def _gather_or_cancel(*aws: Awaitable[T]) -> list[T]:
+    """
+    Like :func:`asyncio.gather`, but as soon as one of the awaitables fails,
+    the others are cancelled and waited for before the error is raised, so
+    nothing keeps running in the background.
+    """
+    if not aws:
+        return []
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()  # type: ignore
+    return [task.result() for task in tasks]
+
+
 def _dasherize(s: str) -> str:
     """
     Converts a string from snake case to dasherized.
@@ -256,7 +307,7 @@ def validate_response(response: Response) -> None:
     :param response: response to check for errors
     """
     if response.status_code // 100 != 2:
-        content = response.json()["error"]
+        content = json_loads(response.content)["error"]
         error_message = f"{content['code']}: {content['message']}"
         errors = content.get("errors")
         if errors is not None:
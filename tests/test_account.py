@@ -1,11 +1,15 @@
+import asyncio
 import os
 from datetime import datetime
 from decimal import Decimal
 from time import sleep
+from types import SimpleNamespace
 
-from pytest import fixture
+import httpx
+from pytest import fixture, raises
 
 from tastytrade import Account
+from tastytrade.account import _a_get_pages, _a_iter_pages, _iter_pages
 from tastytrade.instruments import Equity
 from tastytrade.order import (
     NewComplexOrder,
@@ -14,6 +18,7 @@ from tastytrade.order import (
     OrderTimeInForce,
     OrderType,
 )
+from tastytrade.utils import TastytradeError
 
 
 @fixture(scope="module")
@@ -56,6 +61,10 @@ def test_get_history(session, account):
     account.get_history(session, page_offset=0)
 
 
+def test_iter_history(session, account):
+    next(account.iter_history(session, per_page=10), None)
+
+
 def test_get_total_fees(session, account):
     account.get_total_fees(session)
 
@@ -117,6 +126,11 @@ async def test_get_history_async(session, account):
     await account.a_get_history(session, page_offset=0)
 
 
+async def test_iter_history_async(session, account):
+    async for _ in account.a_iter_history(session, per_page=10):
+        break
+
+
 async def test_get_total_fees_async(session, account):
     await account.a_get_total_fees(session)
 
@@ -149,6 +163,139 @@ async def test_get_live_orders_async(session, account):
     await account.a_get_live_orders(session)
 
 
+async def test_get_pages_concurrently():
+    in_flight = 0
+    most_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, most_in_flight
+        offset = int(request.url.params["page-offset"])
+        in_flight += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        # later pages answer first, so they complete out of order
+        await asyncio.sleep(0.01 * (10 - offset))
+        in_flight -= 1
+        return httpx.Response(
+            200,
+            json={
+                "data": {"items": [{"page": offset}, {"page": offset}]},
+                "pagination": {"page-offset": offset, "total-pages": 10},
+            },
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://test"
+    ) as client:
+        session = SimpleNamespace(async_client=client)
+        params = {"per-page": 2, "page-offset": 0, "symbol": None}
+        items = await _a_get_pages(session, "/", params, True, 4)  # type: ignore
+        assert [i["page"] for i in items] == [p for p in range(10) for _ in "ab"]
+        assert most_in_flight == 4
+        params["page-offset"] = 3
+        items = await _a_get_pages(session, "/", params, False, 4)  # type: ignore
+        assert [i["page"] for i in items] == [3, 3]
+
+
+async def test_get_pages_single_or_none():
+    for total_pages in (0, 1):
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={
+                    "data": {"items": [{"page": 0}] * total_pages},
+                    "pagination": {"page-offset": 0, "total-pages": total_pages},
+                },
+            )
+
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="https://test"
+        ) as client:
+            session = SimpleNamespace(async_client=client)
+            params = {"per-page": 250, "page-offset": 0}
+            items = await _a_get_pages(session, "/", params, True, 4)  # type: ignore
+            assert items == [{"page": 0}] * total_pages
+
+
+async def test_get_pages_failure():
+    cancelled = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["page-offset"])
+        if offset == 1:
+            return httpx.Response(
+                500, json={"error": {"code": "failed", "message": "failed"}}
+            )
+        try:
+            await asyncio.sleep(0.1 * offset)
+        except asyncio.CancelledError:
+            cancelled.append(offset)
+            raise
+        return httpx.Response(
+            200,
+            json={
+                "data": {"items": [{"page": offset}]},
+                "pagination": {"page-offset": offset, "total-pages": 4},
+            },
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://test"
+    ) as client:
+        session = SimpleNamespace(async_client=client)
+        params = {"per-page": 1, "page-offset": 0}
+        with raises(TastytradeError):
+            await _a_get_pages(session, "/", params, True, 4)  # type: ignore
+    # the slower pages were cancelled rather than left running
+    assert sorted(cancelled) == [2, 3]
+
+
+def pages_transport(requested: list[int]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["page-offset"])
+        requested.append(offset)
+        return httpx.Response(
+            200,
+            json={
+                "data": {"items": [{"page": offset}]},
+                "pagination": {"page-offset": offset, "total-pages": 5},
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_iter_pages():
+    requested = []
+    transport = pages_transport(requested)
+    with httpx.Client(transport=transport, base_url="https://test") as client:
+        session = SimpleNamespace(sync_client=client)
+        pages = _iter_pages(session, "/", {"page-offset": 1})  # type: ignore
+        assert next(pages) == [{"page": 1}]
+        assert requested == [1]
+        assert [p[0]["page"] for p in pages] == [2, 3, 4]
+        assert requested == [1, 2, 3, 4]
+
+
+async def test_iter_pages_async():
+    requested = []
+    transport = pages_transport(requested)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://test"
+    ) as client:
+        session = SimpleNamespace(async_client=client)
+        pages = _a_iter_pages(session, "/", {"page-offset": 0})  # type: ignore
+        assert await pages.__anext__() == [{"page": 0}]
+        await asyncio.sleep(0.01)
+        # only the next page is fetched ahead
+        assert requested == [0, 1]
+        assert [p[0]["page"] async for p in pages] == [1, 2, 3, 4]
+        assert requested == [0, 1, 2, 3, 4]
+
+
 def test_get_order_chains(session, account):
     start_time = datetime(2024, 1, 1, 0, 0, 0)
     end_time = datetime.now()
@@ -0,0 +1,134 @@
+import time
+
+import httpx
+
+from tastytrade.cache import ResponseCache
+from tastytrade.session import Session
+
+
+class MockApi:
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            json={"data": {"path": request.url.path}},
+            headers={"ETag": '"v1"'},
+        )
+
+
+def mock_session(
+    api: MockApi, cache: ResponseCache, base_url: str = "https://test"
+) -> Session:
+    session = Session.__new__(Session)
+    transport = httpx.MockTransport(api)
+    session.sync_client = httpx.Client(transport=transport, base_url=base_url)
+    session.cache = cache
+    return session
+
+
+def test_cache_hits_and_revalidation():
+    api = MockApi()
+    cache = ResponseCache({"/option-chains/": 60})
+    session = mock_session(api, cache)
+    assert session._get("/option-chains/SPY") == {"path": "/option-chains/SPY"}
+    assert session._get("/option-chains/SPY") == {"path": "/option-chains/SPY"}
+    assert len(api.requests) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    # uncached endpoints always hit the API
+    session._get("/accounts")
+    session._get("/accounts")
+    assert len(api.requests) == 3
+    # once expired, the response is revalidated instead of downloaded again
+    key = cache.key("/option-chains/SPY", base_url="https://test")
+    assert key is not None
+    cache._entries[key].expires_at = time.time()
+    assert session._get("/option-chains/SPY") == {"path": "/option-chains/SPY"}
+    assert api.requests[-1].headers["If-None-Match"] == '"v1"'
+    assert cache.revalidated == 1
+
+
+def test_cache_evicted_while_revalidating():
+    api = MockApi()
+    cache = ResponseCache({"/option-chains/": 60})
+    session = mock_session(api, cache)
+    session._get("/option-chains/SPY")
+    key = cache.key("/option-chains/SPY", base_url="https://test")
+    assert key is not None
+    cache._entries[key].expires_at = time.time()
+    validators = cache.validators
+
+    def evict_after_validators(key: str) -> dict[str, str]:
+        headers = validators(key)
+        cache._entries.clear()
+        return headers
+
+    cache.validators = evict_after_validators  # type: ignore
+    assert session._get("/option-chains/SPY") == {"path": "/option-chains/SPY"}
+    assert "If-None-Match" not in api.requests[-1].headers
+    assert len(api.requests) == 3
+
+
+def test_cache_eviction():
+    api = MockApi()
+    cache = ResponseCache({"/option-chains/": 60}, max_entries=2)
+    session = mock_session(api, cache)
+    for symbol in ["SPY", "QQQ", "SPY", "IWM"]:
+        session._get(f"/option-chains/{symbol}")
+    # QQQ was the least recently used
+    assert len(cache) == 2
+    key = cache.key("/option-chains/QQQ", base_url="https://test")
+    assert cache.get(key) is None  # type: ignore
+
+
+def test_cache_persistence(tmp_path):
+    api = MockApi()
+    session = mock_session(api, ResponseCache(path=tmp_path))
+    session._get("/option-chains/SPY", params={"a": 1})
+    # a new cache reads responses saved by the previous one
+    session.cache = ResponseCache(path=tmp_path)
+    session._get("/option-chains/SPY", params={"a": 1})
+    assert len(api.requests) == 1
+    session.cache.clear()
+    assert not list(tmp_path.iterdir())
+
+
+def test_cache_per_api():
+    api = MockApi()
+    cache = ResponseCache()
+    mock_session(api, cache)._get("/option-chains/SPY")
+    # a sandbox session sharing the cache doesn't get production responses
+    mock_session(api, cache, "https://cert")._get("/option-chains/SPY")
+    assert [r.url.host for r in api.requests] == ["test", "cert"]
+    assert len(cache) == 2
+
+
+def test_cache_corrupt_file(tmp_path):
+    api = MockApi()
+    session = mock_session(api, ResponseCache(path=tmp_path))
+    session._get("/option-chains/SPY")
+    (file,) = tmp_path.iterdir()
+    file.write_bytes(b"not json\n{}")
+    # the corrupt file is a miss, and is replaced by the new response
+    session.cache = ResponseCache(path=tmp_path)
+    assert session._get("/option-chains/SPY") == {"path": "/option-chains/SPY"}
+    assert len(api.requests) == 2
+    session.cache = ResponseCache(path=tmp_path)
+    session._get("/option-chains/SPY")
+    assert len(api.requests) == 2
+
+
+async def test_cache_async():
+    api = MockApi()
+    session = mock_session(api, ResponseCache())
+    transport = httpx.MockTransport(api)
+    async with httpx.AsyncClient(transport=transport, base_url="https://test") as c:
+        session.async_client = c
+        url = "/instruments/quantity-decimal-precisions"
+        assert await session._a_get(url) == {"path": url}
+        assert await session._a_get(url) == {"path": url}
+    assert len(api.requests) == 1
@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from tastytrade.candles import CandleStore, interval_ms, parse_candle_symbol
+from tastytrade.dxfeed import Candle, compact_class
+from tastytrade.dxfeed.event import REMOVE_EVENT
+from tastytrade.utils import TastytradeError
+
+MINUTE = 60_000
+
+
+def candles(symbol: str, minutes: list[int], flags: int = 0) -> list[Candle]:
+    data = []
+    for m in minutes:
+        time = m * MINUTE
+        data += [symbol, 0, flags, time << 32, time, 0, 1, 10.0, 0, 0, 0, 0, 0]
+        data += [m + 1.0, m + 2.0, m + 0.5, m + 1.5]
+    return Candle.from_stream(data)
+
+
+def test_candle_store(tmp_path):
+    store = CandleStore()
+    # history arrives newest first, then live updates and a repeated candle
+    store.add_all(candles("SPY{=1m,tho=true}", [3, 2, 1, 0]))
+    store.add_all(candles("SPY{=1m,tho=true}", [4, 4, 5]))
+    series = store.series("SPY", "1m")
+    assert series["time"].tolist() == [m * MINUTE for m in range(6)]
+    compact = compact_class(Candle)
+    store.add_all(compact.from_event(c) for c in candles("SPY{=1m,tho=true}", [5]))
+    store.add_all(candles("SPY{=1m,tho=true}", [2], REMOVE_EVENT))
+    assert len(series) == 5
+    window = series.between(MINUTE, datetime.fromtimestamp(240, timezone.utc))
+    assert window["open"].tolist() == [2.0, 4.0]
+    resampled = series.resample("2m")
+    assert resampled["open"].tolist() == [1.0, 4.0, 5.0]
+    assert resampled["high"].tolist() == [3.0, 5.0, 7.0]
+    assert resampled["close"].tolist() == [2.5, 4.5, 6.5]
+    assert resampled["volume"].tolist() == [20.0, 10.0, 20.0]
+    path = tmp_path / "candles.npz"
+    store.save(path)
+    loaded = CandleStore.load(path)
+    assert loaded.keys() == [("SPY", "1m,tho=true")]
+    assert loaded.series("SPY", "1m")["time"].tolist() == series["time"].tolist()
+    assert CandleStore.load(tmp_path / "missing.npz").keys() == []
+
+
+def test_candle_store_trading_hours():
+    store = CandleStore()
+    store.add_all(candles("SPY{=1m,tho=true}", [1, 2]))
+    store.add_all(candles("SPY{=1m}", [0, 1, 2, 3]))
+    assert len(store.series("SPY", "1m")) == 2
+    assert len(store.series("SPY", "1m", extended_trading_hours=True)) == 4
+    assert parse_candle_symbol("SPY{=1mo,tho=true}") == ("SPY", "1mo,tho=true")
+    with pytest.raises(TastytradeError):
+        interval_ms("1mo")
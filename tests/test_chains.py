@@ -0,0 +1,98 @@
+from datetime import date, timedelta
+
+import httpx
+
+from tastytrade import chains
+from tastytrade.chains import OptionChainStore
+from tastytrade.instruments import OptionType
+from tastytrade.session import Session
+
+TODAY = date(2025, 3, 3)
+
+
+def option(expiration: date, option_type: str, strike: str) -> dict:
+    days = (expiration - TODAY).days
+    return {
+        "symbol": f"SPY   {expiration:%y%m%d}{option_type}{strike}",
+        "instrument-type": "Equity Option",
+        "active": True,
+        "strike-price": strike,
+        "root-symbol": "SPY",
+        "underlying-symbol": "SPY",
+        "expiration-date": expiration.isoformat(),
+        "exercise-style": "American",
+        "shares-per-contract": 100,
+        "option-type": option_type,
+        "option-chain-type": "Standard",
+        "expiration-type": "Regular",
+        "settlement-type": "PM",
+        "stops-trading-at": f"{expiration.isoformat()}T21:00:00.000+00:00",
+        "market-time-instrument-collection": "Equity Option",
+        "days-to-expiration": days,
+        "expires-at": f"{expiration.isoformat()}T21:00:00.000+00:00",
+        "is-closing-only": False,
+    }
+
+
+class MockApi:
+    def __init__(self):
+        self.expirations = [TODAY + timedelta(days=d) for d in (0, 7, 14)]
+        self.paths: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        if request.url.path.endswith("/nested"):
+            expirations = [{"expiration-date": e.isoformat()} for e in self.expirations]
+            items = [{"expirations": expirations}]
+        else:
+            items = [
+                option(e, t, s)
+                for e in self.expirations
+                for s in ("510.5", "500", "505")
+                for t in "PC"
+            ]
+        return httpx.Response(200, json={"data": {"items": items}})
+
+
+def mock_session(api: MockApi) -> Session:
+    session = Session.__new__(Session)
+    transport = httpx.MockTransport(api)
+    session.sync_client = httpx.Client(transport=transport, base_url="https://test")
+    session.cache = None
+    return session
+
+
+def test_option_chain_store(tmp_path, monkeypatch):
+    api = MockApi()
+    session = mock_session(api)
+    monkeypatch.setattr(chains, "today_in_new_york", lambda: TODAY)
+    store = OptionChainStore(tmp_path)
+    chain = store.get_chain(session, "SPY")
+    assert len(chain) == 18
+    assert chain.expirations() == api.expirations
+    week = api.expirations[1]
+    calls = chain.options(week, OptionType.CALL)
+    assert [o.strike_price for o in calls] == [500, 505, 510.5]
+    assert chain.streamer_symbols(week, OptionType.PUT, min_strike=505) == [
+        ".SPY250310P505",
+        ".SPY250310P510.5",
+    ]
+    assert chain.to_dict()[week][0].days_to_expiration == 7
+    # the same day, the stored chain is used without any requests
+    store.get_chain(session, "SPY")
+    assert api.paths == ["/option-chains/SPY"]
+    # the next day, the chain is reused if the expirations haven't changed
+    tomorrow = TODAY + timedelta(days=1)
+    monkeypatch.setattr(chains, "today_in_new_york", lambda: tomorrow)
+    api.expirations = api.expirations[1:]
+    chain = store.get_chain(session, "SPY")
+    assert api.paths[1:] == ["/option-chains/SPY/nested"]
+    assert chain.expirations() == api.expirations
+    assert chain.options(week)[0].days_to_expiration == 6
+    # and downloaded again once they have
+    api.expirations.append(TODAY + timedelta(days=21))
+    monkeypatch.setattr(chains, "today_in_new_york", lambda: TODAY + timedelta(2))
+    chain = store.get_chain(session, "SPY")
+    assert api.paths[2:] == ["/option-chains/SPY/nested", "/option-chains/SPY"]
+    assert chain.expirations() == api.expirations
+    assert len(list((tmp_path / "SPY").iterdir())) == 2  # one version and meta
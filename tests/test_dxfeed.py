@@ -1,8 +1,28 @@
-from typing import cast
+import pickle
+from decimal import Decimal
+from typing import Optional, cast
 
+import numpy as np
 import pytest
 
-from tastytrade.dxfeed import Quote, Summary
+from tastytrade.dxfeed import (
+    MISSING_INT,
+    Candle,
+    Event,
+    EventBatch,
+    Quote,
+    Summary,
+    compact_class,
+)
+from tastytrade.dxfeed.compact import _make_compact
+from tastytrade.dxfeed.event import (
+    REMOVE_EVENT,
+    SNAPSHOT_BEGIN,
+    SNAPSHOT_END,
+    SNAPSHOT_SNIP,
+    TX_PENDING,
+)
+from tastytrade.dxfeed.snapshot import SnapshotAssembler
 from tastytrade.utils import TastytradeError
 
 
@@ -47,3 +67,119 @@ def test_malformatted_data():
             "extra",
         ]
         _ = Quote.from_stream(quote_data)
+
+
+def test_compiled_decoder_matches_validation():
+    data = [
+        ["SPY", 0, 1, 0, 5, "Q", 0, "Q", 576.88, 576.9, 230.0, "NaN"],
+        ["SPY", 1.5, 1, 0, 5, "Q", 0, "Q", 576.88, 576.9, 230.0, 100],
+        ["SPY", "2", 1, 0, 5, "Q", 0, "Q", 576.88, 576.9, 230, 100],
+        ["SPY", 0, 1, 0, 5, "Q", 0, "Q", "NaN", 576.9, 230.0, 100],
+    ]
+    quotes = Quote.from_stream([v for row in data for v in row])
+    keys = Quote.model_fields.keys()
+    expected = [Quote.model_validate(dict(zip(keys, row))) for row in data[::2]]
+    assert quotes == expected
+    assert quotes[0].model_fields_set == expected[0].model_fields_set
+
+
+def test_compiled_decoder_custom_validator():
+    candle_data = ["SPY{=1d}", 0, 0, 1, 2, 0, 5, "NaN", 1.5, 10, 20, "NaN", 100.0]
+    candle = Candle.from_stream(candle_data + ["NaN", 2, 3, 4.25])[0]
+    assert candle.open == 0
+    assert candle.open_interest == 100
+    assert candle.volume is None
+
+
+def test_field_subset():
+    fields = ["eventSymbol", "eventTime", "eventFlags", "index", "time", "sequence"]
+    fields += ["count", "open", "high", "low", "close"]
+    candle = Candle.from_stream(["SPY", 0, 0, 1, 2, 0, 5, 1, 2, 0.5, 1.5], fields)[0]
+    assert candle.close == Decimal("1.5")
+    assert candle.vwap is None
+    with pytest.raises(TastytradeError):
+        Candle.from_stream(["SPY", 0], ["eventSymbol", "eventTime"])
+    candle = Candle.from_stream(["SPY", 0], ["eventSymbol", "eventTime"], True)[0]
+    assert candle.event_symbol == "SPY" and candle.close is None
+    # rows needing full validation aren't lost under a subset either
+    fields = ["eventSymbol", "eventTime", "bidPrice"]
+    quotes = Quote.from_stream(["SPY", 0, 1.5, "QQQ", 0, "2.5"], fields, True)
+    assert [q.bid_price for q in quotes] == [Decimal("1.5"), Decimal("2.5")]
+    assert isinstance(quotes[1], Quote) and quotes[1].ask_price is None
+    assert pickle.loads(pickle.dumps(quotes)) == quotes
+
+
+def test_event_batch():
+    quote_data = ["SPY", 0, 0, 0, 0, "Q", 0, "Q", 576.88, 576.9, 230.0, "NaN"]
+    quote_data += ["QQQ", 0, 0, 0, 0, "Q", 0, "Q", 500.1, 500.2, "NaN", 10.0]
+    batch = EventBatch.from_stream(Quote, quote_data)
+    assert len(batch) == 2
+    assert list(batch["event_symbol"]) == ["SPY", "QQQ"]
+    assert batch["ask_size"][1] == 10
+    joined = EventBatch.concat([batch, batch.slice(1)])
+    assert len(joined) == 3
+    assert joined["bid_price"][2] == 500.1
+    # large integers stay exact, and bad values don't stop the batch
+    quote_data[1] = 2**62 + 1
+    quote_data[13] = None
+    quote_data[23] = "bad"
+    batch = EventBatch.from_stream(Quote, quote_data)
+    assert batch["event_time"].tolist() == [2**62 + 1, MISSING_INT]
+    assert np.isnan(batch["ask_size"][1])
+
+
+def test_compact_events():
+    data = ["SPY", 0, 1, 0, 5, "Q", 0, "Q", 576.88, 576.9, 230.0, "NaN"]
+    bad = ["SPY", 0, 1, 0, 5, "Q", 0, "Q", "NaN", 576.9, 230.0, 100]
+    quotes = compact_class(Quote).from_stream(data + bad)
+    assert len(quotes) == 1
+    quote = quotes[0]
+    assert not hasattr(quote, "__dict__")
+    assert quote.ask_size is None
+    assert quote.to_event() == Quote.from_stream(data)[0]
+    assert pickle.loads(pickle.dumps(quote)) == quote
+    candle_data = ["SPY{=1d}", 0, 0, 1, 2, 0, 5, "NaN", 1.5, 10, 20, "NaN", 100.0]
+    candle = compact_class(Candle).from_stream(candle_data + ["NaN", 2, 3, 4.25])[0]
+    assert candle.open == 0
+    assert candle.to_event() == Candle.from_stream(candle_data + ["NaN", 2, 3, 4.25])[0]
+
+
+def test_compact_optional_bool():
+    class Halt(Event):
+        halted: Optional[bool] = None
+
+    compact = _make_compact(Halt)
+    data = ["SPY", 0, True, "QQQ", 0, "NaN", "IWM", 0, None, "DIA", 0, "bad"]
+    events = compact.from_stream(data)
+    assert [e.halted for e in events] == [True, None, None]
+    assert [e.to_event() for e in events] == Halt.from_stream(data)
+
+
+def test_snapshot_assembler():
+    def candle(index: int, flags: int = 0, close: float = 1.0) -> Candle:
+        row = ["SPY{=1d}", 0, flags, index, index, 0, 1, 0, 0, 0, 0, 0, 0]
+        return Candle.from_stream(row + [close, close, close, close])[0]
+
+    updates = []
+    assembler = SnapshotAssembler(lambda s, snap: updates.append(len(snap)))
+    # snapshots arrive newest first and are only exposed once complete
+    assert not assembler.process(candle(3, SNAPSHOT_BEGIN))
+    assert not assembler.process(candle(2))
+    assert assembler.process(candle(1, SNAPSHOT_END))
+    snapshot = assembler.snapshot("SPY{=1d}")
+    assert snapshot is not None
+    assert snapshot.indices() == [1, 2, 3]
+    # pending transactions are applied atomically
+    assert not assembler.process(candle(3, TX_PENDING, close=2.0))
+    assert not assembler.process(candle(2, TX_PENDING | REMOVE_EVENT))
+    assert snapshot[3].close == 1
+    assert assembler.process(candle(4))
+    assert [c.index for c in snapshot] == [1, 3, 4]
+    assert snapshot[3].close == 2
+    assert [c.index for c in snapshot.range(2, 4)] == [3]
+    # a new snapshot replaces the old state
+    assembler.process_all([candle(5, SNAPSHOT_BEGIN), candle(4, SNAPSHOT_SNIP)])
+    snapshot = assembler.snapshot("SPY{=1d}")
+    assert snapshot is not None
+    assert snapshot.indices() == [4, 5]
+    assert updates == [3, 3, 2]
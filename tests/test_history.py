@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import httpx
+
+from tastytrade import Account
+from tastytrade.history import TransactionStore
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def transaction(id: int, executed_at: datetime) -> dict:
+    return {
+        "id": id,
+        "account-number": "5WT00001",
+        "transaction-type": "Trade",
+        "transaction-sub-type": "Buy to Open",
+        "description": f"Trade {id}",
+        "executed-at": executed_at.isoformat(),
+        "transaction-date": executed_at.date().isoformat(),
+        "value": "100.0",
+        "value-effect": "Debit",
+        "net-value": "100.5",
+        "net-value-effect": "Debit",
+        "is-estimated-fee": True,
+    }
+
+
+class MockApi:
+    def __init__(self):
+        self.history = [transaction(i, START + timedelta(hours=i)) for i in range(5)]
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        items = self.history
+        start_at = request.url.params.get("start-at")
+        if start_at is not None:
+            start = datetime.fromisoformat(start_at)
+            items = [
+                i for i in items if datetime.fromisoformat(i["executed-at"]) >= start
+            ]
+        offset = int(request.url.params["page-offset"])
+        per_page = int(request.url.params["per-page"])
+        return httpx.Response(
+            200,
+            json={
+                "data": {"items": items[offset * per_page : (offset + 1) * per_page]},
+                "pagination": {
+                    "page-offset": offset,
+                    "total-pages": -(-len(items) // per_page),
+                },
+            },
+        )
+
+
+def test_sync():
+    api = MockApi()
+    transport = httpx.MockTransport(api)
+    session = SimpleNamespace(
+        sync_client=httpx.Client(transport=transport, base_url="https://test")
+    )
+    account = Account.model_construct(account_number="5WT00001")
+    with TransactionStore() as store:
+        assert store.watermark("5WT00001") is None
+        assert store.sync(session, account, batch_size=2) == 5  # type: ignore
+        assert store.watermark("5WT00001") == (4, START + timedelta(hours=4))
+        # only transactions from the overlap before the watermark are fetched
+        api.history.append(transaction(5, START + timedelta(hours=5)))
+        api.requests.clear()
+        overlap = timedelta(hours=1)
+        fetched = store.sync(session, account, overlap=overlap)  # type: ignore
+        assert fetched == 3
+        assert len(api.requests) == 1
+        assert store.watermark("5WT00001") == (5, START + timedelta(hours=5))
+        txns = list(store.transactions("5WT00001"))
+        assert [t.id for t in txns] == list(range(6))
+        assert txns[0].value < 0
+        late = list(store.transactions("5WT00001", start_at=txns[4].executed_at))
+        assert [t.id for t in late] == [4, 5]
+
+
+async def test_sync_async():
+    api = MockApi()
+    transport = httpx.MockTransport(api)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://test"
+    ) as client:
+        session = SimpleNamespace(async_client=client)
+        account = Account.model_construct(account_number="5WT00001")
+        with TransactionStore() as store:
+            start_at = START + timedelta(hours=3)
+            fetched = await store.a_sync(session, account, start_at)  # type: ignore
+            assert fetched == 2
+            assert [t.id for t in store.transactions("5WT00001")] == [3, 4]
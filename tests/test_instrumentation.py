@@ -0,0 +1,26 @@
+import asyncio
+
+from tastytrade.instrumentation import Histogram, StreamerMetrics
+
+
+def test_histogram():
+    histogram = Histogram()
+    for value in [1, 2, 3, 100, 0.5, -1]:
+        histogram.record(value)
+    assert histogram.count == 6
+    assert histogram.max == 100
+    assert histogram.quantile(0.5) == 2
+    assert histogram.quantile(1) == 100
+    assert histogram.summary()["mean"] == histogram.total / 6
+
+
+async def test_metrics_hook():
+    metrics = StreamerMetrics()
+    metrics.frames["FEED_DATA"] += 2
+    metrics.add_gauge("queue_depths", lambda: {"Quote": 3})
+    snapshots = []
+    metrics.add_hook(snapshots.append, interval=0.01)
+    await asyncio.sleep(0.05)
+    await metrics.close()
+    assert snapshots[0]["frames"] == {"FEED_DATA": 2}
+    assert snapshots[0]["queue_depths"] == {"Quote": 3}
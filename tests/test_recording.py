@@ -0,0 +1,39 @@
+import json
+
+from tastytrade import ReplayStreamer
+from tastytrade.dxfeed import Quote
+from tastytrade.recording import FeedRecorder, read_feed
+
+DATA = [0, 0, 0, 0, "Q", 0, "Q", 576.88, 576.9, 230.0, 300.0]
+
+
+def frame(*symbols: str) -> str:
+    data = [v for symbol in symbols for v in [symbol] + DATA]
+    return json.dumps({"type": "FEED_DATA", "channel": 7, "data": ["Quote", data]})
+
+
+def test_recorder(tmp_path):
+    path = tmp_path / "test.feed"
+    frames = [frame("SPY", "QQQ") for _ in range(100)]
+    with FeedRecorder(path, chunk_size=1000) as recorder:
+        for i, raw in enumerate(frames):
+            recorder.record(raw, timestamp=1000 + i)
+    # appending keeps what was recorded before
+    with FeedRecorder(path) as recorder:
+        recorder.record(frame("IWM"), timestamp=2000)
+        recorder.record(frame("DIA"), timestamp=0)
+    recorded = list(read_feed(path))
+    assert [raw for _, raw in recorded] == frames + [frame("IWM"), frame("DIA")]
+    assert [t for t, _ in recorded[-2:]] == [2000, 0]
+
+
+async def test_replay_streamer(tmp_path):
+    path = tmp_path / "test.feed"
+    with FeedRecorder(path) as recorder:
+        for i in range(10):
+            recorder.record(frame("SPY", "QQQ"), timestamp=1000 + i / 1000)
+    async with ReplayStreamer(path, speed=None) as streamer:
+        await streamer.subscribe(Quote, ["SPY"])
+        await streamer.wait_finished()
+        quotes = [streamer.get_event_nowait(Quote) for _ in range(11)]
+    assert [q.event_symbol for q in quotes if q] == ["SPY"] * 10
@@ -0,0 +1,138 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from tastytrade import DXLinkStreamer, ShardedDXLinkStreamer
+from tastytrade.dxfeed import Candle, Greeks, Quote, Summary, Trade
+from tastytrade.simulator import DXLinkSimulator, _Channel
+
+
+async def test_simulator():
+    async with DXLinkSimulator(events_per_second=1000, events_per_frame=10) as sim:
+        session = SimpleNamespace(dxlink_url=sim.url, streamer_token=sim.token)
+        async with DXLinkStreamer(session) as streamer:  # type: ignore
+            await streamer.subscribe(Quote, ["SPY", "QQQ"])
+            await streamer.subscribe_candle(["SPY"], "1d", datetime(2024, 1, 1))
+            quote = await streamer.get_event(Quote)
+            assert quote.event_symbol in ["SPY", "QQQ"]
+            candle = await streamer.get_event(Candle)
+            assert candle.event_symbol == "SPY{=1d,tho=true}"
+            await streamer.unsubscribe_all(Quote)
+    assert sim.events_sent > 0
+
+
+async def test_feed_settings():
+    async with DXLinkSimulator(events_per_second=1000, events_per_frame=10) as sim:
+        session = SimpleNamespace(dxlink_url=sim.url, streamer_token=sim.token)
+        async with DXLinkStreamer(session) as streamer:  # type: ignore
+            await streamer.subscribe(Greeks, ["SPY"], 1, ["delta", "volatility"])
+            await streamer.subscribe(Greeks, ["QQQ"])
+            subset = full = None
+            while subset is None or full is None:
+                greeks = await streamer.get_event(Greeks)
+                if greeks.event_symbol == "SPY":
+                    subset = greeks
+                else:
+                    full = greeks
+            assert subset.delta is not None and subset.gamma is None
+            assert full.gamma is not None
+
+
+async def test_sharded_feed_settings():
+    async with DXLinkSimulator(events_per_second=1000, events_per_frame=10) as sim:
+        session = SimpleNamespace(dxlink_url=sim.url, streamer_token=sim.token)
+        async with ShardedDXLinkStreamer(session, shards=2) as streamer:  # type: ignore
+            await streamer.subscribe(Greeks, ["SPY", "QQQ"], 1, ["delta"])
+            greeks = await streamer.get_event(Greeks)
+            assert greeks.delta is not None and greeks.gamma is None
+            assert streamer._settings[("Greeks", "SPY")] == (1, ("delta",))
+
+
+async def test_resubscribe_on_reconnect():
+    reconnected = asyncio.Event()
+
+    async def on_reconnect(streamer: DXLinkStreamer) -> None:
+        reconnected.set()
+
+    async with DXLinkSimulator(events_per_second=1000, events_per_frame=10) as sim:
+        session = SimpleNamespace(dxlink_url=sim.url, streamer_token=sim.token)
+        async with DXLinkStreamer(session, reconnect_fn=on_reconnect) as streamer:  # type: ignore
+            await streamer.subscribe(Quote, ["SPY"])
+            await streamer.subscribe_candle(["SPY"], "1d", datetime(2024, 1, 1))
+            await streamer.get_event(Quote)
+            candle = await streamer.get_event(Candle)
+            await sim.disconnect()
+            await asyncio.wait_for(reconnected.wait(), 5)
+            # candles resume from the last one received
+            entry = streamer._subscriptions[1][candle.event_symbol]
+            assert entry["fromTime"] >= candle.time
+            while not streamer._queues["Quote"].empty():
+                streamer._queues["Quote"].get_nowait()
+            quote = await asyncio.wait_for(streamer.get_event(Quote), 5)
+            assert quote.event_symbol == "SPY"
+
+
+async def test_resubscribe_in_reconnect_fn():
+    reconnected = asyncio.Event()
+
+    async def on_reconnect(streamer: DXLinkStreamer) -> None:
+        await streamer.subscribe(Quote, ["QQQ"])
+        reconnected.set()
+
+    async with DXLinkSimulator(events_per_second=1000, events_per_frame=10) as sim:
+        session = SimpleNamespace(dxlink_url=sim.url, streamer_token=sim.token)
+        async with DXLinkStreamer(
+            session,  # type: ignore
+            reconnect_fn=on_reconnect,
+            restore_subscriptions=False,
+        ) as streamer:
+            await streamer.subscribe(Quote, ["SPY"])
+            await streamer.subscribe_candle(["SPY"], "1d", datetime(2024, 1, 1))
+            await streamer.get_event(Candle)
+            await sim.disconnect()
+            await asyncio.wait_for(reconnected.wait(), 5)
+            # only what the reconnect function subscribed to is active
+            await streamer.flush()
+            assert list(streamer._subscriptions[7]) == ["QQQ"]
+            assert not streamer._subscriptions[1]
+
+
+async def test_open_channels():
+    async with DXLinkSimulator() as sim:
+        session = SimpleNamespace(dxlink_url=sim.url, streamer_token=sim.token)
+        async with DXLinkStreamer(session) as streamer:  # type: ignore
+            types = [Quote, Greeks, Trade, Summary]
+            await streamer.open_channels(types)
+            for channel in (7, 3, 15, 9):
+                assert streamer._subscription_state[channel] == "CHANNEL_OPENED"
+            # concurrent subscribes to a new channel share one request
+            await asyncio.gather(
+                streamer.subscribe(Candle, ["SPY"], 1),
+                streamer.subscribe(Candle, ["QQQ"], 1),
+            )
+            assert len(streamer._feeds) == 1
+            channel = next(iter(streamer._feeds.values()))
+            assert len(streamer._subscriptions[channel]) == 2
+
+
+async def test_metrics():
+    async with DXLinkSimulator(events_per_second=1000, events_per_frame=10) as sim:
+        session = SimpleNamespace(dxlink_url=sim.url, streamer_token=sim.token)
+        async with DXLinkStreamer(session) as streamer:  # type: ignore
+            await streamer.subscribe(Quote, ["SPY"])
+            for _ in range(20):
+                await streamer.get_event(Quote)
+            metrics = streamer.metrics.snapshot()
+    assert metrics["frames"]["FEED_DATA"] >= 2
+    assert metrics["events"]["Quote"] >= 20
+    assert metrics["bytes_received"] > 0
+    assert metrics["decode_us"]["Quote"]["count"] >= 2
+    assert metrics["lag_ms"]["Quote"]["max"] < 1000
+    assert "Quote" in metrics["queue_depths"]
+
+
+def test_simulated_event_flags():
+    channel = _Channel(1)
+    channel.add("Candle", "SPY{=1d}")
+    flags = Candle.stream_fields().index("eventFlags")
+    assert channel.rows["SPY{=1d}"][flags] == 0
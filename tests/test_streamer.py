@@ -1,8 +1,26 @@
 import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import AsyncGenerator, cast
+
+import pytest
 
 from tastytrade import Account, AlertStreamer, DXLinkStreamer
-from tastytrade.dxfeed import Candle, Quote, Trade
+from tastytrade.candles import CandleStore
+from tastytrade.dxfeed import Candle, CompactEvent, EventBatch, Quote, Trade
+from tastytrade.dxfeed.event import SNAPSHOT_BEGIN, SNAPSHOT_END
+from tastytrade.streamer import (
+    _FEED_DATA_PREFIX,
+    MAX_SUBSCRIPTION_SIZE,
+    ConflatingQueue,
+    OverflowPolicy,
+    _frame_size,
+    _put,
+)
+from tastytrade.utils import TastytradeError
 
 
 async def test_account_streamer(session):
@@ -65,3 +83,342 @@ async def test_dxlink_streamer_reconnect(session):
     trade = await streamer.get_event(Trade)
     assert trade.event_symbol == "SPX"
     await streamer.close()
+
+
+async def test_conflating_queue():
+    queue = ConflatingQueue()
+    data = ["SPY", 0, 0, 0, 0, "Q", 0, "Q", 576.88, 576.9, 230.0, 300.0]
+    for quote in Quote.from_stream(data + ["QQQ"] + data[1:] + data):
+        await queue.put(quote)
+    assert queue.qsize() == 2
+    assert queue.conflated == 1
+    assert (await queue.get()).event_symbol == "SPY"
+    assert queue.get_nowait().event_symbol == "QQQ"
+    queue.task_done()
+    queue.task_done()
+    await asyncio.wait_for(queue.join(), 1)
+
+
+async def test_overflow_policies():
+    queue = asyncio.Queue(maxsize=2)
+    dropped = [await _put(queue, i, OverflowPolicy.DROP_OLDEST) for i in range(3)]
+    assert dropped == [False, False, True]
+    assert await _put(queue, 3, OverflowPolicy.DROP_NEWEST)
+    assert [queue.get_nowait(), queue.get_nowait()] == [1, 2]
+    queue.task_done()
+    queue.task_done()
+    await asyncio.wait_for(queue.join(), 1)
+
+
+async def test_conflate_policy():
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(
+        session,  # type: ignore
+        queue_size={Quote: 1},
+        overflow_policy={Quote: OverflowPolicy.CONFLATE},
+    )
+    data = ["SPY", 0, 0, 0, 0, "Q", 0, "Q", 576.88, 576.9, 230.0, 300.0]
+    await streamer._dispatch("Quote", Quote.from_stream(data + data))
+    assert streamer._queues["Quote"].qsize() == 1
+    assert streamer.conflated["Quote"] == 1
+    assert streamer.latest(Quote, "SPY") is not None
+
+
+async def test_subscription_chunking():
+    sent = []
+
+    async def send(message):
+        sent.append(json.loads(message))
+
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(session)  # type: ignore
+    streamer._websocket = SimpleNamespace(send=send)  # type: ignore
+    symbols = [f".SPY250117C{i}" for i in range(5000)]
+    await streamer._send_subscription(7, "add", [{"symbol": s} for s in symbols])
+    assert len(sent) > 1
+    assert all(len(json.dumps(m)) < MAX_SUBSCRIPTION_SIZE for m in sent)
+    assert [e["symbol"] for m in sent for e in m["add"]] == symbols
+
+
+async def test_shared_delivery():
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    first = DXLinkStreamer(session, conflate=True)  # type: ignore
+    second = DXLinkStreamer(session, share_with=first)  # type: ignore
+    data = ["SPY", 0, 0, 0, 0, "Q", 0, "Q", 576.88, 576.9, 230.0, 300.0]
+    await second._map_message(["Quote", data])
+    assert first.latest(Quote, "SPY") is not None
+    assert (await first.get_event(Quote)).event_symbol == "SPY"
+    assert first.metrics.events["Quote"] == 1
+
+
+async def test_subscription_coalescing():
+    sent = []
+
+    async def send(message):
+        sent.append(json.loads(message))
+
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(session, subscription_delay_ms=5)  # type: ignore
+    streamer._websocket = SimpleNamespace(send=send)  # type: ignore
+    streamer._subscription_state[7] = "CHANNEL_OPENED"
+    streamer._authenticated = True
+    for symbol in ["SPY", "QQQ", "IWM"]:
+        await streamer.subscribe(Quote, [symbol])
+    await streamer.unsubscribe(Quote, ["QQQ"])
+    assert not sent
+    await asyncio.sleep(0.02)
+    # QQQ was never sent, so there's nothing to remove
+    assert len(sent) == 1
+    assert [e["symbol"] for e in sent[0]["add"]] == ["SPY", "IWM"]
+    await streamer.subscribe(Quote, ["QQQ"])
+    await streamer.unsubscribe(Quote, ["SPY", "QQQ"])
+    await streamer.flush()
+    assert sent[1]["remove"] == [{"symbol": "SPY", "type": "Quote"}]
+    assert len(sent) == 2
+
+
+async def test_unsubscribe_per_channel():
+    sent = []
+
+    async def send(message):
+        sent.append(json.loads(message))
+
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(session)  # type: ignore
+    streamer._websocket = SimpleNamespace(send=send)  # type: ignore
+    streamer._authenticated = True
+    channel = streamer._allocate_channel("Quote")
+    # SPY is subscribed on the default channel, QQQ on another one
+    for c, symbol in [(7, "SPY"), (channel, "QQQ")]:
+        streamer._subscription_state[c] = "CHANNEL_OPENED"
+        streamer._subscriptions[c][symbol] = {"symbol": symbol, "type": "Quote"}
+    await streamer.unsubscribe(Quote, ["SPY", "QQQ"])
+    removed = {m["channel"]: [e["symbol"] for e in m["remove"]] for m in sent}
+    assert removed == {7: ["SPY"], channel: ["QQQ"]}
+    # candles subscribed to again don't resume from before the unsubscribe
+    streamer._candle_times["SPY{=1d,tho=true}"] = 1
+    await streamer.unsubscribe_candle("SPY", "1d")
+    assert not streamer._candle_times
+
+
+async def test_decode_executor():
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    with ThreadPoolExecutor() as executor:
+        streamer = DXLinkStreamer(session, decode_executor=executor)  # type: ignore
+        data = ["SPY", 0, 0, 0, 0, "Q", 0, "Q", 576.88, 576.9, 230.0, 300.0]
+        for symbol in ["SPY", "QQQ"]:
+            message = {"type": "FEED_DATA", "data": ["Quote", [symbol] + data[1:]]}
+            await streamer._offload(json.dumps(message))
+        assert (await streamer.get_event(Quote)).event_symbol == "SPY"
+        assert (await streamer.get_event(Quote)).event_symbol == "QQQ"
+        # errors surface in the reader, like they do when decoding inline
+        message = {"type": "FEED_DATA", "data": ["Unknown", data]}
+        await streamer._offload(json.dumps(message))
+        await asyncio.sleep(0.1)
+        with pytest.raises(NotImplementedError):
+            await streamer._offload(json.dumps(message))
+    error = {"type": "ERROR", "message": 'bad "FEED_DATA" message'}
+    assert not _FEED_DATA_PREFIX.match(json.dumps(error))
+    assert _FEED_DATA_PREFIX.match(json.dumps(message))
+
+
+async def test_channel_allocation():
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(session)  # type: ignore
+    channel = streamer._allocate_channel("Greeks")
+    assert channel not in streamer._channels.values()
+    assert streamer._channel_types[channel] == "Greeks"
+    await streamer._on_channel_opened({"channel": channel})
+    assert streamer._subscription_state[channel] == "CHANNEL_OPENED"
+    await streamer._on_channel_closed({"channel": channel})
+    assert streamer._subscription_state[channel] == "CHANNEL_CLOSED"
+
+
+async def test_channel_setup_before_subscribing():
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(session)  # type: ignore
+    sent = []
+
+    async def send(message):
+        message = json.loads(message)
+        if message["type"] == "FEED_SETUP":
+            await asyncio.sleep(0.01)
+        sent.append(message["type"])
+
+    streamer._websocket = SimpleNamespace(send=send)  # type: ignore
+    opening = asyncio.ensure_future(streamer._ensure_channel(7))
+    while not sent:
+        await asyncio.sleep(0)
+    await streamer._on_channel_opened({"channel": 7})
+    # the channel is open, but isn't usable until FEED_SETUP has been sent
+    await streamer._ensure_channel(7)
+    assert sent == ["CHANNEL_REQUEST", "FEED_SETUP"]
+    await opening
+
+
+async def test_routed_listeners():
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(session)  # type: ignore
+    data = ["SPY", 0, 0, 0, 0, "Q", 0, "Q", 576.88, 576.9, 230.0, 300.0]
+    quotes = Quote.from_stream(data + ["QQQ"] + data[1:] + ["IWM"] + data[1:])
+    seen = []
+    streamer.add_listener(Quote, ["QQQ"], seen.append)
+    listener = cast(AsyncGenerator, streamer.listen(Quote, ["SPY"]))
+    task = asyncio.ensure_future(listener.__anext__())
+    await asyncio.sleep(0)
+    await streamer._dispatch("Quote", quotes)
+    assert (await task).event_symbol == "SPY"
+    assert [q.event_symbol for q in seen] == ["QQQ"]
+    assert streamer.get_event_nowait(Quote).event_symbol == "IWM"  # type: ignore
+    assert streamer.get_event_nowait(Quote) is None
+    await listener.aclose()
+    streamer.remove_listener(Quote, seen.append)
+    assert not streamer._routes["Quote"]
+
+
+async def test_batch_queue_size():
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(
+        session,  # type: ignore
+        queue_size=1,
+        overflow_policy=OverflowPolicy.DROP_OLDEST,
+    )
+    data = ["SPY", 0, 0, 0, 0, "Q", 0, "Q", 576.88, 576.9, 230.0, 300.0]
+    listener = cast(AsyncGenerator, streamer.listen_batches(Quote, max_latency_ms=0))
+    task = asyncio.ensure_future(listener.__anext__())
+    await asyncio.sleep(0)
+    await streamer._dispatch("Quote", EventBatch.from_stream(Quote, data))
+    await streamer._dispatch("Quote", EventBatch.from_stream(Quote, data + data))
+    assert streamer.dropped["Quote"] == 1
+    assert len(await task) == 2
+    await listener.aclose()
+    assert not streamer._batch_queues
+
+
+async def test_routed_listener_errors_and_overflow(caplog):
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(
+        session,  # type: ignore
+        queue_size=1,
+        overflow_policy=OverflowPolicy.DROP_NEWEST,
+    )
+    data = ["SPY", 0, 0, 0, 0, "Q", 0, "Q", 576.88, 576.9, 230.0, 300.0]
+    seen = []
+
+    def fail(quote):
+        raise ValueError("bad listener")
+
+    streamer.add_listener(Quote, ["QQQ"], fail)
+    streamer.add_listener(Quote, ["QQQ"], seen.append)
+    listener = cast(AsyncGenerator, streamer.listen(Quote, ["SPY"]))
+    task = asyncio.ensure_future(listener.__anext__())
+    await asyncio.sleep(0)
+    quotes = Quote.from_stream(data + data + ["QQQ"] + data[1:])
+    await streamer._dispatch("Quote", quotes)
+    assert "bad listener" in caplog.text
+    assert [q.event_symbol for q in seen] == ["QQQ"]
+    assert streamer.dropped["Quote"] == 1
+    assert (await task).event_symbol == "SPY"
+    await listener.aclose()
+
+
+async def test_compact_events():
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(session, compact_events=True)  # type: ignore
+    data = ["SPY", 0, 0, 0, 0, "Q", 0, "Q", 576.88, 576.9, 230.0, 300.0]
+    await streamer._map_message(["Quote", data])
+    with pytest.raises(TastytradeError):
+        streamer.get_event_nowait(Quote)
+    quote = await streamer.get_compact_event(Quote)
+    assert isinstance(quote, CompactEvent)
+    assert quote.bid_price == 576.88
+    assert quote.to_event() == Quote.from_stream(data)[0]
+
+
+async def test_candle_store():
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    store = CandleStore()
+    streamer = DXLinkStreamer(session, candle_store=store)  # type: ignore
+    data = ["SPY{=1d}", 0, 0, 1, 2, 0, 5, "NaN", 1.5, 10, 20, "NaN", 100.0]
+    await streamer._map_message(["Candle", data + ["NaN", 2, 3, 4.25]])
+    assert store.series("SPY", "1d", True)["close"].tolist() == [4.25]
+    assert (await streamer.get_event(Candle)).close == Decimal("4.25")
+
+
+async def test_candle_store_batches():
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    store = CandleStore()
+    streamer = DXLinkStreamer(session, candle_store=store)  # type: ignore
+    data = ["SPY{=1d}", 0, 0, 1, 2, 0, 5, "NaN", 1.5, 10, 20, "NaN", 100.0]
+    listener = cast(AsyncGenerator, streamer.listen_batches(Candle, max_latency_ms=0))
+    task = asyncio.ensure_future(listener.__anext__())
+    await asyncio.sleep(0)
+    await streamer._map_message(["Candle", data + ["NaN", 2, 3, 4.25]])
+    assert len(await task) == 1
+    await listener.aclose()
+    assert store.series("SPY", "1d", True)["close"].tolist() == [4.25]
+
+
+async def test_fetch_candles():
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(session)  # type: ignore
+    subscribed = []
+
+    async def subscribe_candle(symbols, interval, start_time, extended_hours):
+        subscribed.extend(symbols)
+        symbol = f"{symbols[0]}{{={interval},tho=true}}"
+        for i, flags in enumerate([SNAPSHOT_BEGIN, 0, SNAPSHOT_END]):
+            row = [symbol, 0, flags, 3 - i, 3 - i, 0, 1, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1]
+            await streamer._map_message(["Candle", row])
+
+    async def unsubscribe_candle(ticker, interval, extended_hours):
+        subscribed.remove(ticker)
+
+    streamer.subscribe_candle = subscribe_candle  # type: ignore
+    streamer.unsubscribe_candle = unsubscribe_candle  # type: ignore
+    start = datetime.now() - timedelta(days=1)
+    candles = await streamer.fetch_candles(["SPY", "QQQ"], "1d", start)
+    assert candles["SPY"]["time"].tolist() == [1, 2, 3]
+    assert len(candles["QQQ"]) == 3
+    assert not subscribed
+    assert streamer._queues["Candle"].empty()
+    assert await streamer.fetch_candles([], "1d", start) == {}
+
+
+async def test_fetch_candles_failure():
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(session)  # type: ignore
+    # the caller is already subscribed to QQQ, which should be left alone
+    streamer._subscriptions[streamer._channels["Candle"]]["QQQ{=1d,tho=true}"] = {}
+    subscribed = []
+    unsubscribed = []
+
+    async def subscribe_candle(symbols, interval, start_time, extended_hours):
+        subscribed.extend(symbols)
+        if symbols[0] == "IWM":
+            await asyncio.Event().wait()  # never finishes
+
+    async def unsubscribe_candle(ticker, interval, extended_hours):
+        unsubscribed.append(ticker)
+
+    streamer.subscribe_candle = subscribe_candle  # type: ignore
+    streamer.unsubscribe_candle = unsubscribe_candle  # type: ignore
+    start = datetime.now() - timedelta(days=1)
+    with pytest.raises(TastytradeError):
+        await streamer.fetch_candles(["SPY", "QQQ", "IWM"], "1d", start, timeout=0.05)
+    assert subscribed == ["SPY", "QQQ", "IWM"]
+    # IWM was cancelled while subscribing, so it's unsubscribed from too
+    assert sorted(unsubscribed) == ["IWM", "SPY"]
+
+
+async def test_track_candles_without_time():
+    session = SimpleNamespace(dxlink_url="", streamer_token="")
+    streamer = DXLinkStreamer(session)  # type: ignore
+    streamer._track_candles(["SPY{=1d}", "SPY{=1d}", "QQQ{=1d}"], [2, None, None])
+    assert streamer._candle_times == {"SPY{=1d}": 2}
+
+
+def test_frame_size():
+    assert _frame_size('{"a": "b"}') == 10
+    assert _frame_size('{"a": "é"}') == 11
+    assert _frame_size(b"\x00\x01") == 2
@@ -9,6 +9,8 @@ from tastytrade.utils import (
     get_future_treasury_monthly,
     get_tasty_monthly,
     get_third_friday,
+    json_dumps,
+    json_loads,
     today_in_new_york,
 )
 
@@ -158,3 +160,11 @@ def test_get_future_index_monthly():
     ]
     for exp in exps:
         assert get_future_index_monthly(exp) == exp
+
+
+def test_json_codec():
+    message = {"type": "FEED_DATA", "data": ["Quote", ["SPY", 0, 576.88, "NaN"]]}
+    encoded = json_dumps(message)
+    assert isinstance(encoded, str)
+    assert json_loads(encoded) == message
+    assert json_loads(encoded.encode()) == message